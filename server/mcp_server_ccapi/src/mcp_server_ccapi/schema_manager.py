@@ -10,6 +10,7 @@
 #
 # This modified file is released under the same license.
 
+import asyncio
 import json
 import os
 from datetime import datetime, timedelta
@@ -18,6 +19,7 @@ from mcp.server.fastmcp import Context
 from mcp_server_ccapi.impl.tools.credential import (
     get_volcengine_credentials,
 )
+from mcp_server_ccapi.schema_store import SchemaStore
 from mcp_server_ccapi.volcengine_client import (
     create_universal_info,
     get_volcengine_client,
@@ -26,8 +28,10 @@ from mcp_server_ccapi.volcengine_client import (
 from pathlib import Path
 
 
-# all schema metadata is stored in .schemas/schema_metadata.json. The schemas themselves are all stored in the directory.
+# Schemas are stored in .schemas/ as a pack file plus an index (see schema_store.py).
 SCHEMA_CACHE_DIR = ".schemas"
+# Layout of earlier versions: one <Type>.json file per schema plus this metadata file.
+# Such schemas are moved into the store the first time they are requested.
 SCHEMA_METADATA_FILE = "schema_metadata.json"
 SCHEMA_UPDATE_INTERVAL = timedelta(days=7)  # Check for updates weekly
 
@@ -36,13 +40,12 @@ class SchemaManager:
     """Responsible for keeping track of schemas, caching them locally, and updating them if they are outdated."""
 
     def __init__(self):
-        """Initialize the schema manager with the cache directory."""
+        """Initialize the schema manager with the cache directory. Schemas are loaded on demand."""
         cache_dir = os.path.join(os.path.dirname(__file__), SCHEMA_CACHE_DIR)
         self.cache_dir = Path(cache_dir)
-        self.metadata_file = self.cache_dir / SCHEMA_METADATA_FILE
-        self.schema_registry: dict[str, dict] = (
-            {}
-        )  # pyright: ignore[reportMissingTypeArgument]
+        self.legacy_metadata_file = self.cache_dir / SCHEMA_METADATA_FILE
+        self._legacy_metadata: dict | None = None  # pyright: ignore[reportMissingTypeArgument]
+        self._refresh_tasks: dict[str, asyncio.Task] = {}  # pyright: ignore[reportMissingTypeArgument]
 
         # Ensure cache directory exists
         try:
@@ -50,91 +53,95 @@ class SchemaManager:
         except (OSError, IOError, PermissionError) as e:
             print(f"Unable to create cache directory: {e}")
 
-        # Load metadata if it exists
-        self.metadata = (
-            self._load_metadata()
-        )  # pyright: ignore[reportUnknownMemberType]
+        # Only the index is read here
+        self.store = SchemaStore(self.cache_dir)
 
-        # Load cached schemas into registry
-        self._load_cached_schemas()
+    def _load_legacy_schema(self, resource_type: str) -> dict | None:  # pyright: ignore[reportMissingTypeArgument]
+        """Move a schema cached by an earlier version into the store."""
+        schema_file = self.cache_dir / f'{resource_type.replace("::", "_")}.json'
+        if not schema_file.exists():
+            return None
 
-    def _load_metadata(self) -> dict:  # pyright: ignore[reportMissingTypeArgument]
-        """Load schema metadata from file or create if it doesn't exist."""
-        if self.metadata_file.exists():
+        if self._legacy_metadata is None:
             try:
-                with open(self.metadata_file, "r") as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                print("Corrupted metadata file. Creating new one.")
+                with open(self.legacy_metadata_file, "r") as f:
+                    self._legacy_metadata = json.load(f).get("schemas", {})
+            except (OSError, IOError, ValueError, AttributeError):
+                self._legacy_metadata = {}
 
-        # Default metadata
-        metadata = {"version": "1", "schemas": {}}
-
-        # Save default metadata
         try:
-            with open(self.metadata_file, "w") as f:
-                json.dump(metadata, f, indent=2)
-        except (OSError, IOError, PermissionError) as e:
-            print(f"Unable to write schema file: {e}")
-
-        return metadata
-
-    def _load_cached_schemas(self):
-        """Load all cached schemas into the registry."""
-        for schema_file in self.cache_dir.glob("*.json"):
-            if schema_file.name == SCHEMA_METADATA_FILE:
-                continue
+            with open(schema_file, "r") as f:
+                schema_str = f.read()
+            if json.loads(schema_str).get("typeName") != resource_type:
+                return None
+            last_updated = datetime.fromtimestamp(schema_file.stat().st_mtime)
+            legacy_entry = self._legacy_metadata.get(resource_type) or {}
+            if legacy_entry.get("last_updated"):
+                last_updated = datetime.fromisoformat(legacy_entry["last_updated"])
+        except (OSError, IOError, ValueError, AttributeError) as e:
+            print(f"Error loading schema from {schema_file}: {str(e)}")
+            return None
+
+        schema = self.store.put(
+            resource_type, schema_str, legacy_entry.get("source", "cc_api"), last_updated
+        )
+        if self.store.entry(resource_type).get("offset") is not None:
+            try:
+                schema_file.unlink()
+            except OSError:
+                pass
+        print(f"Loaded schema for {resource_type} from cache")
+        return schema
 
+    def _is_outdated(self, resource_type: str) -> bool:
+        """True if the stored schema was last updated more than SCHEMA_UPDATE_INTERVAL ago."""
+        entry = self.store.entry(resource_type)
+        last_updated_str = entry.get("last_updated") if entry else None
+        if not last_updated_str:
+            return False
+        try:
+            last_updated = datetime.fromisoformat(last_updated_str)
+        except ValueError:
+            print(f"Invalid timestamp format for {resource_type}: {last_updated_str}")
+            return True
+        return datetime.now() - last_updated >= SCHEMA_UPDATE_INTERVAL
+
+    def _refresh_in_background(self, ctx: Context, resource_type: str, region: str | None) -> None:
+        """Download a newer schema without making the caller wait; the cached one stays in use meanwhile."""
+        if resource_type in self._refresh_tasks:
+            return
+        print(
+            f"Schema for {resource_type} is older than {SCHEMA_UPDATE_INTERVAL.days} days, refreshing in background..."
+        )
+
+        async def refresh():
             try:
-                with open(schema_file, "r") as f:
-                    schema = json.load(f)
-                    if "typeName" in schema:
-                        resource_type = schema["typeName"]
-                        self.schema_registry[resource_type] = schema
-                        print(f"Loaded schema for {resource_type} from cache")
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading schema from {schema_file}: {str(e)}")
+                await self._download_resource_schema(ctx, resource_type, region)
+            except Exception as e:
+                print(f"Background refresh of schema for {resource_type} failed, keeping cached schema: {str(e)}")
+            finally:
+                self._refresh_tasks.pop(resource_type, None)
+
+        self._refresh_tasks[resource_type] = asyncio.get_running_loop().create_task(refresh())
 
     async def get_schema(
             self, ctx :Context ,resource_type: str, region: str | None = None
     ) -> dict:  # pyright: ignore[reportMissingTypeArgument, reportUnknownParameterType]
         """Get schema for a resource type, downloading it if necessary."""
-        # Check if schema is in registry
-        if resource_type in self.schema_registry:
-            cached_schema = self.schema_registry[resource_type]
-
+        cached_schema = self.store.get(resource_type) or self._load_legacy_schema(resource_type)
+        if cached_schema is not None:
             # If cached schema is corrupted (empty properties), force reload
             if not cached_schema.get("properties"):
                 print(
                     f"Cached schema for {resource_type} is corrupted (empty properties), reloading..."
                 )
-                # Remove from registry to force reload
-                del self.schema_registry[resource_type]
             else:
-                # Check if schema needs to be updated based on last update time
-                if resource_type in self.metadata["schemas"]:
-                    schema_metadata = self.metadata["schemas"][resource_type]
-                    last_updated_str = schema_metadata.get("last_updated")
-
-                    if last_updated_str:
-                        try:
-                            last_updated = datetime.fromisoformat(last_updated_str)
-                            if datetime.now() - last_updated < SCHEMA_UPDATE_INTERVAL:
-                                # Schema is recent enough and valid, use cached version
-                                return cached_schema
-                            else:
-                                print(
-                                    f"Schema for {resource_type} is older than {SCHEMA_UPDATE_INTERVAL.days} days, refreshing..."
-                                )
-                        except ValueError:
-                            print(
-                                f"Invalid timestamp format for {resource_type}: {last_updated_str}"
-                            )
-                else:
-                    # No metadata for this schema but it's valid, use cached version
-                    return cached_schema
-
-        # Download schema (either not cached, expired, or corrupted)
+                # Outdated schemas are still served, a newer one is fetched for the next call
+                if self._is_outdated(resource_type):
+                    self._refresh_in_background(ctx, resource_type, region)
+                return cached_schema
+
+        # Download schema (either not cached or corrupted)
         schema = await self._download_resource_schema(ctx, resource_type, region)
         return schema
 
@@ -205,30 +212,7 @@ class SchemaManager:
                     )
 
                 # Save schema to cache only if it's valid
-                schema_file = (
-                    self.cache_dir / f'{resource_type.replace("::", "_")}.json'
-                )
-                try:
-                    with open(schema_file, "w") as f:
-                        f.write(schema_str)
-                except (OSError, IOError, PermissionError) as e:
-                    print(f"Unable to write schema file: {e}")
-
-                # Update registry with the valid schema
-                self.schema_registry[resource_type] = spec
-
-                # Update metadata
-                self.metadata["schemas"][resource_type] = {
-                    "last_updated": datetime.now().isoformat(),
-                    "file_path": str(schema_file),
-                    "source": "cc_api",
-                }
-
-                try:
-                    with open(self.metadata_file, "w") as f:
-                        json.dump(self.metadata, f, indent=2)
-                except (OSError, IOError, PermissionError) as e:
-                    print(f"Unable to write schema file: {e}")
+                spec = self.store.put(resource_type, schema_str, "cc_api")
 
                 print(f"Processed and cached schema for {resource_type}")
                 return spec
@@ -240,9 +224,7 @@ class SchemaManager:
                         f"Failed to download valid schema for {resource_type} after {max_retries} attempts: {str(e)}"
                     )
                 # Wait before retry
-                import time
-
-                time.sleep(1)
+                await asyncio.sleep(1)
 
         # Should never reach here
         raise ClientError(f"Failed to download schema for {resource_type}")
@@ -0,0 +1,241 @@
+# Copyright (c) 2025 ByteDance Ltd. and/or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Indexed on-disk store for resource schemas.
+
+Files in the cache directory:
+- schemas-<generation>.pack: schema documents, appended one after another
+- schema_index.json: typeName -> offset/length in the pack, version and last_updated
+
+Opening the store only reads the index. Schemas are read from the pack on demand and kept
+in an LRU. The pack is only ever appended to and the index is replaced atomically, so a
+crash leaves an index that is still valid for the pack. Superseded schemas are dropped by
+copying the live ones into a new pack generation once they make up most of the pack.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+
+
+SCHEMA_INDEX_FILE = "schema_index.json"
+SCHEMA_INDEX_VERSION = 2
+SCHEMA_LRU_SIZE = 128  # Parsed schemas kept in memory
+COMPACT_MIN_DEAD_BYTES = 1024 * 1024  # Never rewrite the pack for less than this
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data to path through a temp file in the same directory and a rename."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class SchemaStore:
+    """Schemas by typeName, stored in a pack file with a compact index and loaded lazily."""
+
+    def __init__(self, cache_dir: Path, lru_size: int = SCHEMA_LRU_SIZE):
+        """Open the store in cache_dir, reading only its index.
+
+        Args:
+            cache_dir: Existing directory holding the index and the pack files
+            lru_size: Number of parsed schemas kept in memory
+        """
+        self.cache_dir = cache_dir
+        self.index_file = cache_dir / SCHEMA_INDEX_FILE
+        self.lru_size = lru_size
+        self._lock = threading.RLock()
+        self._lru: OrderedDict[str, dict] = OrderedDict()  # pyright: ignore[reportMissingTypeArgument]
+        self.index = self._load_index()
+
+    # ========== Index ==========
+
+    @staticmethod
+    def _empty_index() -> dict:  # pyright: ignore[reportMissingTypeArgument]
+        return {"version": SCHEMA_INDEX_VERSION, "generation": 0, "pack": None, "schemas": {}}
+
+    def _load_index(self) -> dict:  # pyright: ignore[reportMissingTypeArgument]
+        try:
+            with open(self.index_file, "r") as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            return self._empty_index()
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Unable to read schema index, starting a new one: {e}")
+            return self._empty_index()
+        if not isinstance(index, dict) or index.get("version") != SCHEMA_INDEX_VERSION:
+            return self._empty_index()
+        return index
+
+    def _save_index(self) -> None:
+        # Entries that never made it into the pack only live in memory
+        index = dict(self.index)
+        index["schemas"] = {
+            type_name: entry
+            for type_name, entry in self.index["schemas"].items()
+            if entry.get("offset") is not None
+        }
+        try:
+            _write_atomic(self.index_file, json.dumps(index, separators=(",", ":")).encode("utf-8"))
+        except (OSError, IOError, PermissionError) as e:
+            print(f"Unable to write schema index: {e}")
+
+    def _pack_path(self, pack: str | None = None) -> Path | None:
+        pack = pack or self.index.get("pack")
+        return self.cache_dir / pack if pack else None
+
+    def entry(self, type_name: str) -> dict | None:  # pyright: ignore[reportMissingTypeArgument]
+        """Index entry (offset, length, version, last_updated, source) of a schema, if stored."""
+        with self._lock:
+            return self.index["schemas"].get(type_name)
+
+    # ========== Schemas ==========
+
+    def _remember(self, type_name: str, schema: dict) -> None:  # pyright: ignore[reportMissingTypeArgument]
+        self._lru[type_name] = schema
+        self._lru.move_to_end(type_name)
+        while len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+    def _read(self, pack: Path, entry: dict) -> bytes:  # pyright: ignore[reportMissingTypeArgument]
+        with open(pack, "rb") as f:
+            f.seek(entry["offset"])
+            data = f.read(entry["length"])
+        if len(data) != entry["length"]:
+            raise IOError(f"Truncated schema pack {pack.name}")
+        return data
+
+    def get(self, type_name: str) -> dict | None:  # pyright: ignore[reportMissingTypeArgument]
+        """Schema for type_name from memory or the pack, or None if not stored (or unreadable)."""
+        with self._lock:
+            if type_name in self._lru:
+                self._lru.move_to_end(type_name)
+                return self._lru[type_name]
+
+            entry = self.index["schemas"].get(type_name)
+            pack = self._pack_path()
+            if entry is None or entry.get("offset") is None or pack is None:
+                return None
+            try:
+                schema = json.loads(self._read(pack, entry))
+            except (OSError, IOError, ValueError) as e:
+                print(f"Error loading schema for {type_name} from cache: {str(e)}")
+                return None
+            if not isinstance(schema, dict) or schema.get("typeName", type_name) != type_name:
+                print(f"Cached schema for {type_name} does not match its index entry, ignoring it")
+                return None
+            self._remember(type_name, schema)
+            return schema
+
+    def put(
+        self, type_name: str, schema_str: str, source: str, last_updated: datetime | None = None
+    ) -> dict:  # pyright: ignore[reportMissingTypeArgument]
+        """Store a schema (JSON text) and return it parsed. Unchanged content only refreshes last_updated."""
+        schema = json.loads(schema_str)
+        data = schema_str.encode("utf-8")
+        version = hashlib.sha256(data).hexdigest()[:16]
+        last_updated = (last_updated or datetime.now()).isoformat()
+
+        with self._lock:
+            self._remember(type_name, schema)
+            entry = self.index["schemas"].get(type_name)
+            if entry and entry.get("offset") is not None and entry.get("version") == version:
+                entry["last_updated"] = last_updated
+                entry["source"] = source
+            else:
+                offset = None
+                try:
+                    offset = self._append(data)
+                except (OSError, IOError, PermissionError) as e:
+                    print(f"Unable to write schema file: {e}")
+                self.index["schemas"][type_name] = {
+                    "offset": offset,
+                    "length": len(data),
+                    "version": version,
+                    "last_updated": last_updated,
+                    "source": source,
+                }
+                self._maybe_compact()
+            self._save_index()
+        return schema
+
+    # ========== Pack ==========
+
+    def _append(self, data: bytes) -> int:
+        """Append a schema to the pack and return its offset."""
+        pack = self._pack_path()
+        if pack is None:
+            self.index["generation"] = self.index.get("generation", 0) + 1
+            self.index["pack"] = f"schemas-{self.index['generation']}.pack"
+            pack = self._pack_path()
+        # One unbuffered O_APPEND write: the offset holds even if the pack grew meanwhile
+        with open(pack, "ab", buffering=0) as f:
+            f.write(data + b"\n")
+            end = f.tell()
+            os.fsync(f.fileno())
+        return end - len(data) - 1
+
+    def _maybe_compact(self) -> None:
+        """Rewrite the pack without superseded schemas once they make up most of it."""
+        pack = self._pack_path()
+        if pack is None:
+            return
+        try:
+            pack_size = pack.stat().st_size
+        except OSError:
+            return
+        entries = {t: e for t, e in self.index["schemas"].items() if e.get("offset") is not None}
+        live = sum(e["length"] + 1 for e in entries.values())
+        dead = pack_size - live
+        if dead < max(COMPACT_MIN_DEAD_BYTES, live):
+            return
+
+        generation = self.index.get("generation", 0) + 1
+        new_name = f"schemas-{generation}.pack"
+        new_pack = self.cache_dir / new_name
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{new_name}.", suffix=".tmp")
+            try:
+                new_entries = {}
+                with os.fdopen(fd, "wb") as f:
+                    for type_name, entry in entries.items():
+                        data = self._read(pack, entry)
+                        new_entries[type_name] = dict(entry, offset=f.tell())
+                        f.write(data + b"\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, new_pack)
+            except BaseException:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except (OSError, IOError) as e:
+            print(f"Unable to compact schema pack: {e}")
+            return
+
+        self.index["schemas"].update(new_entries)
+        self.index["generation"] = generation
+        self.index["pack"] = new_name
+        self._save_index()
+        try:
+            pack.unlink()
+        except OSError:
+            pass
+        print(f"Compacted schema pack: {len(new_entries)} schemas, {dead} bytes reclaimed")
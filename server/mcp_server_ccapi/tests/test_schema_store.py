@@ -0,0 +1,162 @@
+"""Tests for the indexed schema store and the migration of the legacy schema files."""
+
+import json
+import os
+import pytest
+from datetime import datetime, timedelta
+from mcp_server_ccapi import schema_manager, schema_store
+from mcp_server_ccapi.schema_store import SchemaStore
+
+
+def _schema(type_name, **properties):
+    return json.dumps(
+        {'typeName': type_name, 'properties': properties or {'Name': {'type': 'string'}}}
+    )
+
+
+def test_put_and_get(tmp_path):
+    """Stored schemas are served from memory and from the pack after reopening."""
+    store = SchemaStore(tmp_path)
+    last_updated = datetime(2025, 1, 1)
+    schema = store.put(
+        'Volcengine::IAM::User', _schema('Volcengine::IAM::User'), 'cc_api', last_updated
+    )
+
+    assert store.get('Volcengine::IAM::User') == schema
+    assert store.get('Volcengine::IAM::Role') is None
+    entry = store.entry('Volcengine::IAM::User')
+    assert entry['offset'] == 0
+    assert entry['last_updated'] == last_updated.isoformat()
+    assert entry['source'] == 'cc_api'
+
+    reopened = SchemaStore(tmp_path)
+    assert reopened.get('Volcengine::IAM::User') == schema
+
+
+def test_put_unchanged_schema_only_refreshes_last_updated(tmp_path):
+    """Storing the same content again does not append it to the pack."""
+    store = SchemaStore(tmp_path)
+    store.put(
+        'Volcengine::IAM::User', _schema('Volcengine::IAM::User'), 'cc_api', datetime(2025, 1, 1)
+    )
+    pack = store._pack_path()
+    size = pack.stat().st_size
+
+    store.put(
+        'Volcengine::IAM::User', _schema('Volcengine::IAM::User'), 'cc_api', datetime(2025, 2, 1)
+    )
+
+    assert pack.stat().st_size == size
+    assert (
+        SchemaStore(tmp_path).entry('Volcengine::IAM::User')['last_updated']
+        == '2025-02-01T00:00:00'
+    )
+
+
+def test_lru_eviction(tmp_path):
+    """Only lru_size schemas stay in memory; evicted ones are read back from the pack."""
+    store = SchemaStore(tmp_path, lru_size=2)
+    for name in ('A', 'B', 'C'):
+        store.put(f'Volcengine::Test::{name}', _schema(f'Volcengine::Test::{name}'), 'cc_api')
+
+    assert list(store._lru) == ['Volcengine::Test::B', 'Volcengine::Test::C']
+
+    store.get('Volcengine::Test::B')
+    assert store.get('Volcengine::Test::A')['typeName'] == 'Volcengine::Test::A'
+    assert list(store._lru) == ['Volcengine::Test::B', 'Volcengine::Test::A']
+
+
+def test_compaction_drops_superseded_schemas(tmp_path, monkeypatch):
+    """The pack is rewritten once superseded schemas outweigh the live ones."""
+    monkeypatch.setattr(schema_store, 'COMPACT_MIN_DEAD_BYTES', 0)
+    store = SchemaStore(tmp_path)
+    store.put('Volcengine::Test::Kept', _schema('Volcengine::Test::Kept', V1={}), 'cc_api')
+    store.put('Volcengine::Test::Changed', _schema('Volcengine::Test::Changed', V1={}), 'cc_api')
+    old_pack = store._pack_path()
+
+    store.put('Volcengine::Test::Changed', _schema('Volcengine::Test::Changed', V2={}), 'cc_api')
+    assert store._pack_path() == old_pack
+
+    store.put('Volcengine::Test::Changed', _schema('Volcengine::Test::Changed', V3={}), 'cc_api')
+    new_pack = store._pack_path()
+    assert new_pack != old_pack
+    assert not old_pack.exists()
+    live = [
+        store.entry(t)['length'] + 1
+        for t in ('Volcengine::Test::Kept', 'Volcengine::Test::Changed')
+    ]
+    assert new_pack.stat().st_size == sum(live)
+
+    reopened = SchemaStore(tmp_path)
+    assert reopened.get('Volcengine::Test::Kept')['typeName'] == 'Volcengine::Test::Kept'
+    assert 'V3' in reopened.get('Volcengine::Test::Changed')['properties']
+
+
+def test_unreadable_index_starts_empty(tmp_path):
+    """A corrupt index is replaced instead of failing to open the store."""
+    (tmp_path / schema_store.SCHEMA_INDEX_FILE).write_text('{not json')
+
+    store = SchemaStore(tmp_path)
+
+    assert store.get('Volcengine::IAM::User') is None
+    store.put('Volcengine::IAM::User', _schema('Volcengine::IAM::User'), 'cc_api')
+    assert SchemaStore(tmp_path).get('Volcengine::IAM::User') is not None
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Schema manager whose cache directory is tmp_path."""
+    monkeypatch.setattr(schema_manager, 'SCHEMA_CACHE_DIR', str(tmp_path))
+    return schema_manager.SchemaManager()
+
+
+def test_legacy_schema_file_is_migrated(manager, tmp_path):
+    """A schema file of the earlier layout moves into the store with its metadata."""
+    last_updated = datetime.now() - timedelta(days=1)
+    schema_file = tmp_path / 'Volcengine_IAM_User.json'
+    schema_file.write_text(_schema('Volcengine::IAM::User'))
+    (tmp_path / schema_manager.SCHEMA_METADATA_FILE).write_text(
+        json.dumps(
+            {
+                'version': '1',
+                'schemas': {
+                    'Volcengine::IAM::User': {
+                        'last_updated': last_updated.isoformat(),
+                        'source': 'cc_api',
+                    }
+                },
+            }
+        )
+    )
+
+    schema = manager._load_legacy_schema('Volcengine::IAM::User')
+
+    assert schema['typeName'] == 'Volcengine::IAM::User'
+    assert not schema_file.exists()
+    entry = manager.store.entry('Volcengine::IAM::User')
+    assert entry['last_updated'] == last_updated.isoformat()
+    assert SchemaStore(tmp_path).get('Volcengine::IAM::User') == schema
+
+
+def test_legacy_schema_without_metadata_uses_file_time(manager, tmp_path):
+    """Without legacy metadata the file's modification time is kept as last_updated."""
+    schema_file = tmp_path / 'Volcengine_IAM_Role.json'
+    schema_file.write_text(_schema('Volcengine::IAM::Role'))
+    mtime = (datetime.now() - timedelta(days=3)).timestamp()
+    os.utime(schema_file, (mtime, mtime))
+
+    manager._load_legacy_schema('Volcengine::IAM::Role')
+
+    entry = manager.store.entry('Volcengine::IAM::Role')
+    assert entry['last_updated'] == datetime.fromtimestamp(mtime).isoformat()
+    assert manager._is_outdated('Volcengine::IAM::Role') is False
+
+
+def test_legacy_schema_for_another_type_is_ignored(manager, tmp_path):
+    """A legacy file whose typeName does not match is left alone."""
+    schema_file = tmp_path / 'Volcengine_IAM_User.json'
+    schema_file.write_text(_schema('Volcengine::IAM::Other'))
+
+    assert manager._load_legacy_schema('Volcengine::IAM::User') is None
+    assert schema_file.exists()
+    assert manager.store.entry('Volcengine::IAM::User') is None
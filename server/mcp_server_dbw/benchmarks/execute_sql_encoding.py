@@ -0,0 +1,84 @@
+"""Compare serialization time and payload size of the execute_sql output formats.
+
+Builds a synthetic ExecuteSQLResponse.to_dict() result (the shape returned by DBW: column_names plus a
+"cells" list per row) and measures, for each output format, the time to encode it and serialize it to
+JSON the way FastMCP renders a tool result (pydantic_core.to_json with indent=2), as well as the size
+of that payload. No DBW access is needed.
+
+Usage:
+    uv run python benchmarks/execute_sql_encoding.py [--rows 5000] [--columns 12] [--iterations 20]
+        [--max-rows N]
+"""
+import argparse
+import random
+import statistics
+import string
+import time
+
+import pydantic_core
+
+from mcp_server_dbw.resource.result_format import OUTPUT_FORMATS, encode_execute_sql_result
+
+
+def make_response(rows: int, columns: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    kinds = [("int", "float", "str", "time")[index % 4] for index in range(columns)]
+
+    def cell(kind: str):
+        if rng.random() < 0.05:
+            return None
+        if kind == "int":
+            return str(rng.randint(0, 10 ** 9))
+        if kind == "float":
+            return "{:.4f}".format(rng.uniform(0, 10 ** 6))
+        if kind == "time":
+            return "2025-01-{:02d} {:02d}:{:02d}:00".format(rng.randint(1, 28), rng.randint(0, 23), rng.randint(0, 59))
+        return "".join(rng.choices(string.ascii_letters, k=rng.randint(4, 24)))
+
+    return {
+        "results": [{
+            "command_str": "select * from benchmark_table",
+            "state": "Success",
+            "reason_detail": "",
+            "run_time": 1735689600000,
+            "row_count": rows,
+            "column_names": ["{}_col_{}".format(kind, index) for index, kind in enumerate(kinds)],
+            "rows": [{"cells": [cell(kind) for kind in kinds]} for _ in range(rows)],
+            "running_info": None,
+        }]
+    }
+
+
+def measure(response: dict, output_format: str, max_rows, iterations: int):
+    timings = []
+    payload = b""
+    for _ in range(iterations):
+        begin = time.perf_counter()
+        if output_format == "raw" and max_rows is None:
+            encoded = response
+        else:
+            encoded = encode_execute_sql_result(response, output_format, max_rows)
+        payload = pydantic_core.to_json(encoded, fallback=str, indent=2)
+        timings.append(time.perf_counter() - begin)
+    return statistics.median(timings), len(payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark execute_sql output formats")
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--columns", type=int, default=12)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--max-rows", type=int, default=None)
+    args = parser.parse_args()
+
+    response = make_response(args.rows, args.columns)
+    _, baseline = measure(response, "raw", None, 1)
+
+    print("{:<10}{:>14}{:>14}{:>12}".format("format", "encode(ms)", "bytes", "vs raw"))
+    for output_format in OUTPUT_FORMATS:
+        seconds, size = measure(response, output_format, args.max_rows, args.iterations)
+        print("{:<10}{:>14.2f}{:>14}{:>11.1f}%".format(output_format, seconds * 1000, size, size * 100 / baseline))
+
+
+if __name__ == "__main__":
+    main()
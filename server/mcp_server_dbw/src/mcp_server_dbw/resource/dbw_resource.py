@@ -7,7 +7,8 @@ class DBWClient:
     """初始化 volc DBW client"""
 
     def __init__(self, region: str = None, ak: str = None, sk: str = None, host: str = None,
-                 instance_id: str = None, instance_type: str = None, database: str = None):
+                 instance_id: str = None, instance_type: str = None, database: str = None,
+                 credential_digest: str = None):
         configuration = volcenginesdkcore.Configuration()
         configuration.ak = ak
         configuration.sk = sk
@@ -17,6 +18,9 @@ class DBWClient:
 
         self.client = volcenginesdkdbw.DBWApi(volcenginesdkcore.ApiClient(configuration))
         self.region = region
+        self.ak = ak
+        # 远程模式下 authorization 原文的摘要，用于按完整凭证隔离缓存
+        self.credential_digest = credential_digest
         self.instance_id = instance_id
         self.instance_type = instance_type
         self.database = database
@@ -0,0 +1,165 @@
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from mcp_server_dbw.resource.dbw_resource import DBWClient
+
+
+def _parse_expired_time(value: Any) -> Optional[float]:
+    """将 STS 的 ExpiredTime（ISO8601 字符串或秒级时间戳）转换为 time.time() 时间戳"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def decode_authorization(auth: str) -> dict:
+    """解码 header 中 base64 编码后的 sts json"""
+    if ' ' in auth:
+        _, base64_data = auth.split(' ', 1)
+    else:
+        base64_data = auth
+
+    auth_info = {}
+    try:
+        decoded_str = base64.b64decode(base64_data).decode('utf-8')
+        data: dict = json.loads(decoded_str)
+
+        if not data.get('AccessKeyId'):
+            raise ValueError("failed to get remote ak")
+        if not data.get('SecretAccessKey'):
+            raise ValueError("failed to get remote sk")
+
+        auth_info["current_time"] = data.get('CurrentTime')
+        auth_info["expired_time"] = data.get('ExpiredTime')
+        auth_info["region"] = data.get("Region")
+        auth_info["ak"] = data.get('AccessKeyId')
+        auth_info["sk"] = data.get('SecretAccessKey')
+        auth_info["token"] = data.get('SessionToken')
+    except Exception as e:
+        raise ValueError("Decode authorization info error, {}".format(e))
+    return auth_info
+
+
+class DBWClientCache:
+    """按凭证缓存 DBWClient 的 LRU
+
+    以 authorization 原文的摘要为 key，同一凭证的后续请求无需重新解码和构造 client；
+    条目在 STS ExpiredTime 前 refresh_margin_seconds 失效，未携带 ExpiredTime 的凭证使用 default_ttl_seconds。
+    """
+
+    def __init__(self, max_size: int, default_ttl_seconds: float, refresh_margin_seconds: float = 60):
+        self.max_size = max_size
+        self.default_ttl_seconds = default_ttl_seconds
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self._entries: "OrderedDict[str, Tuple[float, DBWClient]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, auth: str, default_region: Optional[str] = None) -> DBWClient:
+        key = hashlib.sha256(auth.encode("utf-8")).hexdigest()
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                deadline, client = entry
+                if deadline > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return client
+                self._entries.pop(key, None)
+            self.misses += 1
+
+        auth_info = decode_authorization(auth)
+        client = DBWClient(
+            region=default_region or auth_info["region"] or "cn-beijing",
+            ak=auth_info["ak"],
+            sk=auth_info["sk"],
+            credential_digest=key,
+        )
+        if not self.enabled:
+            return client
+
+        expired_at = _parse_expired_time(auth_info["expired_time"])
+        if expired_at is None:
+            deadline = now + self.default_ttl_seconds
+        else:
+            deadline = min(now + self.default_ttl_seconds, expired_at - self.refresh_margin_seconds)
+        if deadline <= now:
+            # 凭证即将过期，不再缓存
+            return client
+
+        with self._lock:
+            self._entries[key] = (deadline, client)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return client
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class DBWDispatcher:
+    """在有界线程池中执行阻塞的 DBW OpenAPI 调用
+
+    每个工具额外受一个信号量约束，慢 SQL 或慢日志查询最多占用 tool_limit 个线程，
+    不会阻塞事件循环，也不会占满线程池影响其他租户的请求。
+    """
+
+    def __init__(self, max_workers: int, tool_limit: int):
+        self.max_workers = max_workers
+        self.tool_limit = max(1, tool_limit)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dbw_sdk")
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def run(self, tool_name: str, fn: Callable[..., Any], *args) -> Any:
+        semaphore = self._semaphores.get(tool_name)
+        if semaphore is None:
+            semaphore = self._semaphores.setdefault(tool_name, asyncio.Semaphore(self.tool_limit))
+        async with semaphore:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def create_client_cache() -> DBWClientCache:
+    return DBWClientCache(
+        max_size=int(os.getenv("DBW_CLIENT_CACHE_SIZE", "128")),
+        default_ttl_seconds=float(os.getenv("DBW_CLIENT_CACHE_TTL", "3600")),
+    )
+
+
+def create_dispatcher() -> DBWDispatcher:
+    return DBWDispatcher(
+        max_workers=int(os.getenv("DBW_SDK_MAX_WORKERS", "16")),
+        tool_limit=int(os.getenv("DBW_SDK_TOOL_CONCURRENCY", "8")),
+    )
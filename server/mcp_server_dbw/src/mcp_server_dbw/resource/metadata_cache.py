@@ -0,0 +1,128 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# (凭证 AK, 凭证摘要, 实例类型, 实例ID, Database)
+Scope = Tuple[Optional[str], Optional[str], str, str, str]
+
+# 工单执行结束（成功、失败或不再执行）的状态
+FINISHED_TICKET_STATUSES = frozenset({
+    "TicketFinished", "TicketError", "TicketCancel", "TicketReject", "TicketPreCheckError",
+})
+
+
+class TableMetadataCache:
+    """按 (实例, Database) 缓存 get_table_info 的返回结果
+
+    条目在 ttl_seconds 后过期，总数超过 max_tables 时按 LRU 淘汰。
+    创建 DDL 工单时立即失效对应 Database 的缓存，并记录工单号与 Database 的对应关系。
+    Auto/Cron 工单在之后才执行，因此在工单结束前该 Database 不读写缓存；查询工单详情或列表
+    观察到工单已结束时再次失效并恢复缓存，未观察到的工单在 pending_ticket_seconds 后不再生效。
+    手动执行工单时同样失效对应 Database；无法确定工单所属 Database 时清空全部缓存。
+    """
+
+    def __init__(self, ttl_seconds: float, max_tables: int, pending_ticket_seconds: float = 24 * 3600):
+        self.ttl_seconds = ttl_seconds
+        self.max_tables = max_tables
+        self.pending_ticket_seconds = pending_ticket_seconds
+        self._entries: "OrderedDict[Tuple[Scope, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # 工单号 -> (实例ID, Database, 失效时间)
+        self._tickets: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_tables > 0
+
+    def _has_pending_ticket(self, instance_id: str, database: str) -> bool:
+        now = time.monotonic()
+        for ticket_id in [ticket_id for ticket_id, (_, _, deadline) in self._tickets.items() if deadline <= now]:
+            self._tickets.pop(ticket_id, None)
+        return any(target[:2] == (instance_id, database) for target in self._tickets.values())
+
+    def get(self, scope: Scope, table: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if self._has_pending_ticket(scope[-2], scope[-1]):
+                self.bypasses += 1
+                return None
+            entry = self._entries.get((scope, table))
+            if entry is not None:
+                deadline, table_info = entry
+                if deadline > time.monotonic():
+                    self._entries.move_to_end((scope, table))
+                    self.hits += 1
+                    return table_info
+                self._entries.pop((scope, table), None)
+            self.misses += 1
+            return None
+
+    def put(self, scope: Scope, table: str, table_info: Dict[str, Any]):
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._has_pending_ticket(scope[-2], scope[-1]):
+                return
+            self._entries[(scope, table)] = (time.monotonic() + self.ttl_seconds, table_info)
+            self._entries.move_to_end((scope, table))
+            while len(self._entries) > self.max_tables:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, instance_id: str, database: Optional[str] = None):
+        with self._lock:
+            for key in [key for key in self._entries
+                        if key[0][-2] == instance_id and (database is None or key[0][-1] == database)]:
+                self._entries.pop(key, None)
+            self.invalidations += 1
+
+    def remember_ticket(self, ticket_id: Optional[str], instance_id: str, database: str):
+        if not ticket_id:
+            return
+        with self._lock:
+            self._tickets[str(ticket_id)] = (instance_id, database, time.monotonic() + self.pending_ticket_seconds)
+            while len(self._tickets) > self.max_tables:
+                self._tickets.popitem(last=False)
+
+    def invalidate_ticket(self, ticket_id: str):
+        with self._lock:
+            target = self._tickets.get(str(ticket_id))
+        if target is not None:
+            self.invalidate(*target[:2])
+            return
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def observe_ticket(self, ticket_id: Optional[str], ticket_status: Optional[str]):
+        """工单状态显示已结束时，失效对应 Database 的缓存并恢复缓存"""
+        if not ticket_id or ticket_status not in FINISHED_TICKET_STATUSES:
+            return
+        with self._lock:
+            target = self._tickets.pop(str(ticket_id), None)
+        if target is not None:
+            self.invalidate(*target[:2])
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "tables": len(self._entries),
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypasses": self.bypasses,
+                "pending_tickets": len(self._tickets),
+                "invalidations": self.invalidations,
+            }
+
+
+def create_metadata_cache() -> TableMetadataCache:
+    return TableMetadataCache(
+        ttl_seconds=float(os.getenv("DBW_TABLE_META_CACHE_TTL", "300")),
+        max_tables=int(os.getenv("DBW_TABLE_META_CACHE_SIZE", "2048")),
+        pending_ticket_seconds=float(os.getenv("DBW_TABLE_META_PENDING_TICKET_TTL", str(24 * 3600))),
+    )
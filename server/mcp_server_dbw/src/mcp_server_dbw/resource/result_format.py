@@ -0,0 +1,139 @@
+import csv
+import io
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+OUTPUT_FORMATS = ("raw", "columnar", "csv", "ndjson")
+
+# 严格的十进制小数：整数部分不允许前导零，不接受 "_"、inf/nan 等 float() 额外认可的写法
+_DECIMAL_RE = re.compile(
+    r"[+-]?(?:(?P<integer>0|[1-9][0-9]*)(?:\.(?P<fraction>[0-9]+))?|\.(?P<bare_fraction>[0-9]+))(?:[eE][+-]?[0-9]+)?"
+)
+# JSON 数字按 IEEE 754 双精度解析，超出范围的值按字符串保留以免丢失精度
+MAX_SAFE_INTEGER = 2 ** 53
+MAX_FLOAT_DIGITS = 15
+
+
+def _parse_int(value: str) -> Optional[int]:
+    text = value.strip()
+    digits = text[1:] if text[:1] in "+-" else text
+    # 前导零的值（如编号、邮编）按字符串保留
+    if not digits.isdigit() or (len(digits) > 1 and digits[0] == "0"):
+        return None
+    number = int(text)
+    if abs(number) > MAX_SAFE_INTEGER:
+        return None
+    return number
+
+
+def _parse_float(value: str) -> Optional[float]:
+    text = value.strip()
+    # 与 _parse_int 一致，前导零的值按字符串保留
+    match = _DECIMAL_RE.fullmatch(text)
+    if not match:
+        return None
+    fraction = match.group("fraction") or match.group("bare_fraction") or ""
+    # 只接受能精确往返的值：有效数字不超过 15 位，且小数部分没有会被丢弃的末尾零（保留 DECIMAL 的 scale）
+    if len(((match.group("integer") or "") + fraction.rstrip("0")).lstrip("0")) > MAX_FLOAT_DIGITS:
+        return None
+    if len(fraction) > 1 and fraction.endswith("0"):
+        return None
+    number = float(text)
+    if number in (float("inf"), float("-inf")):
+        return None
+    return number
+
+
+def _typed_column(values: List[Optional[str]]):
+    """推断一列的类型（int、float 或 str），返回 (类型, 转换后的值列表)，NULL 保留为 None"""
+    for type_name, parse in (("int", _parse_int), ("float", _parse_float)):
+        parsed = []
+        for value in values:
+            if value is None:
+                parsed.append(None)
+                continue
+            number = parse(value)
+            if number is None:
+                break
+            parsed.append(number)
+        else:
+            if any(value is not None for value in values):
+                return type_name, parsed
+    return "str", values
+
+
+def _result_rows(result: Dict[str, Any]) -> List[List[Optional[str]]]:
+    return [row.get("cells") or [] for row in result.get("rows") or []]
+
+
+def _result_meta(result: Dict[str, Any], rows: List[list], max_rows: Optional[int]) -> Dict[str, Any]:
+    meta = {
+        key: result[key]
+        for key in ("command_str", "state", "reason_detail", "run_time", "row_count", "running_info")
+        if result.get(key) not in (None, "")
+    }
+    meta["returned_rows"] = len(rows) if max_rows is None else min(len(rows), max_rows)
+    meta["truncated"] = max_rows is not None and len(rows) > max_rows
+    return meta
+
+
+def _encode_columnar(columns: List[str], rows: List[list]) -> Dict[str, Any]:
+    data, types = [], []
+    for index in range(len(columns)):
+        type_name, values = _typed_column([row[index] if index < len(row) else None for row in rows])
+        types.append(type_name)
+        data.append(values)
+    return {"columns": columns, "types": types, "data": data}
+
+
+def _encode_csv(columns: List[str], rows: List[list]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def _encode_ndjson(columns: List[str], rows: List[list]) -> str:
+    # 首行为字段列表，之后每行一个与字段一一对应的值数组
+    return "".join(
+        json.dumps(line, ensure_ascii=False, separators=(",", ":")) + "\n" for line in [columns, *rows]
+    )
+
+
+def encode_execute_sql_result(response: Dict[str, Any], output_format: str = "raw",
+                              max_rows: Optional[int] = None) -> Dict[str, Any]:
+    """将 ExecuteSQLResponse.to_dict() 的结果转换为更紧凑的输出格式
+
+    raw 保持原始结构（仅按 max_rows 截断 rows）；columnar 只返回一次字段名，按列返回带类型的值；
+    csv 与 ndjson 将结果集编码为文本（ndjson 首行为字段列表）。截断的结果集带有 truncated 标记。
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError("output_format must be one of {}".format(", ".join(OUTPUT_FORMATS)))
+    if max_rows is not None and max_rows < 0:
+        raise ValueError("max_rows must be greater than or equal to 0")
+
+    results = []
+    for result in response.get("results") or []:
+        rows = _result_rows(result)
+        if output_format == "raw":
+            encoded = dict(result)
+            if max_rows is not None and len(rows) > max_rows:
+                encoded["rows"] = encoded["rows"][:max_rows]
+                encoded["truncated"] = True
+            results.append(encoded)
+            continue
+
+        encoded = _result_meta(result, rows, max_rows)
+        columns = result.get("column_names") or []
+        if max_rows is not None:
+            rows = rows[:max_rows]
+        if output_format == "columnar":
+            encoded.update(_encode_columnar(columns, rows))
+        elif output_format == "csv":
+            encoded["data"] = _encode_csv(columns, rows)
+        else:
+            encoded["data"] = _encode_ndjson(columns, rows)
+        results.append(encoded)
+    return {"results": results}
@@ -1,13 +1,15 @@
 import os
+import asyncio
 import logging
 import argparse
-import json
-import base64
 
 from pydantic import Field
 from typing import List, Dict, Any, Optional
 from mcp.server.fastmcp import FastMCP
 from mcp_server_dbw.resource.dbw_resource import DBWClient
+from mcp_server_dbw.resource.dispatch import create_client_cache, create_dispatcher
+from mcp_server_dbw.resource.metadata_cache import create_metadata_cache
+from mcp_server_dbw.resource.result_format import OUTPUT_FORMATS, encode_execute_sql_result
 from mcp.server.session import ServerSession
 from mcp.server.fastmcp import Context
 from starlette.requests import Request
@@ -31,13 +33,17 @@ DBW_CLIENT = DBWClient(
     instance_type=os.getenv("VOLCENGINE_INSTANCE_TYPE"),
     database=os.getenv("VOLCENGINE_DATABASE"),
 )
+# 远程模式下按凭证复用 DBWClient，所有 OpenAPI 调用在有界线程池中执行，避免阻塞事件循环
+DBW_CLIENT_CACHE = create_client_cache()
+DBW_DISPATCHER = create_dispatcher()
+TABLE_METADATA_CACHE = create_metadata_cache()
 
 
 @mcp_server.tool(
     name="nl2sql",
     description="根据自然语言问题生成SQL语句",
 )
-def nl2sql(
+async def nl2sql(
         query: str = Field(default="", description="待生成SQL语句的自然语言问题"),
         instance_id: Optional[str] = Field(default=None, description="火山引擎数据库实例ID（需开启安全管控）"),
         instance_type: Optional[str] = Field(default=None, description="火山引擎数据库实例类型（可通过instance_id前缀获取，当前支持MySQL和VeDBMySQL，并严格要求大小写一致）"),
@@ -82,7 +88,7 @@ def nl2sql(
     if tables is not None:
         req["tables"] = tables
 
-    resp = dbw_client.nl2sql(req)
+    resp = await DBW_DISPATCHER.run("nl2sql", dbw_client.nl2sql, req)
     return resp.to_dict()
 
 
@@ -90,11 +96,13 @@ def nl2sql(
     name="execute_sql",
     description="执行SQL语句并返回执行结果",
 )
-def execute_sql(
+async def execute_sql(
         commands: str = Field(default="", description="待执行的SQL语句集合"),
         instance_id: Optional[str] = Field(default=None, description="火山引擎数据库实例ID（需开启安全管控）"),
         instance_type: Optional[str] = Field(default=None, description="火山引擎数据库实例类型（可通过instance_id前缀获取，当前支持MySQL和VeDBMySQL，并严格要求大小写一致）"),
         database: Optional[str] = Field(default=None, description="Database名称"),
+        output_format: Optional[str] = Field(default="raw", description="结果集输出格式（raw表示原始结构；columnar表示只返回一次字段名并按列返回带类型的值；csv和ndjson表示将结果集编码为文本，结果集较大时推荐使用columnar或csv）"),
+        max_rows: Optional[int] = Field(default=None, description="每条SQL语句最多返回的记录行数，超出部分被截断并标记truncated（默认不限制）"),
 ) -> dict[str, Any]:
     """
     执行SQL语句并返回执行结果
@@ -104,8 +112,10 @@ def execute_sql(
         instance_id (str, optional): 火山引擎数据库实例ID（需开启安全管控）
         instance_type (str, optional): 火山引擎数据库实例类型（可通过instance_id前缀获取，当前支持MySQL和VeDBMySQL，并严格要求大小写一致）
         database (str, optional): Database名称
+        output_format (str, optional): 结果集输出格式（raw表示原始结构；columnar表示只返回一次字段名并按列返回带类型的值；csv和ndjson表示将结果集编码为文本，结果集较大时推荐使用columnar或csv）
+        max_rows (int, optional): 每条SQL语句最多返回的记录行数，超出部分被截断并标记truncated（默认不限制）
     Returns:
-        results (list): SQL语句集合执行结果列表，列表中的每个值对应一条SQL语句的执行结果，结构如下
+        results (list): SQL语句集合执行结果列表，列表中的每个值对应一条SQL语句的执行结果，output_format为raw时结构如下
             - command_str (str): SQL语句
             - state (str): SQL语句的执行状态
             - reason_detail (str): SQL语句执行失败时返回的信息
@@ -114,6 +124,14 @@ def execute_sql(
             - column_names (list[str]): 执行SQL查询语句返回的结果集字段列表
             - rows (list[dict[str, list[str]]]): 执行SQL语句返回或影响的记录行列表，列表中的每个值的结构如下
                 cells (dict[str, list[str]]): 执行SQL语句返回或影响的记录行的单元格值列表
+            - truncated (bool): 记录行是否因max_rows被截断（仅在截断时返回）
+            output_format为columnar、csv或ndjson时，每条SQL语句的执行结果结构如下
+            - command_str、state、reason_detail、run_time、row_count: 同上，值为空时省略
+            - returned_rows (int): 实际返回的记录行数
+            - truncated (bool): 记录行是否因max_rows被截断
+            - columns (list[str]): 字段列表（仅columnar）
+            - types (list[str]): 字段值类型列表，取值为int、float或str（仅columnar）
+            - data (list[list] | str): columnar时为按列排列的字段值列表；csv时为带表头的CSV文本；ndjson时首行为字段列表，之后每行为一条记录的值数组
     """
     if REMOTE_MCP_SERVER:
         dbw_client = get_dbw_client(mcp_server.get_context())
@@ -131,6 +149,12 @@ def execute_sql(
         raise ValueError("database is required")
     if not commands:
         raise ValueError("commands is required")
+    if not output_format:
+        output_format = "raw"
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError("output_format must be one of {}".format(", ".join(OUTPUT_FORMATS)))
+    if max_rows is not None and max_rows < 0:
+        raise ValueError("max_rows must be greater than or equal to 0")
 
     req = {
         "instance_id": instance_id,
@@ -140,15 +164,17 @@ def execute_sql(
         "time_out_seconds": 10
     }
 
-    resp = dbw_client.execute_sql(req)
-    return resp.to_dict()
+    resp = await DBW_DISPATCHER.run("execute_sql", dbw_client.execute_sql, req)
+    if output_format == "raw" and max_rows is None:
+        return resp.to_dict()
+    return encode_execute_sql_result(resp.to_dict(), output_format, max_rows)
 
 
 @mcp_server.tool(
     name="list_databases",
     description="查询数据库实例的Database列表",
 )
-def list_databases(
+async def list_databases(
         instance_id: Optional[str] = Field(default=None, description="火山引擎数据库实例ID（需开启安全管控）"),
         instance_type: Optional[str] = Field(default=None, description="火山引擎数据库实例类型（可通过instance_id前缀获取，当前支持MySQL和VeDBMySQL，并严格要求大小写一致）"),
         page_number: Optional[int] = Field(default=1, description="分页查询时的页码（默认为1，即从第一页数据开始返回）"),
@@ -194,7 +220,7 @@ def list_databases(
         "page_size": page_size,
     }
 
-    resp = dbw_client.list_databases(req)
+    resp = await DBW_DISPATCHER.run("list_databases", dbw_client.list_databases, req)
     return resp.to_dict()
 
 
@@ -202,7 +228,7 @@ def list_databases(
     name="list_tables",
     description="查询数据库实例的Table列表",
 )
-def list_tables(
+async def list_tables(
         instance_id: Optional[str] = Field(default=None, description="火山引擎数据库实例ID（需开启安全管控）"),
         instance_type: Optional[str] = Field(default=None, description="火山引擎数据库实例类型（可通过instance_id前缀获取，当前支持MySQL和VeDBMySQL，并严格要求大小写一致）"),
         database: Optional[str] = Field(default=None, description="Database名称"),
@@ -249,7 +275,7 @@ def list_tables(
         "page_size": page_size,
     }
 
-    resp = dbw_client.list_tables(req)
+    resp = await DBW_DISPATCHER.run("list_tables", dbw_client.list_tables, req)
     return resp.to_dict()
 
 
@@ -257,7 +283,7 @@ def list_tables(
     name="get_table_info",
     description="查询数据库实例的Table元信息",
 )
-def get_table_info(
+async def get_table_info(
         table: str = Field(default="", description="Table名称"),
         instance_id: Optional[str] = Field(default=None, description="火山引擎数据库实例ID（需开启安全管控）"),
         instance_type: Optional[str] = Field(default=None, description="火山引擎数据库实例类型（可通过instance_id前缀获取，当前支持MySQL和VeDBMySQL，并严格要求大小写一致）"),
@@ -306,6 +332,71 @@ def get_table_info(
     if not table:
         raise ValueError("table is required")
 
+    return await _get_table_info(dbw_client, instance_id, instance_type, database, table)
+
+
+@mcp_server.tool(
+    name="get_tables_info",
+    description="批量查询数据库实例的多个Table元信息",
+)
+async def get_tables_info(
+        tables: List[str] = Field(default=None, description="Table名称列表"),
+        instance_id: Optional[str] = Field(default=None, description="火山引擎数据库实例ID（需开启安全管控）"),
+        instance_type: Optional[str] = Field(default=None, description="火山引擎数据库实例类型（可通过instance_id前缀获取，当前支持MySQL和VeDBMySQL，并严格要求大小写一致）"),
+        database: Optional[str] = Field(default=None, description="Database名称")
+) -> dict[str, Any]:
+    """
+    批量查询数据库实例的多个Table元信息，各Table并发查询，已缓存的Table直接返回
+
+    Args:
+        tables (List[str]): Table名称列表
+        instance_id (str, optional): 火山引擎数据库实例ID（需开启安全管控）
+        instance_type (str, optional): 火山引擎数据库实例类型（可通过instance_id前缀获取，当前支持MySQL和VeDBMySQL，并严格要求大小写一致）
+        database (str, optional): Database名称
+    Returns:
+        tables (dict[str, dict[str, Any]]): 以Table名称为key的Table元信息，结构与get_table_info返回的table_meta相同
+        errors (dict[str, str]): 查询失败的Table名称及失败原因
+    """
+    if REMOTE_MCP_SERVER:
+        dbw_client = get_dbw_client(mcp_server.get_context())
+    else:
+        dbw_client = DBW_CLIENT
+
+    instance_id = dbw_client.instance_id or instance_id
+    if not instance_id:
+        raise ValueError("instance_id is required")
+    instance_type = dbw_client.instance_type or instance_type
+    if not instance_type:
+        raise ValueError("instance_type is required")
+    database = dbw_client.database or database
+    if not database:
+        raise ValueError("database is required")
+    tables = list(dict.fromkeys(table for table in tables or [] if table))
+    if not tables:
+        raise ValueError("tables is required")
+
+    results = await asyncio.gather(
+        *[_get_table_info(dbw_client, instance_id, instance_type, database, table) for table in tables],
+        return_exceptions=True,
+    )
+
+    tables_info, errors = {}, {}
+    for table, result in zip(tables, results):
+        if isinstance(result, BaseException):
+            errors[table] = str(result)
+        else:
+            tables_info[table] = result.get("table_meta", result)
+    return {"tables": tables_info, "errors": errors}
+
+
+async def _get_table_info(dbw_client: DBWClient, instance_id: str, instance_type: str,
+                          database: str, table: str) -> dict[str, Any]:
+    # 与 DBWClientCache 一致按完整凭证隔离，避免同 AK 的无效凭证命中他人的缓存
+    scope = (dbw_client.ak, dbw_client.credential_digest, instance_type, instance_id, database)
+    table_info = TABLE_METADATA_CACHE.get(scope, table)
+    if table_info is not None:
+        return table_info
+
     req = {
         "instance_id": instance_id,
         "instance_type": instance_type,
@@ -313,15 +404,17 @@ def get_table_info(
         "table": table,
     }
 
-    resp = dbw_client.get_table_info(req)
-    return resp.to_dict()
+    resp = await DBW_DISPATCHER.run("get_table_info", dbw_client.get_table_info, req)
+    table_info = resp.to_dict()
+    TABLE_METADATA_CACHE.put(scope, table, table_info)
+    return table_info
 
 
 @mcp_server.tool(
     name="describe_slow_logs",
     description="查询数据库实例的慢日志信息",
 )
-def describe_slow_logs(
+async def describe_slow_logs(
         start_time: int = Field(default=None, description="查询慢日志的开始时间，使用秒时间戳格式"),
         end_time: int = Field(default=None, description="查询慢日志的结束时间，使用秒时间戳格式"),
         instance_id: Optional[str] = Field(default=None, description="火山引擎数据库实例ID"),
@@ -398,7 +491,7 @@ def describe_slow_logs(
     if node_id is not None:
         req["node_id"] = node_id
 
-    resp = dbw_client.describe_slow_logs(req)
+    resp = await DBW_DISPATCHER.run("describe_slow_logs", dbw_client.describe_slow_logs, req)
     return resp.to_dict()
 
 
@@ -406,7 +499,7 @@ def describe_slow_logs(
     name="list_slow_query_advice",
     description="获取数据库实例的慢日志诊断详情信息",
 )
-def list_slow_query_advice(
+async def list_slow_query_advice(
         advice_type: str = Field(default="", description="建议类型（no_advice表示无建议，index_advice表示索引建议，rewrite_sql_advice表示改写SQL建议）"),
         summary_id: str = Field(default="", description="每次慢日志诊断的唯一标识"),
         group_by: str = Field(default="", description="聚合类型（Advice表示按建议聚合，Module表示按模块聚合）"),
@@ -504,7 +597,7 @@ def list_slow_query_advice(
         "page_size": page_size,
     }
 
-    resp = dbw_client.list_slow_query_advice_api(req)
+    resp = await DBW_DISPATCHER.run("list_slow_query_advice_api", dbw_client.list_slow_query_advice_api, req)
     return resp.to_dict()
 
 
@@ -512,7 +605,7 @@ def list_slow_query_advice(
     name="slow_query_advice_task_history",
     description="获取数据库实例的慢日志诊断历史信息",
 )
-def slow_query_advice_task_history(
+async def slow_query_advice_task_history(
         instance_id: Optional[str] = Field(default=None, description="火山引擎数据库实例ID"),
         instance_type: Optional[str] = Field(default=None, description="火山引擎数据库实例类型（可通过instance_id前缀获取，当前支持MySQL和VeDBMySQL，并严格要求大小写一致）"),
         page_number: Optional[int] = Field(default=1, description="分页查询时的页码（默认为1，即从第一页数据开始返回）"),
@@ -561,7 +654,7 @@ def slow_query_advice_task_history(
         "page_size": page_size,
     }
 
-    resp = dbw_client.slow_query_advice_task_history_api(req)
+    resp = await DBW_DISPATCHER.run("slow_query_advice_task_history_api", dbw_client.slow_query_advice_task_history_api, req)
     return resp.to_dict()
 
 
@@ -569,7 +662,7 @@ def slow_query_advice_task_history(
     name="create_dml_sql_change_ticket",
     description="针对数据库实例创建DML数据变更工单",
 )
-def create_dml_sql_change_ticket(
+async def create_dml_sql_change_ticket(
         sql_text: str = Field(default="", description="待执行的DML SQL语句（普通SQL变更可以支持多条DML语句，多条SQL语句间用英文分号隔开；普通SQL变更，适用于少量数据变更场景，支持多条语句）"),
         ticket_execute_type: str = Field(default="Auto", description="工单执行类型（Auto表示审批完成自动执行；Manual表示手动执行；Cron表示定时执行）"),
         instance_id: Optional[str] = Field(default=None, description="火山引擎数据库实例ID"),
@@ -631,7 +724,7 @@ def create_dml_sql_change_ticket(
     if memo is not None:
         req["memo"] = memo
 
-    resp = dbw_client.create_dml_sql_change_ticket(req)
+    resp = await DBW_DISPATCHER.run("create_dml_sql_change_ticket", dbw_client.create_dml_sql_change_ticket, req)
     return resp.to_dict()
 
 
@@ -639,7 +732,7 @@ def create_dml_sql_change_ticket(
     name="create_ddl_sql_change_ticket",
     description="针对数据库实例创建DDL结构变更工单",
 )
-def create_ddl_sql_change_ticket(
+async def create_ddl_sql_change_ticket(
         sql_text: str = Field(default="", description="待执行的DDL SQL语句（普通SQL变更可以下发多条DDL语句，多条SQL语句间用英文分号隔开。注意DDL有锁表风险，建议选择无锁结构变更逐条提交）"),
         ticket_execute_type: str = Field(default="Auto", description="工单执行类型（Auto表示审批完成自动执行；Manual表示手动执行；Cron表示定时执行）"),
         instance_id: Optional[str] = Field(default=None, description="火山引擎数据库实例ID"),
@@ -701,15 +794,19 @@ def create_ddl_sql_change_ticket(
     if memo is not None:
         req["memo"] = memo
 
-    resp = dbw_client.create_ddl_sql_change_ticket(req)
-    return resp.to_dict()
+    resp = await DBW_DISPATCHER.run("create_ddl_sql_change_ticket", dbw_client.create_ddl_sql_change_ticket, req)
+    result = resp.to_dict()
+    # 结构变更后Table元信息可能改变，失效对应Database的缓存；工单结束前该Database不使用缓存
+    TABLE_METADATA_CACHE.invalidate(instance_id, database)
+    TABLE_METADATA_CACHE.remember_ticket(result.get("ticket_id"), instance_id, database)
+    return result
 
 
 @mcp_server.tool(
     name="describe_tickets",
     description="批量查询工单详情",
 )
-def describe_tickets(
+async def describe_tickets(
         list_type: str = Field(default="", description="批量查询的工单类型（All表示全部；CreatedByMe表示我创建的；ApprovedByMe表示我审批的）"),
         order_by: Optional[str] = Field(default=None, description="返回结果的排序字段"),
         sort_by: Optional[str] = Field(default="ASC", description="按照降序或升序方式排列（ASC表示升序；DESC表示降序）"),
@@ -770,15 +867,18 @@ def describe_tickets(
     if order_by is not None:
         req["order_by"] = order_by
 
-    resp = dbw_client.describe_tickets(req)
-    return resp.to_dict()
+    resp = await DBW_DISPATCHER.run("describe_tickets", dbw_client.describe_tickets, req)
+    result = resp.to_dict()
+    for ticket in result.get("tickets") or []:
+        TABLE_METADATA_CACHE.observe_ticket(ticket.get("ticket_id"), ticket.get("ticket_status"))
+    return result
 
 
 @mcp_server.tool(
     name="describe_ticket_detail",
     description="查询单个工单详情",
 )
-def describe_ticket_detail(
+async def describe_ticket_detail(
         ticket_id: str = Field(default="", description="工单号")
 ) -> dict[str, Any]:
     """
@@ -821,15 +921,17 @@ def describe_ticket_detail(
         "ticket_id": ticket_id,
     }
 
-    resp = dbw_client.describe_ticket_detail(req)
-    return resp.to_dict()
+    resp = await DBW_DISPATCHER.run("describe_ticket_detail", dbw_client.describe_ticket_detail, req)
+    result = resp.to_dict()
+    TABLE_METADATA_CACHE.observe_ticket(result.get("ticket_id") or ticket_id, result.get("ticket_status"))
+    return result
 
 
 @mcp_server.tool(
     name="describe_workflow",
     description="查询审批工单详情",
 )
-def describe_workflow(
+async def describe_workflow(
         ticket_id: str = Field(default="", description="工单号")
 ) -> dict[str, Any]:
     """
@@ -859,7 +961,7 @@ def describe_workflow(
         "ticket_id": ticket_id,
     }
 
-    resp = dbw_client.describe_workflow(req)
+    resp = await DBW_DISPATCHER.run("describe_workflow", dbw_client.describe_workflow, req)
     return resp.to_dict()
 
 
@@ -867,7 +969,7 @@ def describe_workflow(
     name="manual_execute_ticket",
     description="手动执行工单",
 )
-def manual_execute_ticket(
+async def manual_execute_ticket(
         ticket_id: str = Field(default="", description="工单号")
 ) -> dict[str, Any]:
     """
@@ -891,7 +993,10 @@ def manual_execute_ticket(
         "ticket_id": ticket_id,
     }
 
-    resp = dbw_client.manual_execute_ticket(req)
+    try:
+        resp = await DBW_DISPATCHER.run("manual_execute_ticket", dbw_client.manual_execute_ticket, req)
+    finally:
+        TABLE_METADATA_CACHE.invalidate_ticket(ticket_id)
     return resp.to_dict()
 
 
@@ -908,36 +1013,8 @@ def get_dbw_client(ctx: Context[ServerSession, object, any]) -> DBWClient:
     if auth is None:
         # 获取认证信息失败
         raise ValueError("Missing authorization info.")
-    if ' ' in auth:
-        _, base64_data = auth.split(' ', 1)
-    else:
-        base64_data = auth
-
-    auth_info = {}
-
-    try:
-        decoded_str = base64.b64decode(base64_data).decode('utf-8')
-        data: dict = json.loads(decoded_str)
-
-        if not data.get('AccessKeyId'):
-            raise ValueError("failed to get remote ak")
-        if not data.get('SecretAccessKey'):
-            raise ValueError("failed to get remote sk")
-
-        auth_info["current_time"] = data.get('CurrentTime')
-        auth_info["expired_time"] = data.get('ExpiredTime')
-        auth_info["region"] = data.get("Region")
-        auth_info["ak"] = data.get('AccessKeyId')
-        auth_info["sk"] = data.get('SecretAccessKey')
-        auth_info["token"] = data.get('SessionToken')
-    except Exception as e:
-        raise ValueError("Decode authorization info error, {}", e)
 
-    return DBWClient(
-        region=os.getenv('VOLCENGINE_REGION') or auth_info["region"] or "cn-beijing",
-        ak=auth_info["ak"],
-        sk=auth_info["sk"],
-    )
+    return DBW_CLIENT_CACHE.get(auth, default_region=os.getenv('VOLCENGINE_REGION'))
 
 
 def main():
@@ -972,6 +1049,8 @@ def main():
     except Exception as e:
         logger.error(f"Error starting DBW MCP Server: {str(e)}")
         raise
+    finally:
+        DBW_DISPATCHER.shutdown()
 
 
 if __name__ == "__main__":
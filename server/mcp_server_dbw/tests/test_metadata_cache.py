@@ -0,0 +1,55 @@
+import time
+import unittest
+
+from mcp_server_dbw.resource.metadata_cache import TableMetadataCache
+
+SCOPE = ("ak", "digest", "MySQL", "instance-1", "db1")
+OTHER_SCOPE = ("ak", "digest", "MySQL", "instance-1", "db2")
+
+
+class TableMetadataCacheTests(unittest.TestCase):
+    def test_database_is_not_cached_until_ddl_ticket_finishes(self):
+        cache = TableMetadataCache(ttl_seconds=300, max_tables=16)
+        cache.put(SCOPE, "users", {"name": "users"})
+        cache.put(OTHER_SCOPE, "users", {"name": "users"})
+
+        cache.invalidate("instance-1", "db1")
+        cache.remember_ticket("t1", "instance-1", "db1")
+        cache.put(SCOPE, "users", {"name": "users"})
+
+        self.assertIsNone(cache.get(SCOPE, "users"))
+        self.assertIsNotNone(cache.get(OTHER_SCOPE, "users"))
+
+        cache.observe_ticket("t1", "TicketExecute")
+        cache.put(SCOPE, "users", {"name": "users"})
+        self.assertIsNone(cache.get(SCOPE, "users"))
+
+        cache.observe_ticket("t1", "TicketFinished")
+        cache.put(SCOPE, "users", {"name": "users", "columns": ["id"]})
+        self.assertEqual(cache.get(SCOPE, "users"), {"name": "users", "columns": ["id"]})
+        self.assertEqual(cache.stats()["pending_tickets"], 0)
+
+    def test_unobserved_ticket_stops_bypassing_after_pending_ttl(self):
+        cache = TableMetadataCache(ttl_seconds=300, max_tables=16, pending_ticket_seconds=0.05)
+        cache.remember_ticket("t1", "instance-1", "db1")
+        cache.put(SCOPE, "users", {"name": "users"})
+        self.assertIsNone(cache.get(SCOPE, "users"))
+
+        time.sleep(0.06)
+        cache.put(SCOPE, "users", {"name": "users"})
+        self.assertEqual(cache.get(SCOPE, "users"), {"name": "users"})
+
+    def test_manual_execution_invalidates_database(self):
+        cache = TableMetadataCache(ttl_seconds=300, max_tables=16)
+        cache.put(SCOPE, "users", {"name": "users"})
+        cache.put(OTHER_SCOPE, "users", {"name": "users"})
+        cache.remember_ticket("t1", "instance-1", "db1")
+
+        cache.invalidate_ticket("t1")
+
+        self.assertIsNone(cache.get(SCOPE, "users"))
+        self.assertIsNotNone(cache.get(OTHER_SCOPE, "users"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from mcp_server_dbw.resource.result_format import _typed_column, encode_execute_sql_result
+
+
+class TypedColumnTests(unittest.TestCase):
+    def test_plain_numbers_are_typed(self):
+        self.assertEqual(_typed_column(["1", "-2", None]), ("int", [1, -2, None]))
+        self.assertEqual(_typed_column(["1.5", "0.25", "-3e2"]), ("float", [1.5, 0.25, -300.0]))
+        self.assertEqual(_typed_column(["1", "2.5"]), ("float", [1.0, 2.5]))
+
+    def test_leading_zero_values_stay_strings(self):
+        self.assertEqual(_typed_column(["007", "012"]), ("str", ["007", "012"]))
+        self.assertEqual(_typed_column(["00.5", "1.5"]), ("str", ["00.5", "1.5"]))
+        self.assertEqual(_typed_column(["0", "0.5"]), ("float", [0.0, 0.5]))
+
+    def test_values_only_python_accepts_stay_strings(self):
+        for values in (["1_000"], ["1_000.5"], ["nan"], ["inf"], ["-Infinity"], ["1e400"]):
+            with self.subTest(values=values):
+                self.assertEqual(_typed_column(values), ("str", values))
+
+    def test_values_that_lose_precision_stay_strings(self):
+        self.assertEqual(_typed_column(["12345678901234567.89", "1.10"]), ("str", ["12345678901234567.89", "1.10"]))
+        self.assertEqual(_typed_column(["1234567890.123456"]), ("str", ["1234567890.123456"]))
+        self.assertEqual(_typed_column(["2.50", "3.25"]), ("str", ["2.50", "3.25"]))
+        self.assertEqual(_typed_column(["123456789012345.0", "1.0"]), ("float", [123456789012345.0, 1.0]))
+        self.assertEqual(_typed_column(["0.000123456789012345"]), ("float", [0.000123456789012345]))
+
+    def test_integers_beyond_double_precision_stay_strings(self):
+        self.assertEqual(_typed_column(["9007199254740992", "-9007199254740992"]),
+                         ("int", [9007199254740992, -9007199254740992]))
+        self.assertEqual(_typed_column(["9007199254740993", "1"]), ("str", ["9007199254740993", "1"]))
+        self.assertEqual(_typed_column(["-18446744073709551615"]), ("str", ["-18446744073709551615"]))
+
+    def test_columnar_output_keeps_identifiers(self):
+        response = {"results": [{
+            "column_names": ["zip", "amount"],
+            "rows": [{"cells": ["00501", "1.5"]}, {"cells": ["10001", "2"]}],
+        }]}
+
+        result = encode_execute_sql_result(response, "columnar")["results"][0]
+
+        self.assertEqual(result["types"], ["str", "float"])
+        self.assertEqual(result["data"], [["00501", "10001"], [1.5, 2.0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import asyncio
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+def _parse_tool_limits(value: Optional[str]) -> Dict[str, int]:
+    """解析形如 "describe_db_instances=4,describe_db_instance_price_detail=2" 的单工具并发配置"""
+    limits = {}
+    if not value:
+        return limits
+    for item in value.split(","):
+        if "=" not in item:
+            continue
+        name, limit = item.split("=", 1)
+        limits[name.strip()] = int(limit)
+    return limits
+
+
+class SDKExecutor:
+    """在有界线程池中执行阻塞的 volcenginesdkcore 调用，避免单个慢请求阻塞事件循环
+
+    每个工具额外受一个信号量约束，防止某个慢接口占满整个线程池；
+    等待信号量或线程的调用数即为排队深度，通过 stats() 查看。
+    """
+
+    def __init__(self, max_workers: int, default_tool_limit: int, tool_limits: Dict[str, int] = None):
+        self.max_workers = max_workers
+        self.default_tool_limit = default_tool_limit
+        self.tool_limits = tool_limits or {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rds_mysql_sdk")
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+
+    def _get_semaphore(self, tool_name: str) -> asyncio.Semaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(tool_name)
+            if semaphore is None:
+                limit = self.tool_limits.get(tool_name, self.default_tool_limit)
+                semaphore = asyncio.Semaphore(max(1, limit))
+                self._semaphores[tool_name] = semaphore
+            return semaphore
+
+    def _record(self, tool_name: str, name: str, value: float = 1):
+        with self._lock:
+            self._metrics[tool_name][name] += value
+
+    def _enter_queue(self, tool_name: str):
+        with self._lock:
+            metrics = self._metrics[tool_name]
+            metrics["queued"] += 1
+            metrics["max_queued"] = max(metrics["max_queued"], metrics["queued"])
+
+    async def run(self, tool_name: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """在线程池中执行 fn，tool_name 用于单工具并发限制与指标统计"""
+        loop = asyncio.get_running_loop()
+        submitted = time.monotonic()
+        state = {"dequeued": False}
+        self._enter_queue(tool_name)
+
+        def dequeue(started: Optional[float]) -> bool:
+            # 工作线程开始执行与排队期间被取消可能同时发生，只出队一次
+            with self._lock:
+                if state["dequeued"]:
+                    return False
+                state["dequeued"] = True
+                metrics = self._metrics[tool_name]
+                metrics["queued"] -= 1
+                if started is not None:
+                    metrics["running"] += 1
+                    metrics["wait_seconds"] += started - submitted
+                return True
+
+        def call():
+            started = time.monotonic()
+            if not dequeue(started):
+                # 调用方已在排队期间取消
+                return None
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._record(tool_name, "running", -1)
+                self._record(tool_name, "run_seconds", time.monotonic() - started)
+
+        try:
+            async with self._get_semaphore(tool_name):
+                result = await loop.run_in_executor(self._executor, call)
+            self._record(tool_name, "completed")
+            return result
+        except Exception:
+            self._record(tool_name, "failed")
+            raise
+        finally:
+            dequeue(None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            tools = {}
+            for tool_name, metrics in self._metrics.items():
+                calls = metrics["completed"] + metrics["failed"]
+                tools[tool_name] = {
+                    "limit": self.tool_limits.get(tool_name, self.default_tool_limit),
+                    "queued": int(metrics["queued"]),
+                    "max_queued": int(metrics["max_queued"]),
+                    "running": int(metrics["running"]),
+                    "completed": int(metrics["completed"]),
+                    "failed": int(metrics["failed"]),
+                    "avg_wait_ms": round(metrics["wait_seconds"] * 1000 / calls, 2) if calls else 0.0,
+                    "avg_run_ms": round(metrics["run_seconds"] * 1000 / calls, 2) if calls else 0.0,
+                }
+            return {
+                "max_workers": self.max_workers,
+                "queued": sum(tool["queued"] for tool in tools.values()),
+                "running": sum(tool["running"] for tool in tools.values()),
+                "tools": tools,
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def create_sdk_executor() -> SDKExecutor:
+    return SDKExecutor(
+        max_workers=int(os.getenv("RDS_MYSQL_SDK_MAX_WORKERS", "16")),
+        default_tool_limit=int(os.getenv("RDS_MYSQL_SDK_TOOL_CONCURRENCY", "8")),
+        tool_limits=_parse_tool_limits(os.getenv("RDS_MYSQL_SDK_TOOL_LIMITS")),
+    )
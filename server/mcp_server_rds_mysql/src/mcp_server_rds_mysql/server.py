@@ -1,10 +1,12 @@
 import os
+import time
 import asyncio
 from pydantic import Field
 import logging
 import argparse
 from mcp.server.fastmcp import FastMCP
 from mcp_server_rds_mysql.resource.rds_mysql_resource import RDSMySQLSDK
+from mcp_server_rds_mysql.resource.sdk_executor import create_sdk_executor
 from typing import List, Dict, Any, Optional
 
 # 初始化MCP服务
@@ -14,12 +16,19 @@ logger = logging.getLogger("rds_mysql_mcp_server")
 rds_mysql_resource = RDSMySQLSDK(
     region=os.getenv('VOLCENGINE_REGION',"cn-beijing"), ak=os.getenv('VOLCENGINE_ACCESS_KEY'), sk=os.getenv('VOLCENGINE_SECRET_KEY'), host=os.getenv('VOLCENGINE_ENDPOINT')
 )
+sdk_executor = create_sdk_executor()
+
+
+async def call_sdk(method_name: str, req: dict):
+    """在线程池中调用 RDSMySQLSDK 的阻塞方法，按 OpenAPI 名称限制并发"""
+    return await sdk_executor.run(method_name, getattr(rds_mysql_resource, method_name), req)
+
 
 @mcp_server.tool(
     name="describe_db_instances",
     description="查询RDS MySQL实例列表"
 )
-def describe_db_instances(
+async def describe_db_instances(
         page_number: int = Field(default=1, description="当前页页码，取值最小为1"),
         page_size: int = Field(default=10, description="每页记录数，最小值为1，最大值不超过1000"),
         instance_id: Optional[str] = Field(default=None, description="实例ID"),
@@ -90,12 +99,12 @@ def describe_db_instances(
             if not isinstance(filter_item, dict) or 'Key' not in filter_item:
                 raise ValueError("TagFilters中的每个元素必须是包含Key字段的字典")
 
-    resp = rds_mysql_resource.describe_db_instances(req)
+    resp = await call_sdk("describe_db_instances", req)
     return resp.to_dict()
 
 
 @mcp_server.tool(name="describe_db_instance_detail", description="查询RDSMySQL实例详情")
-def describe_db_instance_detail(
+async def describe_db_instance_detail(
         instance_id: str = Field(description="实例ID")
 ) -> dict[str, Any]:
     """查询RDSMySQL实例详情
@@ -105,7 +114,7 @@ def describe_db_instance_detail(
     req = {
         "instance_id": instance_id,
     }
-    resp = rds_mysql_resource.describe_db_instance_detail(req)
+    resp = await call_sdk("describe_db_instance_detail", req)
     return resp.to_dict()
 
 
@@ -113,7 +122,7 @@ def describe_db_instance_detail(
     name="describe_db_instance_engine_minor_versions",
     description="查询RDSMySQL实例可升级的内核小版本"
 )
-def describe_db_instance_engine_minor_versions(
+async def describe_db_instance_engine_minor_versions(
         instance_ids: List[str] = Field(description="实例ID列表")
 ) -> dict[str, Any]:
     """查询RDSMySQL实例可升级的内核小版本
@@ -124,7 +133,7 @@ def describe_db_instance_engine_minor_versions(
     req = {
         "instance_ids": instance_ids,
     }
-    resp = rds_mysql_resource.describe_db_instance_engine_minor_versions(req)
+    resp = await call_sdk("describe_db_instance_engine_minor_versions", req)
     return resp.to_dict()
 
 
@@ -132,7 +141,7 @@ def describe_db_instance_engine_minor_versions(
     name="describe_db_accounts",
     description="查询RDS MySQL实例的数据库账号"
 )
-def describe_db_accounts(
+async def describe_db_accounts(
         instance_id: str = Field(description="实例ID"),
         account_name: Optional[str] = Field(default=None, description="数据库账号名称，支持模糊查询"),
         page_number: int = Field(default=1, description="当前页页码，最小值为1"),
@@ -156,14 +165,14 @@ def describe_db_accounts(
     if account_name is not None:
         req["account_name"] = account_name
 
-    resp = rds_mysql_resource.describe_db_accounts(req)
+    resp = await call_sdk("describe_db_accounts", req)
     return resp.to_dict()
 
 @mcp_server.tool(
     name="describe_databases",
     description="根据指定RDS MySQL 实例ID 查看数据库列表"
 )
-def describe_databases(
+async def describe_databases(
         instance_id: str = Field(description="实例ID"),
         db_name: Optional[str] = Field(default=None, description="数据库名称，支持模糊查询"),
         page_number: int = Field(default=1, description="当前页页码，最小值为1"),
@@ -187,7 +196,7 @@ def describe_databases(
         req["db_name"] = db_name
 
     # 发送请求
-    resp = rds_mysql_resource.describe_databases(req)
+    resp = await call_sdk("describe_databases", req)
     return resp.to_dict()
 
 
@@ -195,7 +204,7 @@ def describe_databases(
     name="describe_db_instance_parameters",
     description="获取RDS MySQL实例参数列表"
 )
-def describe_db_instance_parameters(
+async def describe_db_instance_parameters(
         instance_id: str = Field(description="实例ID"),
         parameter_name: Optional[str] = Field(default=None, description="参数名"),
         node_id: Optional[str] = Field(default=None,
@@ -215,7 +224,7 @@ def describe_db_instance_parameters(
         "node_id": node_id
     }
     req = {k: v for k, v in req.items() if v is not None}
-    resp = rds_mysql_resource.describe_db_instance_parameters(req)
+    resp = await call_sdk("describe_db_instance_parameters", req)
     return resp.to_dict()
 
 
@@ -223,7 +232,7 @@ def describe_db_instance_parameters(
     name="list_parameter_templates",
     description="查询MySQL实例的参数模板列表"
 )
-def list_parameter_templates(
+async def list_parameter_templates(
     template_category: Optional[str] = Field(default=None, description="模板类别，取值为 DBEngine（数据库引擎参数）"),
     template_type: str = Field(default="Mysql", description="参数模板的数据库类型"),
     template_type_version: Optional[str] = Field(default=None, description="参数模板的数据库版本，如 MySQL_5_7 或 MySQL_8_0"),
@@ -264,7 +273,7 @@ def list_parameter_templates(
     if 'Offset' in req and req['Offset'] < 0:
         raise ValueError("Offset参数必须大于等于0")
 
-    resp = rds_mysql_resource.list_parameter_templates(req)
+    resp = await call_sdk("list_parameter_templates", req)
     return resp.to_dict()
 
 
@@ -272,7 +281,7 @@ def list_parameter_templates(
     name="describe_parameter_template",
     description="查询指定的参数模板详情"
 )
-def describe_parameter_template(
+async def describe_parameter_template(
         template_id: str = Field(description="参数模板 ID"),
         project_name: Optional[str] = Field(default=None, description="所属项目名称")
 ) -> dict[str, Any]:
@@ -292,7 +301,7 @@ def describe_parameter_template(
     if not template_id:
         raise ValueError("template_id是必选参数")
 
-    resp = rds_mysql_resource.describe_parameter_template(req)
+    resp = await call_sdk("describe_parameter_template", req)
     return resp.to_dict()
 
 
@@ -300,7 +309,7 @@ def describe_parameter_template(
     name="describe_db_instance_price_detail",
     description="查询数据库实例价格详情"
 )
-def describe_db_instance_price_detail(
+async def describe_db_instance_price_detail(
         node_info: list[dict[str, Any]] = Field(description="实例的节点配置列表，每个节点配置包含NodeType、NodeSpec等字段"),
         storage_type: str = Field(description="实例存储类型，取值为 LocalSSD，表示本地 SSD 盘"),
         storage_space: int = Field(description="实例存储空间，取值范围：[20, 3000]，单位：GB，步长 10GB"),
@@ -365,7 +374,7 @@ def describe_db_instance_price_detail(
     if node_operate_type and node_operate_type not in ["Create", "Modify"]:
         raise ValueError("node_operate_type必须是Create或Modify")
 
-    resp = rds_mysql_resource.describe_db_instance_price_detail(req)
+    resp = await call_sdk("describe_db_instance_price_detail", req)
     return resp.to_dict()
 
 
@@ -373,7 +382,7 @@ def describe_db_instance_price_detail(
     name="modify_db_instance_name",
     description="修改RDS MySQL实例名称"
 )
-def modify_db_instance_name(
+async def modify_db_instance_name(
         instance_id: str = Field(description="实例 ID"),
         instance_new_name: str = Field(
             description="实例的新名称。命名规则：不能以数字、中划线开头，只能包含中文、字母、数字、下划线和中划线，长度限制在 1~128 之间")
@@ -403,7 +412,7 @@ def modify_db_instance_name(
         "instance_new_name": instance_new_name
     }
 
-    resp = rds_mysql_resource.modify_db_instance_name(req)
+    resp = await call_sdk("modify_db_instance_name", req)
     return resp.to_dict()
 
 
@@ -411,7 +420,7 @@ def modify_db_instance_name(
     name="modify_db_account_description",
     description="修改RDS MySQL实例账号的描述信息"
 )
-def modify_db_account_description(
+async def modify_db_account_description(
         instance_id: str = Field(description="实例 ID"),
         account_name: str = Field(description="数据库账号名称"),
         host: str = Field(default="%", description="指定账号访问数据库的 IP 地址，默认值为 %"),
@@ -450,7 +459,7 @@ def modify_db_account_description(
 
     req = {k: v for k, v in req.items() if v is not None}
 
-    resp = rds_mysql_resource.modify_db_account_description(req)
+    resp = await call_sdk("modify_db_account_description", req)
     return resp.to_dict()
 
 
@@ -577,7 +586,7 @@ async def create_rds_mysql_instance(
     if maintenance_window is not None:
         data["maintenance_window"] = maintenance_window
 
-    create_resp = rds_mysql_resource.create_db_instance(data)
+    create_resp = await call_sdk("create_db_instance", data)
     
     instance_id = create_resp.instance_id
     
@@ -626,7 +635,7 @@ async def create_rds_mysql_instance(
                        f"waited {wait_interval}s, total time: {time_spent}s")
             
             req = {"instance_id": instance_id}
-            detail_resp = rds_mysql_resource.describe_db_instance_detail(req)
+            detail_resp = await call_sdk("describe_db_instance_detail", req)
             detail = detail_resp.to_dict()
             
             # 从响应中提取实例状态
@@ -662,7 +671,7 @@ async def create_rds_mysql_instance(
     name="create_database",
     description="创建RDS MySQL实例数据库"
 )
-def create_database(
+async def create_database(
         instance_id: str = Field(description="实例 ID"),
         db_name: str = Field(description="数据库名称。命名规则：名称唯一，长度为 2~64 个字符，以字母开头，以字母或数字结尾，由字母、数字、下划线或中划线组成，不能使用预留字"),
         character_set_name: str = Field(default="utf8mb4", description="数据库字符集，支持：utf8、utf8mb4、latin1、ascii"),
@@ -711,7 +720,7 @@ def create_database(
 
     req = {k: v for k, v in req.items() if v is not None}
 
-    resp = rds_mysql_resource.create_database(req)
+    resp = await call_sdk("create_database", req)
     if resp is None:
         return {
             "Message": "Success"
@@ -722,7 +731,7 @@ def create_database(
     name="create_allow_list",
     description="创建RDS MySQL实例白名单"
 )
-def create_allow_list(
+async def create_allow_list(
         allow_list_name: str = Field(..., title="白名单名称", description="需满足：不能以数字或中划线（-）开头，只能包含中文、字母、数字、下划线（_）和中划线（-），长度需为 1~128 个字符"),
         allow_list_desc: str = Field(None, description="长度不可超过 200 个字符"),
         allow_list_type: str = Field("IPv4", description="白名单内的 IP 地址类型，当前仅支持 IPv4 地址"),
@@ -812,7 +821,7 @@ def create_allow_list(
     req = {k: v for k, v in req.items() if v is not None}
 
     # 调用接口
-    resp = rds_mysql_resource.create_allow_list(req)
+    resp = await call_sdk("create_allow_list", req)
     return resp.to_dict()
 
 
@@ -820,7 +829,7 @@ def create_allow_list(
     name="associate_allow_list",
     description="绑定RDS MySQL实例与白名单"
 )
-def associate_allow_list(
+async def associate_allow_list(
     instance_ids: list[str] = Field(
             title="实例ID列表",
             description=(
@@ -882,7 +891,7 @@ def associate_allow_list(
         "allow_list_ids": allow_list_ids
     }
 
-    resp = rds_mysql_resource.associate_allow_list(req)
+    resp = await call_sdk("associate_allow_list", req)
     if resp is None:
         return {
             "Message": "Success"
@@ -893,7 +902,7 @@ def associate_allow_list(
     name="create_db_account",
     description="创建RDS MySQL实例数据库账号"
 )
-def create_db_account(
+async def create_db_account(
     instance_id: str = Field(
             title="实例ID",
             description="需要创建账号的RDS MySQL实例ID"
@@ -1054,7 +1063,7 @@ def create_db_account(
 
     req = {k: v for k, v in req.items() if v is not None}
 
-    resp = rds_mysql_resource.create_db_account(req)
+    resp = await call_sdk("create_db_account", req)
     if resp is None:
         return {
             "Message": "Success"
@@ -1066,7 +1075,7 @@ def create_db_account(
     name="describe_vpcs",
     description="查询VPC 信息，用于创建实例"
 )
-def describe_vpcs(
+async def describe_vpcs(
         page_number: int = Field(default=1, description="当前页页码，最小值为1"),
         page_size: int = Field(default=5, description="每页记录数，范围1-1000")
 ) -> dict[str, Any]:
@@ -1079,14 +1088,14 @@ def describe_vpcs(
         "page_size": page_size
     }
     req = {k: v for k, v in req.items() if v is not None}
-    resp = rds_mysql_resource.describe_vpcs(req)
+    resp = await call_sdk("describe_vpcs", req)
     return resp.to_dict()
 
 @mcp_server.tool(
     name="describe_subnets",
     description="查询子网信息，用于创建实例"
 )
-def describe_subnets(
+async def describe_subnets(
         vpc_id: str = Field(
             ...,
             description="VPC ID",
@@ -1101,9 +1110,140 @@ def describe_subnets(
         "zone_id": zone_id,
     }
     req = {k: v for k, v in req.items() if v is not None}
-    resp = rds_mysql_resource.describe_subnets(req)
+    resp = await call_sdk("describe_subnets", req)
     return resp.to_dict()
 
+@mcp_server.tool(
+    name="describe_db_instances_overview",
+    description="并发查询一个或多个RDS MySQL实例的详情、账号、数据库、参数与可升级内核小版本，并汇总为精简概览"
+)
+async def describe_db_instances_overview(
+        instance_ids: List[str] = Field(description="实例ID列表"),
+        page_size: int = Field(default=100, description="账号与数据库列表每个实例最多返回的记录数，范围1-1000"),
+        include_all_parameters: bool = Field(default=False, description="是否返回全部参数，默认仅返回与默认值不同的参数")
+) -> dict[str, Any]:
+    """并发查询一个或多个RDS MySQL实例的完整概览
+
+    每个实例会同时调用 describe_db_instance_detail、describe_db_accounts、describe_databases、
+    describe_db_instance_parameters 与 describe_db_instance_engine_minor_versions，
+    单个子调用失败不影响其他子调用，失败原因记录在 errors 中，各子调用耗时记录在 timings_ms 中。
+
+    Args:
+        instance_ids (list[str]): 实例ID列表
+        page_size (int): 账号与数据库列表每个实例最多返回的记录数，范围1-1000，默认100
+        include_all_parameters (bool): 是否返回全部参数，默认仅返回与默认值不同的参数
+    """
+    if not instance_ids:
+        raise ValueError("instance_ids是必选参数")
+
+    instance_ids = list(dict.fromkeys(instance_ids))
+    started = time.monotonic()
+    results = await asyncio.gather(*[
+        _describe_db_instance_overview(instance_id, page_size, include_all_parameters) for instance_id in instance_ids
+    ])
+    return {
+        "instances": results,
+        "total": len(results),
+        "elapsed_ms": round((time.monotonic() - started) * 1000, 2),
+    }
+
+
+async def _describe_db_instance_overview(instance_id: str, page_size: int, include_all_parameters: bool) -> dict[str, Any]:
+    sub_calls = {
+        "detail": ("describe_db_instance_detail", {"instance_id": instance_id}),
+        "accounts": ("describe_db_accounts", {"instance_id": instance_id, "page_number": 1, "page_size": page_size}),
+        "databases": ("describe_databases", {"instance_id": instance_id, "page_number": 1, "page_size": page_size}),
+        "parameters": ("describe_db_instance_parameters", {"instance_id": instance_id}),
+        "minor_versions": ("describe_db_instance_engine_minor_versions", {"instance_id": instance_id}),
+    }
+
+    async def timed_call(method_name: str, req: dict):
+        call_started = time.monotonic()
+        try:
+            resp = await call_sdk(method_name, req)
+            return resp.to_dict(), None, time.monotonic() - call_started
+        except Exception as e:
+            logger.error(f"{method_name} failed for instance {instance_id}: {str(e)}")
+            return None, str(e), time.monotonic() - call_started
+
+    responses = await asyncio.gather(*[timed_call(method_name, req) for method_name, req in sub_calls.values()])
+
+    overview = {"instance_id": instance_id, "timings_ms": {}, "errors": {}}
+    for key, (resp, error, elapsed) in zip(sub_calls, responses):
+        overview["timings_ms"][key] = round(elapsed * 1000, 2)
+        if error is not None:
+            overview["errors"][key] = error
+            overview[key] = None
+        else:
+            overview[key] = _summarize_overview_section(key, resp, include_all_parameters)
+    return overview
+
+
+def _summarize_overview_section(key: str, resp: dict, include_all_parameters: bool) -> Any:
+    if key == "detail":
+        basic_info = resp.get("basic_info") or {}
+        summary = {name: basic_info.get(name) for name in (
+            "instance_name", "instance_status", "instance_type", "db_engine_version", "current_kernel_version",
+            "node_spec", "vcpu", "memory", "storage_type", "storage_space", "storage_use",
+            "zone_id", "vpc_id", "subnet_id", "project_name", "create_time",
+        )}
+        summary["nodes"] = [
+            {name: node.get(name) for name in ("node_id", "node_type", "node_status", "node_spec", "zone_id")}
+            for node in resp.get("nodes") or []
+        ]
+        summary["endpoints"] = [
+            {name: endpoint.get(name) for name in ("endpoint_id", "endpoint_type", "read_write_mode")}
+            for endpoint in resp.get("endpoints") or []
+        ]
+        summary["charge_type"] = (resp.get("charge_detail") or {}).get("charge_type")
+        return summary
+
+    if key == "accounts":
+        return {
+            "total": resp.get("total"),
+            "items": [
+                {name: account.get(name) for name in ("account_name", "account_type", "account_status", "host")}
+                for account in resp.get("accounts") or []
+            ],
+        }
+
+    if key == "databases":
+        return {
+            "total": resp.get("total"),
+            "items": [
+                {name: database.get(name) for name in ("db_name", "character_set_name", "db_status")}
+                for database in resp.get("databases") or []
+            ],
+        }
+
+    if key == "parameters":
+        parameters = resp.get("parameters") or []
+        if not include_all_parameters:
+            parameters = [p for p in parameters if p.get("parameter_value") != p.get("parameter_default_value")]
+        return {
+            "parameter_count": resp.get("parameter_count"),
+            "modified_only": not include_all_parameters,
+            "items": [
+                {name: parameter.get(name) for name in ("parameter_name", "parameter_value", "parameter_default_value")}
+                for parameter in parameters
+            ],
+        }
+
+    if key == "minor_versions":
+        return resp.get("kernel_versions") or []
+
+    return resp
+
+
+@mcp_server.tool(
+    name="describe_sdk_executor_stats",
+    description="查询MCP Server内部OpenAPI调用线程池的排队深度、并发与耗时统计"
+)
+async def describe_sdk_executor_stats() -> dict[str, Any]:
+    """查询MCP Server内部OpenAPI调用线程池的排队深度、并发与耗时统计"""
+    return sdk_executor.stats()
+
+
 def main():
     """Main entry point for the MCP server."""
     parser = argparse.ArgumentParser(description="Run the RDS MySQL MCP Server")
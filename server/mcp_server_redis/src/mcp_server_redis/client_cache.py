@@ -0,0 +1,106 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SDKClientCache(Generic[T]):
+    """Thread-safe LRU cache of SDK clients with per-entry expiry.
+
+    Entries built from STS credentials expire with the credentials, everything else after
+    `default_ttl_seconds`. Concurrent first accesses to the same key build a single client.
+    """
+
+    def __init__(self, max_size: int, default_ttl_seconds: float) -> None:
+        self.max_size = max_size
+        self.default_ttl_seconds = default_ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple[float, T]]" = OrderedDict()
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _lookup(self, key: Hashable, now: float) -> T | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        deadline, client = entry
+        if deadline <= now:
+            del self._entries[key]
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return client
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], T], expires_at: float | None = None) -> T:
+        """Return the cached client for `key`, building it with `factory` on a miss.
+
+        `expires_at` is a `time.time()` timestamp after which the client must not be reused.
+        """
+        with self._lock:
+            client = self._lookup(key, time.time())
+            if client is not None:
+                self.hits += 1
+                return client
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                now = time.time()
+                client = self._lookup(key, now)
+                if client is not None:
+                    self.hits += 1
+                    return client
+                self.misses += 1
+
+            try:
+                client = factory()
+            except BaseException:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+                raise
+            deadline = now + self.default_ttl_seconds
+            if expires_at is not None:
+                deadline = min(deadline, expires_at)
+
+            with self._lock:
+                self._key_locks.pop(key, None)
+                if self.max_size > 0 and deadline > now:
+                    self._entries[key] = (deadline, client)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_size:
+                        self._entries.popitem(last=False)
+                        self.evictions += 1
+            return client
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+def create_client_cache() -> SDKClientCache:
+    return SDKClientCache(
+        max_size=int(os.getenv("REDIS_SDK_CLIENT_CACHE_SIZE", "256")),
+        default_ttl_seconds=float(os.getenv("REDIS_SDK_CLIENT_CACHE_TTL", "3600")),
+    )
@@ -0,0 +1,104 @@
+from typing import Any
+
+
+def _to_number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _top(items: list[dict[str, Any]], field: str, top_n: int) -> list[dict[str, Any]]:
+    return sorted(items, key=lambda item: _to_number(item.get(field)), reverse=True)[:top_n]
+
+
+def _command_name(query_text: str | None) -> str:
+    parts = (query_text or "").split(None, 1)
+    return parts[0].upper() if parts else ""
+
+
+def summarize_slow_logs(response: dict[str, Any], top_n: int) -> dict[str, Any]:
+    """Worst slow queries by `query_times` plus per-command totals."""
+    slow_queries = response.get("slow_query") or []
+    commands: dict[str, dict[str, Any]] = {}
+    for query in slow_queries:
+        name = _command_name(query.get("query_text"))
+        query_times = _to_number(query.get("query_times"))
+        command = commands.setdefault(name, {"command": name, "count": 0, "total_query_times": 0.0, "max_query_times": 0.0})
+        command["count"] += 1
+        command["total_query_times"] += query_times
+        command["max_query_times"] = max(command["max_query_times"], query_times)
+    return {
+        "total": response.get("total", len(slow_queries)),
+        "sampled": len(slow_queries),
+        "top_slow_queries": _top(slow_queries, "query_times", top_n),
+        "top_commands": _top(list(commands.values()), "total_query_times", top_n),
+    }
+
+
+def summarize_hot_keys(response: dict[str, Any], top_n: int) -> dict[str, Any]:
+    hot_keys = response.get("hot_key") or []
+    return {
+        "total": response.get("total", len(hot_keys)),
+        "top_hot_keys": _top(hot_keys, "query_count", top_n),
+    }
+
+
+def summarize_big_keys(response: dict[str, Any], top_n: int) -> dict[str, Any]:
+    big_keys = response.get("big_key") or []
+    return {
+        "total": response.get("total", len(big_keys)),
+        "top_big_keys": _top(big_keys, "value_size", top_n),
+    }
+
+
+def summarize_params(response: dict[str, Any]) -> dict[str, Any]:
+    """Only parameters whose current value differs from the default are reported."""
+    params = response.get("params") or []
+    modified = [
+        {
+            "param_name": param.get("param_name"),
+            "current_value": param.get("current_value"),
+            "default_value": param.get("default_value"),
+            "need_reboot": param.get("need_reboot"),
+        }
+        for param in params
+        if param.get("current_value") != param.get("default_value")
+    ]
+    return {
+        "total": response.get("total_params_num", len(params)),
+        "modified_params": modified,
+    }
+
+
+def summarize_allow_lists(response: dict[str, Any]) -> dict[str, Any]:
+    allow_lists = response.get("allow_lists") or []
+    return {
+        "total": len(allow_lists),
+        "allow_lists": [
+            {
+                "allow_list_id": allow_list.get("allow_list_id"),
+                "allow_list_name": allow_list.get("allow_list_name"),
+                "allow_list_type": allow_list.get("allow_list_type"),
+                "allow_list_ip_num": allow_list.get("allow_list_ip_num"),
+            }
+            for allow_list in allow_lists
+        ],
+    }
+
+
+def summarize_across_instances(instances: dict[str, dict[str, Any]], top_n: int) -> dict[str, Any]:
+    """Merge the per-instance top-N lists into account-wide top-N lists tagged with the instance ID."""
+
+    def collect(section: str, field: str) -> list[dict[str, Any]]:
+        items = []
+        for instance_id, report in instances.items():
+            for item in (report.get(section) or {}).get(field) or []:
+                items.append({"instance_id": instance_id, **item})
+        return items
+
+    return {
+        "worst_slow_queries": _top(collect("slow_logs", "top_slow_queries"), "query_times", top_n),
+        "hottest_keys": _top(collect("hot_keys", "top_hot_keys"), "query_count", top_n),
+        "largest_keys": _top(collect("big_keys", "top_big_keys"), "value_size", top_n),
+    }
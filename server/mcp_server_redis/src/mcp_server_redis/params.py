@@ -638,4 +638,15 @@ func_available_params_map = {
            - This API is used to query the key scan jobs of Redis instances.
            - If query_start_time is left empty, it means not filtering by start time.
            - If query_end_time is left empty, it means not filtering by end time.""",
+    "diagnose_db_instances": r"""Collect slow logs, hot keys, big keys, parameters and allow lists of Redis instances concurrently
+       Args:
+           instance_ids (list[str], required): Instance IDs. You can call describe_db_instances to query instance IDs.
+           region_id (str, optional): The region ID of the instances. Defaults to the configured region.
+           query_start_time (str, optional): Start time of the slow log, hot key and big key queries. Format: yyyy-MM-ddTHH:mm:ssZ (UTC time).
+           query_end_time (str, optional): End time of the slow log, hot key and big key queries. Format: yyyy-MM-ddTHH:mm:ssZ (UTC time).
+           page_size (int, optional): Number of slow logs, hot keys and big keys fetched per instance. Range: 1-1000, big keys are capped at 100. Default: 100.
+           top_n (int, optional): Number of entries kept in each top-N list. Default: 10.
+       Note:
+           - Prefer this tool over calling describe_slow_logs, describe_hot_keys, describe_big_keys, describe_db_instance_params and describe_allow_lists one by one when investigating anomalies.
+           - The end time of the query must be later than the start time.""",
 }
\ No newline at end of file
@@ -1,8 +1,11 @@
 import os
 import json
+import time
 import base64
+import asyncio
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 from mcp.server.fastmcp import FastMCP
@@ -10,6 +13,8 @@ from mcp.server.fastmcp import FastMCP
 from mcp_server_redis.resource.vpc_resource import VpcSDK
 from mcp_server_redis.resource.redis_resource import RedisSDK
 from mcp_server_redis.params import func_available_params_map
+from mcp_server_redis.client_cache import SDKClientCache, create_client_cache
+from mcp_server_redis import diagnostics
 
 def _get_server_host() -> str:
     return os.getenv("MCP_SERVER_HOST") or os.getenv("FASTMCP_HOST") or "0.0.0.0"
@@ -35,8 +40,9 @@ VOLCENGINE_SECRET_KEY_ENV_NAMES = ("VOLCENGINE_SECRET_KEY",)
 VOLCENGINE_SESSION_TOKEN_ENV_NAMES = ("VOLCENGINE_SESSION_TOKEN",)
 AUTHORIZATION_ENV_NAMES = ("authorization", "AUTHORIZATION")
 
-_REDIS_CLIENT_CACHE: dict[tuple[str, str, str, str, str], RedisSDK] = {}
-_VPC_CLIENT_CACHE: dict[tuple[str, str, str, str], VpcSDK] = {}
+# Keyed by (region, [host,] ak, sk, session_token); bounded so rotated STS tokens do not accumulate
+_REDIS_CLIENT_CACHE: SDKClientCache[RedisSDK] = create_client_cache()
+_VPC_CLIENT_CACHE: SDKClientCache[VpcSDK] = create_client_cache()
 
 
 def _get_env_value(*names: str) -> str:
@@ -51,21 +57,31 @@ def _normalize_iso8601(value: str) -> str:
     return value.replace("Z", "+00:00") if value.endswith("Z") else value
 
 
-def _validate_sts_time_window(payload: dict[str, Any]) -> None:
+def _validate_sts_time_window(payload: dict[str, Any]) -> datetime | None:
+    """Reject an expired STS payload and return its expiry time, if it has one."""
     current_time = payload.get("CurrentTime")
     expired_time = payload.get("ExpiredTime")
     if not current_time or not expired_time:
-        return
+        return None
     current_dt = datetime.fromisoformat(_normalize_iso8601(str(current_time)))
     expired_dt = datetime.fromisoformat(_normalize_iso8601(str(expired_time)))
     if current_dt > expired_dt:
         raise ValueError("STS token is expired")
+    return expired_dt
 
 
-def _parse_authorization_payload(raw_value: str) -> dict[str, str]:
+def _decode_authorization_payload(raw_value: str) -> dict[str, Any]:
     token = raw_value.split(" ", 1)[1] if " " in raw_value else raw_value
-    payload = json.loads(base64.b64decode(token).decode("utf-8"))
+    return json.loads(base64.b64decode(token).decode("utf-8"))
+
+
+def _parse_authorization_payload(raw_value: str) -> dict[str, str]:
+    payload = _decode_authorization_payload(raw_value)
     _validate_sts_time_window(payload)
+    return _credentials_from_payload(payload)
+
+
+def _credentials_from_payload(payload: dict[str, Any]) -> dict[str, str]:
     access_key = str(payload.get("AccessKeyId") or "").strip()
     secret_key = str(payload.get("SecretAccessKey") or "").strip()
     session_token = str(payload.get("SessionToken") or "").strip()
@@ -94,17 +110,19 @@ def _get_request_authorization() -> str:
     return str(request.headers.get("authorization") or "").strip()
 
 
-def _resolve_volcengine_credentials(region: str | None = None) -> dict[str, str]:
-    request_authorization = _get_request_authorization()
-    if request_authorization:
-        credentials = _parse_authorization_payload(request_authorization)
-        credentials["region"] = region or credentials["region"] or os.getenv("VOLCENGINE_REGION", "")
-        return credentials
+def _resolve_volcengine_credentials(region: str | None = None) -> dict[str, Any]:
+    """Resolve credentials from the request header, the authorization env or AK/SK env.
 
-    env_authorization = _get_env_value(*AUTHORIZATION_ENV_NAMES)
-    if env_authorization:
-        credentials = _parse_authorization_payload(env_authorization)
+    STS credentials also carry `expires_at` (a `time.time()` timestamp) so cached SDK clients
+    built from them are dropped when the token expires.
+    """
+    authorization = _get_request_authorization() or _get_env_value(*AUTHORIZATION_ENV_NAMES)
+    if authorization:
+        payload = _decode_authorization_payload(authorization)
+        expired_dt = _validate_sts_time_window(payload)
+        credentials: dict[str, Any] = _credentials_from_payload(payload)
         credentials["region"] = region or credentials["region"] or os.getenv("VOLCENGINE_REGION", "")
+        credentials["expires_at"] = expired_dt.timestamp() if expired_dt else None
         return credentials
 
     access_key = _get_env_value(*VOLCENGINE_ACCESS_KEY_ENV_NAMES)
@@ -154,17 +172,17 @@ def _get_redis_client(region: str | None = None) -> RedisSDK:
         credentials["secret_key"],
         credentials["session_token"],
     )
-    client = _REDIS_CLIENT_CACHE.get(cache_key)
-    if client is None:
-        client = RedisSDK(
+    return _REDIS_CLIENT_CACHE.get_or_create(
+        cache_key,
+        lambda: RedisSDK(
             region=resolved_region,
             host=host or None,
             ak=credentials["access_key"],
             sk=credentials["secret_key"],
             session_token=credentials["session_token"] or None,
-        )
-        _REDIS_CLIENT_CACHE[cache_key] = client
-    return client
+        ),
+        expires_at=credentials.get("expires_at"),
+    )
 
 
 def _get_vpc_client(region: str | None = None) -> VpcSDK:
@@ -178,17 +196,17 @@ def _get_vpc_client(region: str | None = None) -> VpcSDK:
         credentials["secret_key"],
         credentials["session_token"],
     )
-    client = _VPC_CLIENT_CACHE.get(cache_key)
-    if client is None:
-        client = VpcSDK(
+    return _VPC_CLIENT_CACHE.get_or_create(
+        cache_key,
+        lambda: VpcSDK(
             region=resolved_region,
             host=None,
             ak=credentials["access_key"],
             sk=credentials["secret_key"],
             session_token=credentials["session_token"] or None,
-        )
-        _VPC_CLIENT_CACHE[cache_key] = client
-    return client
+        ),
+        expires_at=credentials.get("expires_at"),
+    )
 
 
 class _SDKProxy:
@@ -1840,6 +1858,134 @@ def describe_key_scan_jobs(
     return resp.to_dict()
 
 
+# Blocking SDK calls issued concurrently by diagnose_db_instances
+_DIAGNOSTICS_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("REDIS_DIAGNOSTICS_MAX_WORKERS", "16")),
+    thread_name_prefix="redis_diagnostics",
+)
+
+
+async def _timed_sdk_call(client: RedisSDK, method_name: str, req: dict[str, Any]) -> tuple[dict[str, Any] | None, float, str | None]:
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    try:
+        resp = await loop.run_in_executor(_DIAGNOSTICS_EXECUTOR, getattr(client, method_name), req)
+        return resp.to_dict(), round((time.perf_counter() - started) * 1000, 2), None
+    except Exception as e:
+        return None, round((time.perf_counter() - started) * 1000, 2), str(e)
+
+
+async def _diagnose_db_instance(
+    client: RedisSDK,
+    region_id: str,
+    instance_id: str,
+    query_start_time: str | None,
+    query_end_time: str | None,
+    page_size: int,
+    top_n: int,
+) -> dict[str, Any]:
+    time_range = {"query_start_time": query_start_time, "query_end_time": query_end_time}
+    calls = {
+        "slow_logs": ("describe_slow_logs", {"instance_id": instance_id, "page_size": page_size, **time_range},
+                      lambda resp: diagnostics.summarize_slow_logs(resp, top_n)),
+        "hot_keys": ("describe_hot_keys", {"instance_id": instance_id, "page_size": page_size, **time_range},
+                     lambda resp: diagnostics.summarize_hot_keys(resp, top_n)),
+        "big_keys": ("describe_big_keys", {"instance_id": instance_id, "page_size": min(page_size, 100), **time_range},
+                     lambda resp: diagnostics.summarize_big_keys(resp, top_n)),
+        "params": ("describe_db_instance_params", {"instance_id": instance_id, "page_number": 1, "page_size": 1000},
+                   diagnostics.summarize_params),
+        "allow_lists": ("describe_allow_lists", {"region_id": region_id, "instance_id": instance_id},
+                        diagnostics.summarize_allow_lists),
+    }
+    results = await asyncio.gather(*[
+        _timed_sdk_call(client, method_name, {k: v for k, v in req.items() if v is not None})
+        for method_name, req, _ in calls.values()
+    ])
+
+    report: dict[str, Any] = {"latency_ms": {}, "errors": {}}
+    for (section, (_, _, summarize)), (resp, latency_ms, error) in zip(calls.items(), results):
+        report["latency_ms"][section] = latency_ms
+        if error is not None:
+            report["errors"][section] = error
+        else:
+            report[section] = summarize(resp)
+    return report
+
+
+@mcp_server.tool(
+    name="diagnose_db_instances",
+    description="1.Invoke `get_available_params` to retrieve available parameters before utilizing any tool. 2.Collect slow logs, hot keys, big keys, parameters and allow lists of one or more Redis instances concurrently and summarize the anomalies"
+)
+async def diagnose_db_instances(
+    instance_ids: list[str],
+    region_id: str = None,
+    query_start_time: str = None,
+    query_end_time: str = None,
+    page_size: int = 100,
+    top_n: int = 10
+) -> dict[str, Any]:
+    """Collect a diagnostics bundle for Redis instances in one call
+       Args:
+           instance_ids (list[str]): The instance IDs. You can call describe_db_instances to query instance IDs.
+           region_id (str, optional): The region ID of the instances. Defaults to the configured region.
+           query_start_time (str, optional): The start time of the slow log, hot key and big key queries in format yyyy-MM-ddTHH:mm:ssZ (UTC).
+           query_end_time (str, optional): The end time of the slow log, hot key and big key queries in format yyyy-MM-ddTHH:mm:ssZ (UTC).
+           page_size (int): The number of slow logs, hot keys and big keys fetched per instance. Range: 1-1000, big keys are capped at 100. Default: 100.
+           top_n (int): The number of entries kept in each top-N list. Default: 10.
+       Returns:
+           dict: Diagnostics bundle.
+           - "instances" (dict): Report of each instance, containing:
+               - "slow_logs" (dict): "total", "top_slow_queries" ordered by query_times and "top_commands" aggregated by command.
+               - "hot_keys" (dict): "total" and "top_hot_keys" ordered by query_count.
+               - "big_keys" (dict): "total" and "top_big_keys" ordered by value_size.
+               - "params" (dict): "total" and "modified_params" whose current value differs from the default.
+               - "allow_lists" (dict): Allow lists bound to the instance.
+               - "latency_ms" (dict): Latency of each underlying API call in milliseconds.
+               - "errors" (dict): Error message of each failed API call. The matching section is omitted.
+           - "summary" (dict): "worst_slow_queries", "hottest_keys" and "largest_keys" across all instances.
+       Note:
+           - All API calls of all instances are issued concurrently, a failed call does not affect the others.
+    """
+    instance_ids = list(dict.fromkeys(instance_id for instance_id in instance_ids or [] if instance_id))
+    if not instance_ids:
+        raise ValueError("instance_ids is required")
+    if page_size < 1:
+        raise ValueError("page_size must be greater than 0")
+    if top_n < 1:
+        raise ValueError("top_n must be greater than 0")
+
+    # Credentials are read from the request context, so resolve the client before leaving the event loop
+    region_id = _resolve_volcengine_credentials(region_id)["region"]
+    client = _get_redis_client(region_id)
+    reports = await asyncio.gather(*[
+        _diagnose_db_instance(client, region_id, instance_id, query_start_time, query_end_time, page_size, top_n)
+        for instance_id in instance_ids
+    ])
+    instances = dict(zip(instance_ids, reports))
+    return {
+        "instances": instances,
+        "summary": diagnostics.summarize_across_instances(instances, top_n),
+    }
+
+
+@mcp_server.tool(
+    name="describe_sdk_client_cache_stats",
+    description="Query the size and hit metrics of the cached Redis and VPC SDK clients of this MCP server"
+)
+def describe_sdk_client_cache_stats() -> dict[str, Any]:
+    """Query the size and hit metrics of the cached Redis and VPC SDK clients
+       Returns:
+           dict: Metrics of each client cache.
+           - "redis" (dict): Redis SDK client cache metrics.
+           - "vpc" (dict): VPC SDK client cache metrics.
+           Each contains "size", "max_size", "hits", "misses", "hit_ratio", "evictions" and "expirations".
+    """
+    return {
+        "redis": _REDIS_CLIENT_CACHE.stats(),
+        "vpc": _VPC_CLIENT_CACHE.stats(),
+    }
+
+
 def main():
     """Main entry point for the MCP server."""
     parser = argparse.ArgumentParser(description="Run the Redis MCP Server")
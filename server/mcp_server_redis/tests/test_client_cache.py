@@ -0,0 +1,157 @@
+import base64
+import json
+import os
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from mcp_server_redis import server as redis_server
+from mcp_server_redis.client_cache import SDKClientCache
+
+
+def _make_auth_header(payload: dict) -> str:
+    return "Bearer " + base64.b64encode(json.dumps(payload).encode("utf-8")).decode("utf-8")
+
+
+def _request_context(header: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        request_context=SimpleNamespace(
+            request=SimpleNamespace(headers={"authorization": header})
+        )
+    )
+
+
+class SDKClientCacheTests(unittest.TestCase):
+    def test_evicts_least_recently_used_entry(self):
+        cache = SDKClientCache(max_size=2, default_ttl_seconds=60)
+        cache.get_or_create("a", lambda: "client-a")
+        cache.get_or_create("b", lambda: "client-b")
+        cache.get_or_create("a", lambda: "unused")
+        cache.get_or_create("c", lambda: "client-c")
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get_or_create("a", lambda: "rebuilt-a"), "client-a")
+        self.assertEqual(cache.get_or_create("b", lambda: "rebuilt-b"), "rebuilt-b")
+        self.assertEqual(cache.stats()["evictions"], 2)
+
+    def test_entry_expires_at_given_timestamp(self):
+        cache = SDKClientCache(max_size=4, default_ttl_seconds=3600)
+        cache.get_or_create("sts", lambda: "first", expires_at=time.time() + 0.05)
+        self.assertEqual(cache.get_or_create("sts", lambda: "second"), "first")
+
+        time.sleep(0.06)
+
+        self.assertEqual(cache.get_or_create("sts", lambda: "second"), "second")
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def test_already_expired_credentials_are_not_cached(self):
+        cache = SDKClientCache(max_size=4, default_ttl_seconds=3600)
+        cache.get_or_create("sts", lambda: "client", expires_at=time.time() - 1)
+
+        self.assertEqual(len(cache), 0)
+
+    def test_concurrent_first_access_builds_one_client(self):
+        cache = SDKClientCache(max_size=4, default_ttl_seconds=60)
+        built = []
+        barrier = threading.Barrier(8)
+
+        def factory():
+            built.append(object())
+            time.sleep(0.05)
+            return built[-1]
+
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(cache.get_or_create("key", factory))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(built), 1)
+        self.assertTrue(all(result is built[0] for result in results))
+        stats = cache.stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 7)
+
+    def test_failed_factory_is_not_cached(self):
+        cache = SDKClientCache(max_size=4, default_ttl_seconds=60)
+
+        def factory():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            cache.get_or_create("key", factory)
+        self.assertEqual(cache.get_or_create("key", lambda: "client"), "client")
+
+
+class RedisClientCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        redis_server._REDIS_CLIENT_CACHE.clear()
+        redis_server._VPC_CLIENT_CACHE.clear()
+
+    def test_rotated_sts_tokens_stay_bounded(self):
+        expired_time = datetime.now(timezone.utc) + timedelta(hours=1)
+        cache = SDKClientCache(max_size=3, default_ttl_seconds=3600)
+
+        with patch.object(redis_server, "_REDIS_CLIENT_CACHE", cache), patch.object(
+            redis_server, "RedisSDK", side_effect=lambda **kwargs: object()
+        ), patch.dict(os.environ, {}, clear=True):
+            for index in range(10):
+                header = _make_auth_header(
+                    {
+                        "AccessKeyId": "sts-ak",
+                        "SecretAccessKey": "sts-sk",
+                        "SessionToken": f"sts-token-{index}",
+                        "CurrentTime": datetime.now(timezone.utc).isoformat(),
+                        "ExpiredTime": expired_time.isoformat(),
+                        "Region": "cn-beijing",
+                    }
+                )
+                with patch.object(redis_server.mcp_server, "get_context", return_value=_request_context(header)):
+                    first = redis_server._get_redis_client()
+                    second = redis_server._get_redis_client()
+                self.assertIs(first, second)
+
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.stats()["hits"], 10)
+
+    def test_sts_client_expires_with_token(self):
+        header = _make_auth_header(
+            {
+                "AccessKeyId": "sts-ak",
+                "SecretAccessKey": "sts-sk",
+                "SessionToken": "sts-token",
+                "CurrentTime": datetime.now(timezone.utc).isoformat(),
+                "ExpiredTime": (datetime.now(timezone.utc) + timedelta(seconds=0.2)).isoformat(),
+                "Region": "cn-beijing",
+            }
+        )
+
+        with patch.object(redis_server.mcp_server, "get_context", return_value=_request_context(header)), patch.object(
+            redis_server, "RedisSDK", side_effect=lambda **kwargs: object()
+        ) as redis_sdk_cls, patch.dict(os.environ, {}, clear=True):
+            redis_server._get_redis_client()
+            redis_server._get_redis_client()
+            self.assertEqual(redis_sdk_cls.call_count, 1)
+            time.sleep(0.25)
+            redis_server._get_redis_client()
+            self.assertEqual(redis_sdk_cls.call_count, 2)
+
+    def test_describe_sdk_client_cache_stats_reports_both_caches(self):
+        stats = redis_server.describe_sdk_client_cache_stats()
+
+        self.assertEqual(set(stats), {"redis", "vpc"})
+        self.assertIn("hit_ratio", stats["redis"])
+        self.assertEqual(stats["vpc"]["size"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+import asyncio
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from mcp_server_redis import server as redis_server
+
+
+class _Response:
+    def __init__(self, payload: dict):
+        self._payload = payload
+
+    def to_dict(self) -> dict:
+        return self._payload
+
+
+class _FakeRedisSDK:
+    """Returns canned responses after a short blocking delay and records call overlap."""
+
+    def __init__(self, delay: float = 0.1, failing: set[str] | None = None):
+        self.delay = delay
+        self.failing = failing or set()
+        self.requests: list[tuple[str, dict]] = []
+        self._lock = threading.Lock()
+        self._running = 0
+        self.max_running = 0
+
+    def _call(self, method_name: str, req: dict, payload: dict) -> _Response:
+        with self._lock:
+            self.requests.append((method_name, req))
+            self._running += 1
+            self.max_running = max(self.max_running, self._running)
+        try:
+            time.sleep(self.delay)
+            if method_name in self.failing:
+                raise RuntimeError(f"{method_name} failed")
+            return _Response(payload)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def describe_slow_logs(self, req):
+        instance_id = req["instance_id"]
+        return self._call("describe_slow_logs", req, {
+            "total": 3,
+            "slow_query": [
+                {"instance_id": instance_id, "query_text": "KEYS *", "query_times": 9000},
+                {"instance_id": instance_id, "query_text": "hgetall big", "query_times": 1200},
+                {"instance_id": instance_id, "query_text": "KEYS user:*", "query_times": 3000},
+            ],
+        })
+
+    def describe_hot_keys(self, req):
+        return self._call("describe_hot_keys", req, {
+            "total": 2,
+            "hot_key": [
+                {"key_info": "cold", "query_count": "15"},
+                {"key_info": f"hot-{req['instance_id']}", "query_count": "900"},
+            ],
+        })
+
+    def describe_big_keys(self, req):
+        return self._call("describe_big_keys", req, {
+            "total": 2,
+            "big_key": [
+                {"key_info": "small", "value_size": "10"},
+                {"key_info": f"big-{req['instance_id']}", "value_size": "1048576"},
+            ],
+        })
+
+    def describe_db_instance_params(self, req):
+        return self._call("describe_db_instance_params", req, {
+            "total_params_num": 2,
+            "params": [
+                {"param_name": "maxmemory-policy", "current_value": "noeviction", "default_value": "volatile-lru"},
+                {"param_name": "timeout", "current_value": "0", "default_value": "0"},
+            ],
+        })
+
+    def describe_allow_lists(self, req):
+        return self._call("describe_allow_lists", req, {
+            "allow_lists": [{"allow_list_id": "acl-1", "allow_list_name": "default", "allow_list_ip_num": 3}],
+        })
+
+
+class DiagnoseDBInstancesTests(unittest.TestCase):
+    def _run(self, client: _FakeRedisSDK, **kwargs) -> dict:
+        with patch.object(redis_server, "_get_redis_client", return_value=client), patch.object(
+            redis_server.mcp_server, "get_context", side_effect=RuntimeError("no context")
+        ), patch.dict(
+            os.environ,
+            {"VOLCENGINE_ACCESS_KEY": "ak", "VOLCENGINE_SECRET_KEY": "sk", "VOLCENGINE_REGION": "cn-beijing"},
+            clear=True,
+        ):
+            return asyncio.run(redis_server.diagnose_db_instances(**kwargs))
+
+    def test_calls_are_issued_concurrently(self):
+        client = _FakeRedisSDK(delay=0.2)
+
+        started = time.perf_counter()
+        result = self._run(client, instance_ids=["redis-a", "redis-b"])
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(len(client.requests), 10)
+        self.assertGreaterEqual(client.max_running, 5)
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(set(result["instances"]), {"redis-a", "redis-b"})
+
+    def test_summarizes_top_n_and_reports_latency(self):
+        result = self._run(_FakeRedisSDK(delay=0.01), instance_ids=["redis-a"], top_n=1)
+        report = result["instances"]["redis-a"]
+
+        self.assertEqual(report["slow_logs"]["top_slow_queries"][0]["query_text"], "KEYS *")
+        self.assertEqual(report["slow_logs"]["top_commands"][0], {
+            "command": "KEYS", "count": 2, "total_query_times": 12000.0, "max_query_times": 9000.0,
+        })
+        self.assertEqual(report["hot_keys"]["top_hot_keys"], [{"key_info": "hot-redis-a", "query_count": "900"}])
+        self.assertEqual(report["big_keys"]["top_big_keys"][0]["key_info"], "big-redis-a")
+        self.assertEqual([param["param_name"] for param in report["params"]["modified_params"]], ["maxmemory-policy"])
+        self.assertEqual(report["allow_lists"]["total"], 1)
+        self.assertEqual(
+            set(report["latency_ms"]), {"slow_logs", "hot_keys", "big_keys", "params", "allow_lists"}
+        )
+        self.assertEqual(report["errors"], {})
+
+    def test_summary_merges_instances(self):
+        result = self._run(_FakeRedisSDK(delay=0.01), instance_ids=["redis-a", "redis-b", "redis-a"], top_n=2)
+
+        hottest = result["summary"]["hottest_keys"]
+        self.assertEqual({item["instance_id"] for item in hottest}, {"redis-a", "redis-b"})
+        self.assertTrue(all(item["query_count"] == "900" for item in hottest))
+        self.assertEqual(len(result["summary"]["worst_slow_queries"]), 2)
+
+    def test_failed_call_is_isolated(self):
+        client = _FakeRedisSDK(delay=0.01, failing={"describe_hot_keys"})
+
+        report = self._run(client, instance_ids=["redis-a"])["instances"]["redis-a"]
+
+        self.assertNotIn("hot_keys", report)
+        self.assertEqual(report["errors"], {"hot_keys": "describe_hot_keys failed"})
+        self.assertIn("slow_logs", report)
+
+    def test_requests_use_resolved_region_and_cap_big_key_page_size(self):
+        client = _FakeRedisSDK(delay=0.01)
+
+        self._run(client, instance_ids=["redis-a"], page_size=500)
+
+        requests = dict(client.requests)
+        self.assertEqual(requests["describe_allow_lists"], {"region_id": "cn-beijing", "instance_id": "redis-a"})
+        self.assertEqual(requests["describe_big_keys"]["page_size"], 100)
+        self.assertEqual(requests["describe_slow_logs"]["page_size"], 500)
+
+    def test_requires_instance_ids(self):
+        with self.assertRaisesRegex(ValueError, "instance_ids is required"):
+            self._run(_FakeRedisSDK(), instance_ids=[])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Measure execute_sql latency with and without the shared per-endpoint http client registry.
+
+The "registry" path sends every query through the process-wide HTTP_CLIENTS pool. The "fresh" path
+gives each query its own registry that is closed afterwards, which reproduces the old behaviour of
+opening a new connection (TCP + TLS handshake) per call.
+
+Uses the same credentials as the server (VOLCENGINE_ACCESS_KEY / VOLCENGINE_SECRET_KEY / VOLCENGINE_REGION).
+
+Usage:
+    uv run python benchmarks/execute_sql_latency.py --workspace-id <workspace_id> [--query "select 1"]
+        [--iterations 50] [--concurrency 1]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from mcp_server_supabase.platform import HTTP_CLIENTS, AidapClient, SupabaseClient
+from mcp_server_supabase.platform.http_clients import HttpClientRegistry
+
+
+async def run_query(endpoint: str, api_key: str, query: str, pooled: bool) -> float:
+    registry = HTTP_CLIENTS if pooled else HttpClientRegistry()
+    client = SupabaseClient(endpoint, api_key, http_clients=registry)
+    begin = time.perf_counter()
+    try:
+        await client.call_api("/postgres/query", method="POST", json_data={"query": query})
+        return time.perf_counter() - begin
+    finally:
+        if not pooled:
+            await registry.aclose()
+
+
+async def run_path(endpoint: str, api_key: str, query: str, iterations: int, concurrency: int, pooled: bool) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> float:
+        async with semaphore:
+            return await run_query(endpoint, api_key, query, pooled)
+
+    return await asyncio.gather(*[one() for _ in range(iterations)])
+
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(p * (len(values) - 1))))
+    return values[index]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark execute_sql latency with and without pooled http clients")
+    parser.add_argument("--workspace-id", required=True)
+    parser.add_argument("--query", default="select 1")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=1)
+    args = parser.parse_args()
+
+    connection = await AidapClient().resolve_workspace_connection(args.workspace_id)
+
+    # warm up name resolution and the pooled connection
+    await run_query(connection.endpoint, connection.api_key, args.query, True)
+
+    print("{:<10}{:>12}{:>12}{:>12}{:>12}".format("path", "p50(ms)", "p95(ms)", "max(ms)", "queries/s"))
+    for path, pooled in (("fresh", False), ("registry", True)):
+        begin = time.perf_counter()
+        latencies = await run_path(
+            connection.endpoint, connection.api_key, args.query, args.iterations, args.concurrency, pooled
+        )
+        elapsed = time.perf_counter() - begin
+        print("{:<10}{:>12.1f}{:>12.1f}{:>12.1f}{:>12.1f}".format(
+            path,
+            statistics.median(latencies) * 1000,
+            percentile(latencies, 0.95) * 1000,
+            max(latencies) * 1000,
+            len(latencies) / elapsed,
+        ))
+
+    print(HTTP_CLIENTS.stats())
+    await HTTP_CLIENTS.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
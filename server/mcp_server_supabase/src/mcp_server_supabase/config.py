@@ -1,3 +1,10 @@
 import os
 
 VOLCENGINE_REGION = os.getenv("VOLCENGINE_REGION", "cn-beijing")
+WORKSPACE_CACHE_TTL_SECONDS = float(os.getenv("SUPABASE_WORKSPACE_CACHE_TTL", "300"))
+AIDAP_MAX_WORKERS = int(os.getenv("SUPABASE_AIDAP_MAX_WORKERS", "16"))
+AIDAP_API_CLIENT_CACHE_SIZE = int(os.getenv("SUPABASE_AIDAP_CLIENT_CACHE_SIZE", "64"))
+SQL_DEFAULT_MAX_ROWS = int(os.getenv("SUPABASE_SQL_MAX_ROWS", "1000"))
+SQL_DEFAULT_MAX_BYTES = int(os.getenv("SUPABASE_SQL_MAX_BYTES", str(256 * 1024)))
+SCHEMA_CACHE_TTL_SECONDS = float(os.getenv("SUPABASE_SCHEMA_CACHE_TTL", "600"))
+SCHEMA_CACHE_MAX_SNAPSHOTS = int(os.getenv("SUPABASE_SCHEMA_CACHE_MAX_SNAPSHOTS", "64"))
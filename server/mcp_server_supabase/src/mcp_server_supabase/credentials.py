@@ -1,4 +1,5 @@
 import base64
+import hashlib
 import json
 import os
 from dataclasses import dataclass
@@ -19,6 +20,12 @@ class VolcengineCredentials:
     access_key: str
     secret_key: str
     session_token: str
+    expires_at: float | None = None  # epoch seconds, STS credentials only
+
+    def cache_key(self) -> tuple[str, str]:
+        """Identifies the full credential (not just the access key) without holding the secret."""
+        secret_digest = hashlib.sha256(f"{self.secret_key}:{self.session_token}".encode("utf-8")).hexdigest()
+        return self.access_key, secret_digest
 
 
 def _get_env_value(*names: str) -> str:
@@ -33,22 +40,26 @@ def _normalize_iso8601(value: str) -> str:
     return value.replace("Z", "+00:00") if value.endswith("Z") else value
 
 
-def _validate_sts_time_window(payload: dict[str, Any]) -> None:
+def _validate_sts_time_window(payload: dict[str, Any]) -> float | None:
+    """Reject expired STS payloads and return the expiry as epoch seconds, if given."""
     current_time = payload.get("CurrentTime")
     expired_time = payload.get("ExpiredTime")
-    if not current_time or not expired_time:
-        return
-    current_dt = datetime.fromisoformat(_normalize_iso8601(str(current_time)))
+    if not expired_time:
+        return None
     expired_dt = datetime.fromisoformat(_normalize_iso8601(str(expired_time)))
+    if not current_time:
+        return expired_dt.timestamp()
+    current_dt = datetime.fromisoformat(_normalize_iso8601(str(current_time)))
     if current_dt > expired_dt:
         raise ValueError("STS token is expired")
+    return expired_dt.timestamp()
 
 
 def _parse_authorization_payload(raw_value: str) -> VolcengineCredentials:
     token = raw_value.split(" ", 1)[1] if " " in raw_value else raw_value
     decoded_bytes = base64.b64decode(token)
     payload = json.loads(decoded_bytes.decode("utf-8"))
-    _validate_sts_time_window(payload)
+    expires_at = _validate_sts_time_window(payload)
     access_key = str(payload.get("AccessKeyId") or "").strip()
     secret_key = str(payload.get("SecretAccessKey") or "").strip()
     session_token = str(payload.get("SessionToken") or "").strip()
@@ -58,6 +69,7 @@ def _parse_authorization_payload(raw_value: str) -> VolcengineCredentials:
         access_key=access_key,
         secret_key=secret_key,
         session_token=session_token,
+        expires_at=expires_at,
     )
 
 
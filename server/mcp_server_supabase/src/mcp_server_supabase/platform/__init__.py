@@ -1,4 +1,5 @@
 from .aidap_client import AidapClient
+from .http_clients import HTTP_CLIENTS
 from .supabase_client import SupabaseClient
 
-__all__ = ['AidapClient', 'SupabaseClient']
+__all__ = ['AidapClient', 'HTTP_CLIENTS', 'SupabaseClient']
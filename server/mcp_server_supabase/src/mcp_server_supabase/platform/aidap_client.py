@@ -1,12 +1,15 @@
 import logging
 import os
 import asyncio
+import functools
 import random
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 from urllib.parse import urlsplit
-from ..config import VOLCENGINE_REGION
-from ..credentials import resolve_volcengine_credentials
+from ..config import AIDAP_API_CLIENT_CACHE_SIZE, AIDAP_MAX_WORKERS, VOLCENGINE_REGION, WORKSPACE_CACHE_TTL_SECONDS
+from ..credentials import VolcengineCredentials, resolve_volcengine_credentials
+from .workspace_cache import WorkspaceConnection, WorkspaceConnectionCache
 from ..utils import pick_value
 
 logger = logging.getLogger(__name__)
@@ -43,28 +46,48 @@ except ImportError:
     raise
 
 
+# AIDAPApi is a blocking urllib3 client, its calls run here so they never stall the event loop
+_API_EXECUTOR = ThreadPoolExecutor(max_workers=AIDAP_MAX_WORKERS, thread_name_prefix="aidap")
+
+
+@functools.lru_cache(maxsize=AIDAP_API_CLIENT_CACHE_SIZE)
+def _build_api(credentials: VolcengineCredentials, region: str) -> AIDAPApi:
+    # one ApiClient (and its urllib3 connection pool) per credential, a refreshed STS token gets a new one
+    configuration = volcenginesdkcore.Configuration()
+    configuration.ak = credentials.access_key
+    configuration.sk = credentials.secret_key
+    configuration.region = region
+    if credentials.session_token:
+        configuration.session_token = credentials.session_token
+    api_client = volcenginesdkcore.ApiClient(configuration)
+    return AIDAPApi(api_client)
+
+
 class AidapClient:
-    def __init__(self, context_getter: Callable[[], Any] | None = None) -> None:
+    def __init__(
+        self,
+        context_getter: Callable[[], Any] | None = None,
+        connection_cache: WorkspaceConnectionCache | None = None,
+    ) -> None:
         self._context_getter = context_getter
+        self.connection_cache = connection_cache or WorkspaceConnectionCache(WORKSPACE_CACHE_TTL_SECONDS)
 
     def _get_credentials(self):
         return resolve_volcengine_credentials(self._context_getter)
 
     def _create_client(self) -> AIDAPApi:
-        credentials = self._get_credentials()
-        configuration = volcenginesdkcore.Configuration()
-        configuration.ak = credentials.access_key
-        configuration.sk = credentials.secret_key
-        configuration.region = VOLCENGINE_REGION
-        if credentials.session_token:
-            configuration.session_token = credentials.session_token
-        api_client = volcenginesdkcore.ApiClient(configuration)
-        return AIDAPApi(api_client)
+        return _build_api(self._get_credentials(), VOLCENGINE_REGION)
 
     @property
     def client(self) -> AIDAPApi:
         return self._create_client()
 
+    async def run_api(self, method_name: str, request: Any) -> Any:
+        # credentials come from the current request context, so resolve them before leaving the loop
+        method = getattr(self.client, method_name)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_API_EXECUTOR, method, request)
+
     def _branch_error_code(self, error_text: str) -> str:
         if "OperationDenied_BranchNotReady" in error_text:
             return "OperationDenied_BranchNotReady"
@@ -191,10 +214,44 @@ class AidapClient:
         jitter = random.uniform(0.0, delay * 0.2)
         await asyncio.sleep(delay + jitter)
     
+    def workspace_cache_key(self, workspace_id: str) -> tuple[str, str, str]:
+        return (*self._get_credentials().cache_key(), workspace_id)
+
+    async def resolve_workspace_connection(self, workspace_id: str) -> WorkspaceConnection:
+        """Resolve the default branch, endpoint and service key of a workspace, served from cache when possible."""
+
+        async def resolve() -> WorkspaceConnection:
+            branch_id = await self._describe_default_branch_id(workspace_id)
+            if not branch_id:
+                raise ValueError(f"Could not get endpoint for workspace {workspace_id}")
+            endpoint, api_key = await asyncio.gather(
+                self.get_endpoint(workspace_id, branch_id=branch_id),
+                self.get_api_key(workspace_id, "service_role", branch_id=branch_id),
+            )
+            if not endpoint:
+                raise ValueError(f"Could not get endpoint for workspace {workspace_id}")
+            if not api_key:
+                raise ValueError(f"Could not get API key for workspace {workspace_id}")
+            return WorkspaceConnection(branch_id=branch_id, endpoint=endpoint, api_key=api_key)
+
+        credentials = self._get_credentials()
+        return await self.connection_cache.get_or_resolve(
+            (*credentials.cache_key(), workspace_id), resolve, expires_at=credentials.expires_at
+        )
+
+    def invalidate_workspace(self, workspace_id: str) -> None:
+        self.connection_cache.invalidate(workspace_id)
+
     async def get_default_branch_id(self, workspace_id: str) -> Optional[str]:
+        cached = self.connection_cache.peek(self.workspace_cache_key(workspace_id))
+        if cached is not None:
+            return cached.branch_id
+        return await self._describe_default_branch_id(workspace_id)
+
+    async def _describe_default_branch_id(self, workspace_id: str) -> Optional[str]:
         try:
             request = DescribeBranchesRequest(workspace_id=workspace_id)
-            response = self.client.describe_branches(request)
+            response = await self.run_api("describe_branches", request)
             
             if hasattr(response, 'branches') and response.branches:
                 for branch in response.branches:
@@ -212,7 +269,7 @@ class AidapClient:
     async def list_branches(self, workspace_id: str) -> list[dict]:
         try:
             request = DescribeBranchesRequest(workspace_id=workspace_id)
-            response = self.client.describe_branches(request)
+            response = await self.run_api("describe_branches", request)
 
             branches = []
             if hasattr(response, 'branches') and response.branches:
@@ -229,7 +286,8 @@ class AidapClient:
                 workspace_id=workspace_id,
                 branch_settings=BranchSettingsForCreateBranchInput(name=name),
             )
-            response = self.client.create_branch(request)
+            response = await self.run_api("create_branch", request)
+            self.invalidate_workspace(workspace_id)
 
             branch_id = getattr(response, 'branch_id', None)
             if not branch_id and hasattr(response, 'branch'):
@@ -287,7 +345,7 @@ class AidapClient:
             agent_plan_api_key = agent_plan_api_key or os.getenv("ARK_AGENT_PLAN_API_KEY")
             if agent_plan_api_key:
                 request.agent_plan_api_key = agent_plan_api_key
-            response = self.client.create_workspace(request)
+            response = await self.run_api("create_workspace", request)
 
             workspace_id = getattr(response, 'workspace_id', None)
             if not workspace_id and hasattr(response, 'workspace'):
@@ -310,7 +368,7 @@ class AidapClient:
     async def get_workspace_detail(self, workspace_id: str) -> Optional[Any]:
         try:
             request = DescribeWorkspaceDetailRequest(workspace_id=workspace_id)
-            response = self.client.describe_workspace_detail(request)
+            response = await self.run_api("describe_workspace_detail", request)
             return getattr(response, "workspace", None)
         except Exception as e:
             logger.error(f"Error getting workspace detail: {e}")
@@ -330,7 +388,7 @@ class AidapClient:
         if service_type:
             request_kwargs["service_type"] = service_type
         request = DescribeComputesRequest(**request_kwargs)
-        response = self.client.describe_computes(request)
+        response = await self.run_api("describe_computes", request)
         computes = []
         for compute in getattr(response, "computes", []) or []:
             computes.append(compute.to_dict() if hasattr(compute, "to_dict") else compute)
@@ -355,7 +413,7 @@ class AidapClient:
             if service_type:
                 request_kwargs["service_type"] = service_type
             request = ModifyComputeSettingsRequest(**request_kwargs)
-            self.client.modify_compute_settings(request)
+            await self.run_api("modify_compute_settings", request)
             return {"success": True, "workspace_id": workspace_id}
         except Exception as e:
             logger.error(f"Error modifying compute settings: {e}")
@@ -393,7 +451,7 @@ class AidapClient:
         if offset is not None:
             request_kwargs["offset"] = offset
         request = DescribeDatabasesRequest(**request_kwargs)
-        response = self.client.describe_databases(request)
+        response = await self.run_api("describe_databases", request)
         databases = []
         for database in getattr(response, "databases", []) or []:
             databases.append(database.to_dict() if hasattr(database, "to_dict") else database)
@@ -419,7 +477,7 @@ class AidapClient:
             if database_desc:
                 request_kwargs["database_desc"] = database_desc
             request = CreateDatabaseRequest(**request_kwargs)
-            response = self.client.create_database(request)
+            response = await self.run_api("create_database", request)
             database = getattr(response, "database", None)
             return {
                 "success": True,
@@ -446,7 +504,7 @@ class AidapClient:
         if offset is not None:
             request_kwargs["offset"] = offset
         request = DescribeDBAccountsRequest(**request_kwargs)
-        response = self.client.describe_db_accounts(request)
+        response = await self.run_api("describe_db_accounts", request)
         accounts = []
         for account in getattr(response, "accounts", []) or []:
             accounts.append(account.to_dict() if hasattr(account, "to_dict") else account)
@@ -471,7 +529,7 @@ class AidapClient:
             if account_desc:
                 request_kwargs["account_desc"] = account_desc
             request = CreateDBAccountRequest(**request_kwargs)
-            response = self.client.create_db_account(request)
+            response = await self.run_api("create_db_account", request)
             account = getattr(response, "account", None)
             return {
                 "success": True,
@@ -505,13 +563,13 @@ class AidapClient:
         if address_id:
             request_kwargs["address_id"] = address_id
         request = DescribeDBAccountConnectionRequest(**request_kwargs)
-        response = self.client.describe_db_account_connection(request)
+        response = await self.run_api("describe_db_account_connection", request)
         return response.to_dict() if hasattr(response, "to_dict") else response
 
     async def start_workspace(self, workspace_id: str) -> dict:
         try:
             request = StartWorkspaceRequest(workspace_id=workspace_id)
-            self.client.start_workspace(request)
+            await self.run_api("start_workspace", request)
             return {"success": True, "workspace_id": workspace_id, "status": "starting"}
         except Exception as e:
             logger.error(f"Error starting workspace: {e}")
@@ -520,7 +578,7 @@ class AidapClient:
     async def stop_workspace(self, workspace_id: str) -> dict:
         try:
             request = StopWorkspaceRequest(workspace_id=workspace_id)
-            self.client.stop_workspace(request)
+            await self.run_api("stop_workspace", request)
             return {"success": True, "workspace_id": workspace_id, "status": "stopping"}
         except Exception as e:
             logger.error(f"Error stopping workspace: {e}")
@@ -534,7 +592,8 @@ class AidapClient:
                     workspace_id=workspace_id,
                     branch_id=branch_id,
                 )
-                self.client.delete_branch(request)
+                await self.run_api("delete_branch", request)
+                self.invalidate_workspace(workspace_id)
                 return {"success": True}
             except Exception as e:
                 error_text = str(e)
@@ -568,7 +627,7 @@ class AidapClient:
                 workspace_id=workspace_id,
                 branch_id=branch_id
             )
-            response = self.client.describe_workspace_endpoint(request)
+            response = await self.run_api("describe_workspace_endpoint", request)
 
             if hasattr(response, 'endpoints') and response.endpoints:
                 candidates: list[tuple[tuple[int, int, int], str]] = []
@@ -613,7 +672,8 @@ class AidapClient:
                         time=time,
                     ),
                 )
-                response = self.client.branch_restore(request)
+                response = await self.run_api("branch_restore", request)
+                self.invalidate_workspace(workspace_id)
                 return {
                     "success": True,
                     "workspace_id": workspace_id,
@@ -655,7 +715,7 @@ class AidapClient:
                 workspace_id=workspace_id,
                 branch_id=branch_id
             )
-            response = self.client.describe_api_keys(request)
+            response = await self.run_api("describe_api_keys", request)
 
             if hasattr(response, 'api_keys') and response.api_keys:
                 type_mapping = {
@@ -689,7 +749,7 @@ class AidapClient:
             request_kwargs["branch_id"] = branch_id
 
         request = DescribeAPIKeysRequest(**request_kwargs)
-        response = self.client.describe_api_keys(request)
+        response = await self.run_api("describe_api_keys", request)
 
         keys = []
         if hasattr(response, 'api_keys') and response.api_keys:
@@ -0,0 +1,99 @@
+import asyncio
+import importlib.util
+import logging
+import os
+import weakref
+from collections import defaultdict
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+HTTP2_ENABLED = _env_bool("SUPABASE_HTTP2", True)
+HTTP_MAX_CONNECTIONS = int(os.getenv("SUPABASE_HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("SUPABASE_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("SUPABASE_HTTP_KEEPALIVE_EXPIRY", "60"))
+
+
+class HttpClientRegistry:
+    """One pooled httpx.AsyncClient per Supabase endpoint, shared by every SupabaseClient.
+
+    Clients are bound to the event loop that created them, so the registry keeps a separate
+    set per loop. Each request reports through the httpcore trace extension whether it opened
+    a new connection, which gives the connection-reuse metric in stats().
+    """
+
+    def __init__(
+        self,
+        http2: bool = HTTP2_ENABLED,
+        max_connections: int = HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY,
+    ) -> None:
+        # HTTP/2 needs the optional h2 package, fall back to HTTP/1.1 keep-alive without it
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._metrics: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def get(self, endpoint: str) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        clients = self._clients.setdefault(loop, {})
+        client = clients.get(endpoint)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(http2=self.http2, limits=self.limits)
+            clients[endpoint] = client
+        return client
+
+    def trace(self, endpoint: str):
+        self._metrics[endpoint]["requests"] += 1
+
+        async def trace(event_name: str, info: dict) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                self._metrics[endpoint]["new_connections"] += 1
+
+        return trace
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        clients = self._clients.pop(loop, {})
+        for endpoint, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning("Error closing http client for %s: %s", endpoint, e)
+
+    def stats(self) -> dict:
+        endpoints = {}
+        for endpoint, metrics in self._metrics.items():
+            requests = metrics["requests"]
+            new_connections = metrics["new_connections"]
+            endpoints[endpoint] = {
+                "requests": requests,
+                "new_connections": new_connections,
+                "reused_connections": max(requests - new_connections, 0),
+                "reuse_ratio": round(1 - new_connections / requests, 4) if requests else 0.0,
+            }
+        return {
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "endpoints": endpoints,
+        }
+
+
+HTTP_CLIENTS = HttpClientRegistry()
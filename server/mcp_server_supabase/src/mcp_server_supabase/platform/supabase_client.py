@@ -4,6 +4,8 @@ import logging
 import json
 from typing import Dict, Any, Optional
 
+from .http_clients import HTTP_CLIENTS, HttpClientRegistry
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,9 +29,10 @@ class SupabaseApiError(Exception):
 
 
 class SupabaseClient:
-    def __init__(self, endpoint: str, api_key: str):
+    def __init__(self, endpoint: str, api_key: str, http_clients: Optional[HttpClientRegistry] = None):
         self.endpoint = endpoint
         self.api_key = api_key
+        self.http_clients = http_clients or HTTP_CLIENTS
 
     async def call_api(
         self,
@@ -53,20 +56,18 @@ class SupabaseClient:
 
         for attempt in range(3):
             try:
-                async with httpx.AsyncClient(
-                    timeout=timeout,
-                    limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-                ) as client:
-                    if content:
-                        response = await client.request(
-                            method, url, content=content, headers=default_headers,
-                            params=params, timeout=timeout
-                        )
-                    else:
-                        response = await client.request(
-                            method, url, json=json_data, headers=default_headers,
-                            params=params, timeout=timeout
-                        )
+                client = self.http_clients.get(self.endpoint)
+                extensions = {"trace": self.http_clients.trace(self.endpoint)}
+                if content:
+                    response = await client.request(
+                        method, url, content=content, headers=default_headers,
+                        params=params, timeout=timeout, extensions=extensions
+                    )
+                else:
+                    response = await client.request(
+                        method, url, json=json_data, headers=default_headers,
+                        params=params, timeout=timeout, extensions=extensions
+                    )
                 response.raise_for_status()
 
                 if response.status_code == 204 or not response.content:
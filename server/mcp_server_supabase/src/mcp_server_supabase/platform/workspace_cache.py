@@ -0,0 +1,116 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class WorkspaceConnection:
+    branch_id: str
+    endpoint: str
+    api_key: str
+
+
+# (access key, digest of secret key and session token, workspace id)
+CacheKey = tuple[str, str, str]
+
+
+class WorkspaceConnectionCache:
+    """Caches the default branch, endpoint and service key of a workspace.
+
+    Entries are keyed by the full credentials (access key plus a digest of secret key and session token)
+    and the workspace id, so a caller presenting a known access key with another secret never gets the
+    service key cached for it. Entries resolved with STS credentials expire with them. Concurrent misses for the same key share a single resolution, and
+    invalidating a workspace discards both its entries and any resolution still in flight.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[CacheKey, tuple[float, WorkspaceConnection]] = {}
+        self._inflight: dict[CacheKey, asyncio.Task] = {}
+        self._generations: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.shared_misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def peek(self, key: CacheKey) -> Optional[WorkspaceConnection]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        deadline, connection = entry
+        if deadline <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return connection
+
+    async def get_or_resolve(
+        self,
+        key: CacheKey,
+        resolver: Callable[[], Awaitable[WorkspaceConnection]],
+        expires_at: float | None = None,
+    ) -> WorkspaceConnection:
+        if not self.enabled:
+            return await resolver()
+
+        connection = self.peek(key)
+        if connection is not None:
+            self.hits += 1
+            return connection
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.shared_misses += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._resolve(key, resolver, expires_at))
+            self._inflight[key] = task
+        # a cancelled caller must not cancel the resolution shared with other callers
+        return await asyncio.shield(task)
+
+    async def _resolve(
+        self,
+        key: CacheKey,
+        resolver: Callable[[], Awaitable[WorkspaceConnection]],
+        expires_at: float | None,
+    ) -> WorkspaceConnection:
+        workspace_id = key[-1]
+        generation = self._generations.get(workspace_id, 0)
+        try:
+            connection = await resolver()
+            ttl = self.ttl_seconds
+            if expires_at is not None:
+                ttl = min(ttl, expires_at - time.time())
+            if ttl > 0 and self._generations.get(workspace_id, 0) == generation:
+                self._entries[key] = (time.monotonic() + ttl, connection)
+            return connection
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                self._inflight.pop(key, None)
+
+    def invalidate(self, workspace_id: str) -> None:
+        self._generations[workspace_id] = self._generations.get(workspace_id, 0) + 1
+        for key in [key for key in self._entries if key[-1] == workspace_id]:
+            self._entries.pop(key, None)
+        for key in [key for key in self._inflight if key[-1] == workspace_id]:
+            self._inflight.pop(key, None)
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared_misses": self.shared_misses,
+            "invalidations": self.invalidations,
+        }
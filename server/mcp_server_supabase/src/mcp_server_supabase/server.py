@@ -3,6 +3,9 @@ import logging
 import os
 from dataclasses import dataclass
 
+import anyio
+
+from .platform import HTTP_CLIENTS
 from .runtime import create_runtime
 from .tool_registry import register_tools
 from .access_policy import AccessPolicy, build_access_policy
@@ -93,6 +96,23 @@ def create_mcp(config: ServerConfig) -> ScopedFastMCP:
     return mcp
 
 
+async def _serve(mcp: ScopedFastMCP, transport: str) -> None:
+    try:
+        if transport == "sse":
+            await mcp.run_sse_async()
+        elif transport == "streamable-http":
+            await mcp.run_streamable_http_async()
+        else:
+            await mcp.run_stdio_async()
+    finally:
+        # close the pooled data plane connections on shutdown
+        await HTTP_CLIENTS.aclose()
+
+
+def serve(mcp: ScopedFastMCP, transport: str = "stdio") -> None:
+    anyio.run(_serve, mcp, transport)
+
+
 def run_server(
     transport: str = "stdio",
     port: int | None = None,
@@ -110,7 +130,7 @@ def run_server(
         read_only=read_only,
         disabled_tools=disabled_tools,
     )
-    create_mcp(config).run(transport=transport)
+    serve(create_mcp(config), transport)
 
 
 def main() -> None:
@@ -156,7 +176,7 @@ def main() -> None:
             config.streamable_http_path,
         )
 
-    create_mcp(config).run(transport=args.transport)
+    serve(create_mcp(config), args.transport)
 
 
 if __name__ == "__main__":
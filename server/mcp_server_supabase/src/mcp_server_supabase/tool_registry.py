@@ -136,9 +136,31 @@ def _build_get_storage_config(runtime: SupabaseRuntime):
 def _build_execute_sql(runtime: SupabaseRuntime):
     database_tools = runtime.database_tools
 
-    async def execute_sql(query: str, workspace_id: str = None) -> str:
-        """Executes raw SQL in the Postgres database."""
-        return await database_tools.execute_sql(query, workspace_id)
+    async def execute_sql(
+        query: str,
+        workspace_id: str = None,
+        max_rows: int = None,
+        max_bytes: int = None,
+        continuation_token: str = None,
+        columnar: bool = False,
+    ) -> str:
+        """Executes raw SQL in the Postgres database.
+
+        Results that exceed max_rows or max_bytes are truncated and returned with truncation metadata.
+        For a single read-only statement with a top-level ORDER BY, the response also includes a
+        next_continuation_token. To get the following page, call again with the same query and that token.
+        Unordered results cannot be resumed, since their row order may change between calls. A page always
+        holds at least one row; oversized_row is set when that row alone exceeds max_bytes.
+
+        Args:
+            query: The SQL to execute
+            workspace_id: The workspace ID
+            max_rows: Maximum rows to return per page; 0 disables the limit. Defaults to SUPABASE_SQL_MAX_ROWS
+            max_bytes: Maximum JSON bytes of rows per page; 0 disables the limit. Defaults to SUPABASE_SQL_MAX_BYTES
+            continuation_token: Token from a previous truncated response of the same query
+            columnar: Return column names once followed by arrays of values instead of one object per row
+        """
+        return await database_tools.execute_sql(query, workspace_id, max_rows, max_bytes, continuation_token, columnar)
 
     return execute_sql
 
@@ -14,12 +14,5 @@ class BaseTools:
         return resolved_workspace_id
 
     async def _get_client(self, workspace_id: str) -> SupabaseClient:
-        endpoint = await self.aidap.get_endpoint(workspace_id)
-        if not endpoint:
-            raise ValueError(f"Could not get endpoint for workspace {workspace_id}")
-
-        api_key = await self.aidap.get_api_key(workspace_id, "service_role")
-        if not api_key:
-            raise ValueError(f"Could not get API key for workspace {workspace_id}")
-
-        return SupabaseClient(endpoint, api_key)
+        connection = await self.aidap.resolve_workspace_connection(workspace_id)
+        return SupabaseClient(connection.endpoint, connection.api_key)
@@ -1,13 +1,91 @@
-from typing import Optional, List
+from typing import Any, Optional, List
+import base64
+import binascii
+import hashlib
+import json
 import logging
+import re
 from datetime import datetime, timezone
 from .base import BaseTools
+from .schema_snapshot import SYSTEM_SCHEMAS, SchemaSnapshot, SchemaSnapshotCache
+from ..config import SCHEMA_CACHE_MAX_SNAPSHOTS, SCHEMA_CACHE_TTL_SECONDS, SQL_DEFAULT_MAX_BYTES, SQL_DEFAULT_MAX_ROWS
+from ..platform import AidapClient
 from ..utils import handle_errors
 
 logger = logging.getLogger(__name__)
 
+_LEADING_COMMENTS = re.compile(r"^(\s*(--[^\n]*(\n|$)|/\*.*?\*/))*\s*", re.DOTALL)
+_PAGEABLE_PREFIXES = ("select", "with", "values", "table", "(")
+_NON_PAGEABLE_KEYWORDS = re.compile(
+    r"\b(insert|update|delete|merge|into|for\s+update|for\s+share|for\s+no\s+key\s+update|for\s+key\s+share)\b",
+    re.IGNORECASE,
+)
+
+# String literals, quoted identifiers, comments and dollar-quoted bodies are matched whole so that
+# their contents are never mistaken for parentheses or keywords.
+_SQL_TOKENS = re.compile(
+    r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|--[^\n]*|/\*.*?\*/|(\$[A-Za-z0-9_]*\$).*?\1|[()]|[A-Za-z_][A-Za-z0-9_$]*""",
+    re.DOTALL,
+)
+
+
+def _has_top_level_order_by(statement: str) -> bool:
+    """Whether the statement itself is ordered, not just a subquery or window inside it."""
+    depth = 0
+    previous_word = None
+    for match in _SQL_TOKENS.finditer(statement):
+        token = match.group(0)
+        if token == "(":
+            depth += 1
+            previous_word = None
+        elif token == ")":
+            depth -= 1
+            previous_word = None
+        elif depth == 0 and (token[0].isalpha() or token[0] == "_"):
+            word = token.lower()
+            if word == "by" and previous_word == "order":
+                return True
+            previous_word = word
+    return False
+
+
+def _query_fingerprint(query: str) -> str:
+    return hashlib.sha256(" ".join(query.split()).encode("utf-8")).hexdigest()[:16]
+
+
+def _encode_continuation_token(query: str, offset: int) -> str:
+    payload = json.dumps({"q": _query_fingerprint(query), "o": offset}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_continuation_token(token: str, query: str) -> int:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        offset = int(payload["o"])
+        fingerprint = payload["q"]
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid continuation_token") from e
+    if fingerprint != _query_fingerprint(query) or offset < 0:
+        raise ValueError("continuation_token does not belong to this query")
+    return offset
+
 
 class DatabaseTools(BaseTools):
+    def __init__(self, aidap_client: AidapClient, schema_cache: Optional[SchemaSnapshotCache] = None):
+        super().__init__(aidap_client)
+        self.schema_cache = schema_cache or SchemaSnapshotCache(SCHEMA_CACHE_TTL_SECONDS, SCHEMA_CACHE_MAX_SNAPSHOTS)
+
+    async def _schema_snapshot(self, workspace_id: Optional[str]) -> SchemaSnapshot:
+        ws_id = self._resolve_workspace_id(workspace_id)
+        return await self.schema_cache.get(
+            self.aidap.workspace_cache_key(ws_id),
+            lambda sql: self._execute_sql_raw(sql, ws_id),
+        )
+
+    def _snapshot_covers(self, schemas: List[str]) -> bool:
+        # without the cache, the per-schema catalog queries are cheaper than a full snapshot
+        return self.schema_cache.enabled and not any(schema in SYSTEM_SCHEMAS for schema in schemas)
+
     async def _execute_sql_raw(self, query: str, workspace_id: Optional[str] = None) -> List[dict]:
         if not query or not query.strip():
             raise ValueError("SQL query cannot be empty")
@@ -29,6 +107,105 @@ class DatabaseTools(BaseTools):
         logger.debug(f"SQL query returned {len(result)} rows")
         return result
 
+    def _pageable_query(self, query: str) -> Optional[str]:
+        """Return the query without trailing semicolons if it is a single read-only statement that can be
+        wrapped in a LIMIT/OFFSET subquery, otherwise None."""
+        statement = query.strip().rstrip(";").rstrip()
+        body = _LEADING_COMMENTS.sub("", statement, count=1)
+        if ";" in statement or not body.lower().startswith(_PAGEABLE_PREFIXES):
+            return None
+        if _NON_PAGEABLE_KEYWORDS.search(body):
+            return None
+        return statement
+
+    def _to_columnar(self, rows: List[dict]) -> dict:
+        columns: list[str] = []
+        seen = set()
+        for row in rows:
+            for name in row:
+                if name not in seen:
+                    seen.add(name)
+                    columns.append(name)
+        return {"columns": columns, "rows": [[row.get(name) for name in columns] for row in rows]}
+
+    async def _execute_sql_page(
+        self,
+        query: str,
+        workspace_id: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        continuation_token: Optional[str] = None,
+        columnar: bool = False,
+    ) -> dict[str, Any]:
+        if not query or not query.strip():
+            raise ValueError("SQL query cannot be empty")
+        max_rows = SQL_DEFAULT_MAX_ROWS if max_rows is None else max_rows
+        max_bytes = SQL_DEFAULT_MAX_BYTES if max_bytes is None else max_bytes
+        if max_rows < 0 or max_bytes < 0:
+            raise ValueError("max_rows and max_bytes must not be negative")
+
+        statement = self._pageable_query(query)
+        # without a top-level ORDER BY Postgres may return rows in a different order on every call
+        resumable = statement is not None and _has_top_level_order_by(statement)
+        offset = _decode_continuation_token(continuation_token, query) if continuation_token else 0
+        if offset and statement is None:
+            raise ValueError("continuation_token is only supported for single read-only statements")
+        if offset and not resumable:
+            raise ValueError("continuation_token is only supported for statements with a top-level ORDER BY")
+
+        truncation_reason = None
+        if statement is not None and (max_rows or offset):
+            # fetch one extra row to learn whether another page exists without counting the whole result
+            paged_query = f"SELECT * FROM (\n{statement}\n) AS _mcp_page"
+            if max_rows:
+                paged_query += f" LIMIT {max_rows + 1}"
+            if offset:
+                paged_query += f" OFFSET {offset}"
+            rows = await self._execute_sql_raw(paged_query, workspace_id)
+        else:
+            rows = await self._execute_sql_raw(query, workspace_id)
+            if statement is None:
+                # anything that is not a plain read may have changed the schema
+                self.schema_cache.invalidate(self._resolve_workspace_id(workspace_id))
+        if max_rows and len(rows) > max_rows:
+            rows = rows[:max_rows]
+            truncation_reason = "max_rows"
+
+        oversized_row = False
+        if max_bytes:
+            used_bytes = 2
+            for index, row in enumerate(rows):
+                used_bytes += len(json.dumps(row, ensure_ascii=False, default=str).encode("utf-8")) + 1
+                if used_bytes > max_bytes:
+                    # the first row is returned even when it alone exceeds max_bytes, so paging always advances
+                    oversized_row = index == 0
+                    index = max(index, 1)
+                    if index < len(rows):
+                        rows = rows[:index]
+                        truncation_reason = "max_bytes"
+                    break
+
+        payload: dict[str, Any] = self._to_columnar(rows) if columnar else {"rows": rows}
+        payload.update({
+            "row_count": len(rows),
+            "offset": offset,
+            "truncated": truncation_reason is not None,
+        })
+        if oversized_row:
+            payload["oversized_row"] = True
+        if truncation_reason is not None:
+            payload["truncation_reason"] = truncation_reason
+            if resumable:
+                payload["next_continuation_token"] = _encode_continuation_token(query, offset + len(rows))
+            elif statement is not None:
+                payload["note"] = (
+                    "The result is unordered and cannot be resumed; add a top-level ORDER BY on a unique key "
+                    "to page through it, or narrow it with LIMIT/WHERE"
+                )
+            else:
+                payload["note"] = "The statement cannot be paged; narrow it with LIMIT/WHERE to see the remaining rows"
+        return payload
+
     def _normalize_schemas(self, schemas: Optional[List[str]] = None) -> List[str]:
         normalized = [schema.strip() for schema in (schemas or ["public"]) if schema and schema.strip()]
         if not normalized:
@@ -39,12 +216,29 @@ class DatabaseTools(BaseTools):
         return normalized
 
     @handle_errors
-    async def execute_sql(self, query: str, workspace_id: Optional[str] = None) -> List[dict]:
-        return await self._execute_sql_raw(query, workspace_id)
+    async def execute_sql(
+        self,
+        query: str,
+        workspace_id: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        continuation_token: Optional[str] = None,
+        columnar: bool = False,
+    ) -> Any:
+        page = await self._execute_sql_page(query, workspace_id, max_rows, max_bytes, continuation_token, columnar)
+        if page["truncated"] or continuation_token or columnar:
+            return page
+        # results that fit in the budgets keep the plain row list
+        return page["rows"]
     
     @handle_errors
     async def list_tables(self, schemas: List[str] = None, workspace_id: Optional[str] = None) -> List[dict]:
-        schema_list = "', '".join(self._normalize_schemas(schemas))
+        normalized_schemas = self._normalize_schemas(schemas)
+        if self._snapshot_covers(normalized_schemas):
+            snapshot = await self._schema_snapshot(workspace_id)
+            return snapshot.tables_in(normalized_schemas)
+
+        schema_list = "', '".join(normalized_schemas)
         query = f"""
         SELECT
             schemaname as schema,
@@ -58,42 +252,20 @@ class DatabaseTools(BaseTools):
     
     @handle_errors
     async def list_migrations(self, workspace_id: Optional[str] = None) -> List[dict]:
-        existence_rows = await self._execute_sql_raw(
-            """
-            SELECT EXISTS (
-                SELECT 1
-                FROM information_schema.tables
-                WHERE table_schema = 'supabase_migrations'
-                  AND table_name = 'schema_migrations'
-            ) AS exists
-            """,
-            workspace_id,
-        )
-        exists = bool(existence_rows and existence_rows[0].get("exists"))
-        if not exists:
-            return []
-        return await self._execute_sql_raw(
-            """
-            SELECT version, name
-            FROM supabase_migrations.schema_migrations
-            ORDER BY version DESC
-            """,
-            workspace_id,
+        ws_id = self._resolve_workspace_id(workspace_id)
+        return await self.schema_cache.get_migrations(
+            self.aidap.workspace_cache_key(ws_id),
+            lambda sql: self._execute_sql_raw(sql, ws_id),
         )
 
     @handle_errors
     async def list_extensions(self, workspace_id: Optional[str] = None) -> List[dict]:
-        query = """
-        SELECT
-            e.extname AS name,
-            n.nspname AS schema,
-            e.extversion AS version
-        FROM pg_extension e
-        JOIN pg_namespace n ON n.oid = e.extnamespace
-        ORDER BY e.extname
-        """
-        return await self._execute_sql_raw(query, workspace_id)
-    
+        ws_id = self._resolve_workspace_id(workspace_id)
+        return await self.schema_cache.get_extensions(
+            self.aidap.workspace_cache_key(ws_id),
+            lambda sql: self._execute_sql_raw(sql, ws_id),
+        )
+
     @handle_errors
     async def apply_migration(self, name: str, query: str, workspace_id: Optional[str] = None) -> dict:
         if not name or not name.strip():
@@ -117,7 +289,10 @@ class DatabaseTools(BaseTools):
         ON CONFLICT (version) DO UPDATE SET name = EXCLUDED.name;
         COMMIT;
         """
-        await self._execute_sql_raw(migration_sql, workspace_id)
+        try:
+            await self._execute_sql_raw(migration_sql, workspace_id)
+        finally:
+            self.schema_cache.invalidate(self._resolve_workspace_id(workspace_id))
         return {
             "success": True,
             "message": f"Migration {name} applied successfully",
@@ -164,7 +339,16 @@ class DatabaseTools(BaseTools):
         schemas: List[str] = None,
         workspace_id: Optional[str] = None
     ) -> str:
-        schema_list = "', '".join(self._normalize_schemas(schemas))
+        normalized_schemas = self._normalize_schemas(schemas)
+        if self._snapshot_covers(normalized_schemas):
+            snapshot = await self._schema_snapshot(workspace_id)
+            columns = snapshot.columns_in(normalized_schemas)
+        else:
+            columns = await self._query_columns(normalized_schemas, workspace_id)
+        return self._render_typescript_types(columns)
+
+    async def _query_columns(self, schemas: List[str], workspace_id: Optional[str]) -> List[dict]:
+        schema_list = "', '".join(schemas)
         query = f"""
         SELECT
             table_schema,
@@ -179,8 +363,9 @@ class DatabaseTools(BaseTools):
         WHERE table_schema IN ('{schema_list}')
         ORDER BY table_schema, table_name, ordinal_position
         """
-        columns = await self._execute_sql_raw(query, workspace_id)
+        return await self._execute_sql_raw(query, workspace_id)
 
+    def _render_typescript_types(self, columns: List[dict]) -> str:
         grouped: dict[str, dict[str, list[dict]]] = {}
         for column in columns:
             schema_name = column.get("table_schema")
@@ -0,0 +1,233 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+# Schemas whose columns are left out of the snapshot; introspection of them queries the catalog directly.
+SYSTEM_SCHEMAS = ("pg_catalog", "information_schema", "pg_toast")
+
+# The migrations table may not exist, so its latest version is read through query_to_xml, which only
+# plans the inner statement when the CASE branch is taken.
+MIGRATION_VERSION_SQL = """
+CASE WHEN to_regclass('supabase_migrations.schema_migrations') IS NULL THEN NULL
+ELSE (xpath(
+    '/row/v/text()',
+    query_to_xml('SELECT max(version) AS v FROM supabase_migrations.schema_migrations', false, true, '')
+))[1]::text
+END
+"""
+
+PROBE_SQL = f"""
+SELECT
+    to_regclass('supabase_migrations.schema_migrations') IS NOT NULL AS has_migrations,
+    {MIGRATION_VERSION_SQL} AS migration_version
+"""
+
+SNAPSHOT_SQL = f"""
+SELECT
+    to_regclass('supabase_migrations.schema_migrations') IS NOT NULL AS has_migrations,
+    {MIGRATION_VERSION_SQL} AS migration_version,
+    (
+        SELECT coalesce(json_agg(json_build_object('schema', schemaname, 'name', tablename)
+                                 ORDER BY schemaname, tablename), '[]'::json)
+        FROM pg_tables
+    ) AS tables,
+    (
+        SELECT coalesce(json_agg(json_build_object(
+                   'table_schema', table_schema,
+                   'table_name', table_name,
+                   'column_name', column_name,
+                   'is_nullable', is_nullable,
+                   'is_identity', is_identity,
+                   'data_type', data_type,
+                   'udt_name', udt_name,
+                   'column_default', column_default
+               ) ORDER BY table_schema, table_name, ordinal_position), '[]'::json)
+        FROM information_schema.columns
+        WHERE table_schema NOT IN ('{"', '".join(SYSTEM_SCHEMAS)}')
+    ) AS columns,
+    (
+        SELECT coalesce(json_agg(json_build_object('name', e.extname, 'schema', n.nspname, 'version', e.extversion)
+                                 ORDER BY e.extname), '[]'::json)
+        FROM pg_extension e
+        JOIN pg_namespace n ON n.oid = e.extnamespace
+    ) AS extensions
+"""
+
+MIGRATIONS_SQL = """
+SELECT version, name
+FROM supabase_migrations.schema_migrations
+ORDER BY version DESC
+"""
+
+EXTENSIONS_SQL = """
+SELECT
+    e.extname AS name,
+    n.nspname AS schema,
+    e.extversion AS version
+FROM pg_extension e
+JOIN pg_namespace n ON n.oid = e.extnamespace
+ORDER BY e.extname
+"""
+
+SqlRunner = Callable[[str], Awaitable[list[dict]]]
+# (access key, digest of secret key and session token, workspace id)
+CacheKey = tuple[str, str, str]
+
+
+def _as_list(value: Any) -> list:
+    # pg-meta returns json columns either decoded or as text depending on the driver
+    if isinstance(value, str):
+        value = json.loads(value)
+    return value or []
+
+
+@dataclass(slots=True)
+class SchemaSnapshot:
+    has_migrations: bool
+    migration_version: Optional[str]
+    tables: list[dict]
+    columns: list[dict]
+    extensions: list[dict]
+    built_at: float = field(default_factory=time.monotonic)
+    migrations: Optional[list[dict]] = None
+
+    def tables_in(self, schemas: list[str]) -> list[dict]:
+        return [table for table in self.tables if table.get("schema") in schemas]
+
+    def columns_in(self, schemas: list[str]) -> list[dict]:
+        return [column for column in self.columns if column.get("table_schema") in schemas]
+
+
+class SchemaSnapshotCache:
+    """Per-workspace snapshot of the catalog data behind the introspection tools.
+
+    A snapshot is built with a single batched catalog query. Every read first runs a one-row probe of the
+    latest supabase_migrations version and rebuilds the snapshot when it changed, so migrations applied
+    by other clients are picked up. apply_migration and schema-changing execute_sql calls invalidate the
+    snapshot directly. Snapshots also expire after ttl_seconds to catch DDL that bypasses migrations.
+
+    At most max_snapshots snapshots are kept, least recently used first out. A key's build lock only
+    lives while its snapshot is cached or a call for it is in flight. With ttl_seconds <= 0 the cache is
+    disabled and callers query the catalog directly.
+    """
+
+    def __init__(self, ttl_seconds: float, max_snapshots: int = 64) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_snapshots = max_snapshots
+        self._snapshots: OrderedDict[CacheKey, SchemaSnapshot] = OrderedDict()
+        # key -> (build lock, number of calls using it)
+        self._locks: dict[CacheKey, tuple[asyncio.Lock, int]] = {}
+        self.hits = 0
+        self.builds = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_snapshots > 0
+
+    def _acquire_lock(self, key: CacheKey) -> asyncio.Lock:
+        lock, users = self._locks.get(key) or (asyncio.Lock(), 0)
+        self._locks[key] = (lock, users + 1)
+        return lock
+
+    def _release_lock(self, key: CacheKey) -> None:
+        lock, users = self._locks[key]
+        if users > 1 or key in self._snapshots:
+            self._locks[key] = (lock, users - 1)
+        else:
+            del self._locks[key]
+
+    def _drop(self, key: CacheKey) -> None:
+        self._snapshots.pop(key, None)
+        entry = self._locks.get(key)
+        if entry is not None and entry[1] == 0:
+            del self._locks[key]
+
+    def _expired(self, snapshot: SchemaSnapshot, now: float) -> bool:
+        return now - snapshot.built_at >= self.ttl_seconds
+
+    def _store(self, key: CacheKey, snapshot: SchemaSnapshot) -> None:
+        now = time.monotonic()
+        for expired_key in [k for k, cached in self._snapshots.items() if self._expired(cached, now)]:
+            self._drop(expired_key)
+        self._snapshots[key] = snapshot
+        self._snapshots.move_to_end(key)
+        while len(self._snapshots) > self.max_snapshots:
+            self._drop(next(iter(self._snapshots)))
+            self.evictions += 1
+
+    async def get(self, key: CacheKey, run_sql: SqlRunner) -> SchemaSnapshot:
+        if not self.enabled:
+            return await self._build(run_sql)
+
+        lock = self._acquire_lock(key)
+        try:
+            async with lock:
+                snapshot = self._snapshots.get(key)
+                if snapshot is not None and self._expired(snapshot, time.monotonic()):
+                    self._snapshots.pop(key, None)
+                    snapshot = None
+                if snapshot is not None:
+                    probe = (await run_sql(PROBE_SQL) or [{}])[0]
+                    if (
+                        bool(probe.get("has_migrations")) == snapshot.has_migrations
+                        and probe.get("migration_version") == snapshot.migration_version
+                    ):
+                        self._snapshots.move_to_end(key)
+                        self.hits += 1
+                        return snapshot
+
+                snapshot = await self._build(run_sql)
+                self._store(key, snapshot)
+                return snapshot
+        finally:
+            self._release_lock(key)
+
+    async def _build(self, run_sql: SqlRunner) -> SchemaSnapshot:
+        row = (await run_sql(SNAPSHOT_SQL) or [{}])[0]
+        self.builds += 1
+        return SchemaSnapshot(
+            has_migrations=bool(row.get("has_migrations")),
+            migration_version=row.get("migration_version"),
+            tables=_as_list(row.get("tables")),
+            columns=_as_list(row.get("columns")),
+            extensions=_as_list(row.get("extensions")),
+        )
+
+    async def get_migrations(self, key: CacheKey, run_sql: SqlRunner) -> list[dict]:
+        if not self.enabled:
+            probe = (await run_sql(PROBE_SQL) or [{}])[0]
+            return await run_sql(MIGRATIONS_SQL) if probe.get("has_migrations") else []
+
+        snapshot = await self.get(key, run_sql)
+        if not snapshot.has_migrations:
+            return []
+        if snapshot.migrations is None:
+            snapshot.migrations = await run_sql(MIGRATIONS_SQL)
+        return snapshot.migrations
+
+    async def get_extensions(self, key: CacheKey, run_sql: SqlRunner) -> list[dict]:
+        if not self.enabled:
+            return await run_sql(EXTENSIONS_SQL)
+        return (await self.get(key, run_sql)).extensions
+
+    def invalidate(self, workspace_id: str) -> None:
+        for key in [key for key in self._snapshots if key[-1] == workspace_id]:
+            self._drop(key)
+        self.invalidations += 1
+
+    def stats(self) -> dict:
+        return {
+            "snapshots": len(self._snapshots),
+            "max_snapshots": self.max_snapshots,
+            "ttl_seconds": self.ttl_seconds,
+            "evictions": self.evictions,
+            "hits": self.hits,
+            "builds": self.builds,
+            "invalidations": self.invalidations,
+        }
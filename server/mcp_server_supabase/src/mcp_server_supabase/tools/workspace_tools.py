@@ -76,7 +76,7 @@ class WorkspaceTools(BaseTools):
         }
         return compact_dict(payload)
 
-    def _describe_workspaces_response(self):
+    async def _describe_workspaces_response(self):
         from volcenginesdkaidap.models import DescribeWorkspacesRequest, FilterForDescribeWorkspacesInput
 
         filter_kwargs = {
@@ -87,10 +87,10 @@ class WorkspaceTools(BaseTools):
             filter_kwargs["mode"] = "Exact"
         filters = [FilterForDescribeWorkspacesInput(**filter_kwargs)]
         request = DescribeWorkspacesRequest(filters=filters)
-        return self.aidap.client.describe_workspaces(request)
+        return await self.aidap.run_api("describe_workspaces", request)
 
-    def _find_workspace_source(self, workspace_id: str) -> Optional[Any]:
-        response = self._describe_workspaces_response()
+    async def _find_workspace_source(self, workspace_id: str) -> Optional[Any]:
+        response = await self._describe_workspaces_response()
         for workspace in list(getattr(response, "workspaces", []) or []):
             if pick_value(workspace, "workspace_id") == workspace_id:
                 return workspace
@@ -114,7 +114,7 @@ class WorkspaceTools(BaseTools):
 
     async def list_workspaces(self) -> str:
         try:
-            response = self._describe_workspaces_response()
+            response = await self._describe_workspaces_response()
             raw_workspaces = list(getattr(response, "workspaces", []) or [])
             workspaces = [self._workspace_view(workspace) for workspace in raw_workspaces]
             return to_json({
@@ -225,7 +225,7 @@ class WorkspaceTools(BaseTools):
     async def list_branches(self, workspace_id: Optional[str] = None) -> str:
         try:
             ws_id = self._resolve_workspace_id(workspace_id)
-            workspace_source = self._find_workspace_source(ws_id)
+            workspace_source = await self._find_workspace_source(ws_id)
             workspace_payload = self._workspace_view(workspace_source) if workspace_source is not None else {"workspace_id": ws_id}
             branches = await self.aidap.list_branches(ws_id)
             normalized_branches = [self._branch_view(branch, workspace_payload) for branch in branches]
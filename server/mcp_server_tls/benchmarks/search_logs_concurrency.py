@@ -0,0 +1,87 @@
+"""Compare the native async path with the thread pool path of call_sdk_method.
+
+The benchmark fires `search_logs_v2` at several concurrency levels against a real topic, using
+the local deploy mode credentials (VOLCENGINE_ACCESS_KEY / VOLCENGINE_SECRET_KEY / REGION / ENDPOINT).
+
+Usage:
+    uv run python benchmarks/search_logs_concurrency.py --topic-id <topic_id> [--query "*"]
+        [--concurrency 1,16,128] [--rounds 3]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from volcengine.tls.tls_requests import SearchLogsRequest
+
+from mcp_server_tls.request import call_sdk_method
+from mcp_server_tls.utils import get_local_sdk_auth_info
+
+
+async def run_batch(auth_info: dict, topic_id: str, query: str, concurrency: int, use_native_async: bool) -> list:
+    end_time = int(time.time() * 1000)
+    start_time = end_time - 15 * 60 * 1000
+
+    async def one_search() -> float:
+        request = SearchLogsRequest(
+            topic_id=topic_id,
+            query=query,
+            start_time=start_time,
+            end_time=end_time,
+            limit=10,
+        )
+        begin = time.perf_counter()
+        await call_sdk_method(
+            auth_info=auth_info,
+            method_name="search_logs_v2",
+            use_native_async=use_native_async,
+            search_logs_request=request,
+        )
+        return time.perf_counter() - begin
+
+    return await asyncio.gather(*[one_search() for _ in range(concurrency)])
+
+
+def percentile(values: list, p: float) -> float:
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(p * (len(values) - 1))))
+    return values[index]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark native async vs thread pool TLS sdk calls")
+    parser.add_argument("--topic-id", required=True)
+    parser.add_argument("--query", default="*")
+    parser.add_argument("--concurrency", default="1,16,128")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    auth_info = get_local_sdk_auth_info()
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    # warm up the pooled sdk client and the shared async http client
+    await run_batch(auth_info, args.topic_id, args.query, 1, True)
+    await run_batch(auth_info, args.topic_id, args.query, 1, False)
+
+    print("{:<12}{:>12}{:>12}{:>12}{:>12}{:>14}".format("path", "concurrency", "p50(ms)", "p95(ms)", "max(ms)", "searches/s"))
+    for concurrency in levels:
+        for path, use_native_async in (("native", True), ("thread", False)):
+            latencies = []
+            elapsed = 0.0
+            for _ in range(args.rounds):
+                begin = time.perf_counter()
+                latencies.extend(await run_batch(auth_info, args.topic_id, args.query, concurrency, use_native_async))
+                elapsed += time.perf_counter() - begin
+
+            print("{:<12}{:>12}{:>12.1f}{:>12.1f}{:>12.1f}{:>14.1f}".format(
+                path,
+                concurrency,
+                statistics.median(latencies) * 1000,
+                percentile(latencies, 0.95) * 1000,
+                max(latencies) * 1000,
+                len(latencies) / elapsed,
+            ))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
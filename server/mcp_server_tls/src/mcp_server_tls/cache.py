@@ -0,0 +1,168 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Optional
+
+from mcp_server_tls.config import TLS_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_query(query: str) -> str:
+    # collapse whitespace so that reformatted but identical queries share an entry
+    return " ".join(query.split())
+
+
+def _to_ms(timestamp: int) -> int:
+    # search_logs_v2 accepts both seconds and milliseconds timestamps
+    return timestamp if timestamp > 10 ** 12 else timestamp * 1000
+
+
+def _estimate_size(value: Any) -> int:
+    try:
+        return len(json.dumps(value, default=str, ensure_ascii=False).encode("utf-8"))
+    except (TypeError, ValueError):
+        return 0
+
+
+class SearchResultCache:
+    """An LRU + TTL cache of search_logs_v2 results.
+
+    Windows that ended more than `ingest_lag_ms` ago are immutable and cached without expiry (until
+    evicted by LRU). Live windows, which may still receive late ingested logs, are only cached for
+    `live_ttl` seconds, and their key is aligned to `align_ms` buckets so that repeated "last N
+    minutes" queries share an entry. The request itself is always sent with the caller's window.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, live_ttl: int, align_ms: int, ingest_lag_ms: int = 0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.live_ttl = live_ttl
+        self.align_ms = align_ms
+        self.ingest_lag_ms = ingest_lag_ms
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def is_live_window(self, end_time: int, now_ms: Optional[int] = None) -> bool:
+        if now_ms is None:
+            now_ms = int(time.time() * 1000)
+        return _to_ms(end_time) + max(self.align_ms, self.ingest_lag_ms) > now_ms
+
+    def align_window(self, start_time: int, end_time: int) -> tuple:
+        """align a live window outward to bucket boundaries for the cache key, past windows are kept as is
+        """
+        if self.align_ms <= 0 or not self.is_live_window(end_time):
+            return start_time, end_time
+
+        align = self.align_ms if end_time > 10 ** 12 else max(1, self.align_ms // 1000)
+        start_time = start_time - start_time % align
+        if end_time % align:
+            end_time = end_time - end_time % align + align
+        return start_time, end_time
+
+    @staticmethod
+    def make_key(auth_info: dict, topic_id: str, query: str, start_time: int, end_time: int,
+                 limit: int, context: Optional[str], sort: Optional[str]) -> tuple:
+        # a cache hit skips the signed api call, so the key has to cover the secret material as well
+        secret_digest = hashlib.sha256(
+            "{}:{}".format(auth_info.get("sk"), auth_info.get("token") or "").encode("utf-8")
+        ).hexdigest()
+
+        return (
+            auth_info.get("ak"),
+            secret_digest,
+            auth_info.get("region"),
+            auth_info.get("endpoint"),
+            topic_id,
+            _normalize_query(query),
+            start_time,
+            end_time,
+            limit,
+            context,
+            (sort or "DESC").upper(),
+        )
+
+    def get(self, key: tuple) -> Optional[dict]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, size, deadline = entry
+            if deadline is not None and deadline <= now:
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: tuple, value: dict, end_time: int):
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        deadline = None
+        if self.is_live_window(end_time):
+            if self.live_ttl <= 0:
+                return
+            deadline = time.monotonic() + self.live_ttl
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, size, deadline)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def _remove(self, key: tuple):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+SEARCH_RESULT_CACHE = SearchResultCache(
+    max_entries=TLS_CONFIG.search_cache_max_entries if TLS_CONFIG.search_cache_enabled else 0,
+    max_bytes=TLS_CONFIG.search_cache_max_bytes,
+    live_ttl=TLS_CONFIG.search_cache_live_ttl,
+    align_ms=TLS_CONFIG.search_cache_align_seconds * 1000,
+    ingest_lag_ms=TLS_CONFIG.search_cache_ingest_lag_seconds * 1000,
+)
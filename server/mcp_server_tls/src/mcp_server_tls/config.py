@@ -14,6 +14,20 @@ class TlsConfig:
     project_id: str
     account_id: str
     enabled_tools: list
+    client_pool_size: int
+    client_pool_ttl: int
+    http2_enabled: bool
+    http_max_connections: int
+    http_max_keepalive_connections: int
+    http_keepalive_expiry: float
+    native_async_enabled: bool
+    search_cache_enabled: bool
+    search_cache_max_entries: int
+    search_cache_max_bytes: int
+    search_cache_live_ttl: int
+    search_cache_align_seconds: int
+    search_cache_ingest_lag_seconds: int
+    export_dir: str
 
     def __init__(self):
 
@@ -32,6 +46,28 @@ class TlsConfig:
         self.deploy_mode = os.getenv("MCP_DEPLOY_MODE") or os.getenv("DEPLOY_MODE") or DEPLOY_MODE_LOCAL
         self.enabled_tools = (os.getenv("MCP_ENABLED_TOOLS") or os.getenv("ENABLED_TOOLS") or "all").split(",")
 
+        # sdk client pool and shared async http client
+        self.client_pool_size = int(os.getenv("TLS_CLIENT_POOL_SIZE") or 128)
+        self.client_pool_ttl = int(os.getenv("TLS_CLIENT_POOL_TTL") or 1800)
+        self.http2_enabled = (os.getenv("TLS_HTTP2_ENABLED") or "true").lower() in ("1", "true", "yes")
+        self.http_max_connections = int(os.getenv("TLS_HTTP_MAX_CONNECTIONS") or 100)
+        self.http_max_keepalive_connections = int(os.getenv("TLS_HTTP_MAX_KEEPALIVE_CONNECTIONS") or 20)
+        self.http_keepalive_expiry = float(os.getenv("TLS_HTTP_KEEPALIVE_EXPIRY") or 60)
+        # send hot read apis through the shared async http client instead of the sdk thread pool
+        self.native_async_enabled = (os.getenv("TLS_NATIVE_ASYNC_ENABLED") or "true").lower() in ("1", "true", "yes")
+        # search_logs_v2 result cache
+        self.search_cache_enabled = (os.getenv("TLS_SEARCH_CACHE_ENABLED") or "true").lower() in ("1", "true", "yes")
+        self.search_cache_max_entries = int(os.getenv("TLS_SEARCH_CACHE_MAX_ENTRIES") or 512)
+        self.search_cache_max_bytes = int(os.getenv("TLS_SEARCH_CACHE_MAX_BYTES") or 64 * 1024 * 1024)
+        self.search_cache_live_ttl = int(os.getenv("TLS_SEARCH_CACHE_LIVE_TTL") or 30)
+        self.search_cache_align_seconds = int(os.getenv("TLS_SEARCH_CACHE_ALIGN_SECONDS") or 30)
+        # windows ending this close to now may still receive logs that are being ingested and indexed
+        self.search_cache_ingest_lag_seconds = int(os.getenv("TLS_SEARCH_CACHE_INGEST_LAG_SECONDS") or 300)
+        # export_logs_tool only writes below this directory, remote deployments have no default
+        self.export_dir = os.getenv("TLS_EXPORT_DIR")
+        if not self.export_dir and self.deploy_mode == DEPLOY_MODE_LOCAL:
+            self.export_dir = os.getcwd()
+
         self._validate()
 
     def _validate(self):
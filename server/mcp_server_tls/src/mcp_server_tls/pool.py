@@ -0,0 +1,216 @@
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+import httpx
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional
+from volcengine.tls.TLSService import TLSService
+
+from mcp_server_tls.config import TLS_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# evict a pooled client this many seconds before its sts token expires
+TOKEN_EXPIRY_SKEW_SECONDS = 60
+
+
+def _parse_expired_time(expired_time) -> Optional[float]:
+    """parse the sts ExpiredTime (iso8601 string or unix timestamp) into a unix timestamp
+    """
+    if not expired_time:
+        return None
+
+    if isinstance(expired_time, (int, float)):
+        # milliseconds timestamp
+        if expired_time > 10 ** 12:
+            return expired_time / 1000
+        return float(expired_time)
+
+    value = str(expired_time).strip()
+    if value.isdigit():
+        return _parse_expired_time(int(value))
+
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        logger.warning("unrecognized expired_time: {}".format(expired_time))
+        return None
+
+
+class TlsClientPool:
+    """A bounded, TTL-evicting pool of TLSService clients.
+
+    Clients are keyed by (ak, region, endpoint, token expiry), plus a digest of the secret
+    material so that a rotated sk/token never reuses a stale signer.
+    """
+
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clients: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _make_key(auth_info: dict) -> tuple:
+        secret_digest = hashlib.sha256(
+            "{}:{}".format(auth_info.get("sk"), auth_info.get("token") or "").encode("utf-8")
+        ).hexdigest()
+
+        return (
+            auth_info.get("ak"),
+            auth_info.get("region"),
+            auth_info.get("endpoint"),
+            auth_info.get("expired_time"),
+            secret_digest,
+        )
+
+    def _deadline(self, auth_info: dict) -> float:
+        deadline = time.monotonic() + self.ttl
+
+        expired_at = _parse_expired_time(auth_info.get("expired_time"))
+        if expired_at is not None:
+            remaining = expired_at - time.time() - TOKEN_EXPIRY_SKEW_SECONDS
+            deadline = min(deadline, time.monotonic() + remaining)
+
+        return deadline
+
+    def _evict_expired(self, now: float):
+        expired_keys = [key for key, (_, deadline) in self._clients.items() if deadline <= now]
+        for key in expired_keys:
+            del self._clients[key]
+            self.evictions += 1
+
+    def get(self, auth_info: dict) -> TLSService:
+        key = self._make_key(auth_info)
+        now = time.monotonic()
+
+        with self._lock:
+            self._evict_expired(now)
+
+            entry = self._clients.get(key)
+            if entry is not None:
+                self._clients.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+            self.misses += 1
+
+        client = TLSService(
+            region=auth_info.get("region"),
+            endpoint=auth_info.get("endpoint"),
+            access_key_id=auth_info.get("ak"),
+            access_key_secret=auth_info.get("sk"),
+            security_token=auth_info.get("token"),
+        )
+
+        deadline = self._deadline(auth_info)
+        if self.max_size <= 0 or deadline <= now:
+            # pooling disabled or the token is about to expire, don't keep it around
+            return client
+
+        with self._lock:
+            # another thread may have built the same client concurrently
+            entry = self._clients.get(key)
+            if entry is not None:
+                self._clients.move_to_end(key)
+                return entry[0]
+
+            self._clients[key] = (client, deadline)
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+                self.evictions += 1
+
+        return client
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._clients),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class AsyncHttpClientHolder:
+    """Holds one long-lived httpx.AsyncClient per event loop.
+
+    httpx clients are bound to the loop that opened their connections, so a new client is
+    created transparently if the running loop changes (e.g. in tests or stdio restarts).
+    """
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.created = 0
+
+    @staticmethod
+    def _http2_available() -> bool:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def _build(self) -> httpx.AsyncClient:
+        http2 = TLS_CONFIG.http2_enabled and self._http2_available()
+        if TLS_CONFIG.http2_enabled and not http2:
+            logger.warning("http2 is enabled but package h2 is not installed, fall back to http/1.1")
+
+        return httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=TLS_CONFIG.http_max_connections,
+                max_keepalive_connections=TLS_CONFIG.http_max_keepalive_connections,
+                keepalive_expiry=TLS_CONFIG.http_keepalive_expiry,
+            ),
+        )
+
+    def get(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = self._build()
+            self._loop = loop
+            self.created += 1
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+
+
+CLIENT_POOL = TlsClientPool(
+    max_size=TLS_CONFIG.client_pool_size,
+    ttl=TLS_CONFIG.client_pool_ttl,
+)
+
+ASYNC_HTTP_CLIENT = AsyncHttpClientHolder()
+
+
+def get_pool_stats() -> dict:
+    """hit/miss/eviction counters of the sdk client pool and the shared async http client
+    """
+    return {
+        "sdk_client_pool": CLIENT_POOL.stats(),
+        "async_http_client": {
+            "created": ASYNC_HTTP_CLIENT.created,
+        },
+    }
@@ -6,11 +6,23 @@ import time
 import httpx
 
 from typing import Any
+from mcp_server_tls.config import TLS_CONFIG
 from mcp_server_tls.consts import *
+from mcp_server_tls.pool import CLIENT_POOL, ASYNC_HTTP_CLIENT
 from volcengine.ApiInfo import ApiInfo
 from volcengine.auth.SignerV4 import SignerV4
 from volcengine.tls.TLSService import TLSService
 from volcengine.tls.tls_exception import TLSException
+from volcengine.tls.tls_responses import (
+    SearchLogsResponse,
+    ConsumeLogsResponse,
+    DescribeCursorResponse,
+    DescribeLogContextResponse,
+    DescribeShardsResponse,
+    CreateDownloadTaskResponse,
+    DescribeDownloadTasksResponse,
+    DescribeDownloadUrlResponse,
+)
 from volcengine.tls.const import *
 
 
@@ -23,6 +35,75 @@ API_INFO = {
     API_CREATE_APP_SCENE_META: ApiInfo(HTTP_POST, API_CREATE_APP_SCENE_META, {}, {}, {}),
     API_DESCRIBE_APP_INSTANCES: ApiInfo(HTTP_GET, API_DESCRIBE_APP_INSTANCES, {}, {}, {}),
     API_DESCRIBE_SESSION_ANSWER: ApiInfo(HTTP_POST, API_DESCRIBE_SESSION_ANSWER, {}, {}, {}),
+    # APIs of logs, served by the native async path.
+    SEARCH_LOGS: ApiInfo(HTTP_POST, SEARCH_LOGS, {}, {}, {}),
+    CONSUME_LOGS: ApiInfo(HTTP_GET, CONSUME_LOGS, {}, {}, {}),
+    DESCRIBE_CURSOR: ApiInfo(HTTP_GET, DESCRIBE_CURSOR, {}, {}, {}),
+    DESCRIBE_LOG_CONTEXT: ApiInfo(HTTP_POST, DESCRIBE_LOG_CONTEXT, {}, {}, {}),
+    DESCRIBE_SHARDS: ApiInfo(HTTP_GET, DESCRIBE_SHARDS, {}, {}, {}),
+    # APIs of download tasks.
+    CREATE_DOWNLOAD_TASK: ApiInfo(HTTP_POST, CREATE_DOWNLOAD_TASK, {}, {}, {}),
+    DESCRIBE_DOWNLOAD_TASKS: ApiInfo(HTTP_GET, DESCRIBE_DOWNLOAD_TASKS, {}, {}, {}),
+    DESCRIBE_DOWNLOAD_URL: ApiInfo(HTTP_GET, DESCRIBE_DOWNLOAD_URL, {}, {}, {}),
+}
+
+
+def _split_api_input(api_input: dict) -> tuple:
+    return api_input[PARAMS], api_input[BODY], api_input.get(REQUEST_HEADERS)
+
+
+# TLSService methods that are signed with __prepare_request and sent through the shared async
+# http client, method name -> (request kwarg, api, api input builder, response builder).
+# The api input builders mirror how TLSService passes each request to its own __request.
+NATIVE_ASYNC_METHODS = {
+    "search_logs_v2": (
+        "search_logs_request",
+        SEARCH_LOGS,
+        lambda request: (None, request.get_api_input(), {HEADER_API_VERSION: API_VERSION_V_0_3_0}),
+        lambda response, request: SearchLogsResponse(response),
+    ),
+    "consume_logs": (
+        "consume_logs_request",
+        CONSUME_LOGS,
+        lambda request: _split_api_input(request.get_api_input()),
+        lambda response, request: ConsumeLogsResponse(response, compression=request.compression),
+    ),
+    "describe_cursor": (
+        "describe_cursor_request",
+        DESCRIBE_CURSOR,
+        lambda request: _split_api_input(request.get_api_input()),
+        lambda response, request: DescribeCursorResponse(response),
+    ),
+    "describe_log_context": (
+        "describe_log_context_request",
+        DESCRIBE_LOG_CONTEXT,
+        lambda request: (None, request.get_api_input(), None),
+        lambda response, request: DescribeLogContextResponse(response),
+    ),
+    "describe_shards": (
+        "describe_shards_request",
+        DESCRIBE_SHARDS,
+        lambda request: (request.get_api_input(), None, None),
+        lambda response, request: DescribeShardsResponse(response),
+    ),
+    "create_download_task": (
+        "create_download_task_request",
+        CREATE_DOWNLOAD_TASK,
+        lambda request: (None, request.get_api_input(), None),
+        lambda response, request: CreateDownloadTaskResponse(response),
+    ),
+    "describe_download_tasks": (
+        "describe_download_tasks_request",
+        DESCRIBE_DOWNLOAD_TASKS,
+        lambda request: (request.get_api_input(), None, None),
+        lambda response, request: DescribeDownloadTasksResponse(response),
+    ),
+    "describe_download_url": (
+        "describe_download_url_request",
+        DESCRIBE_DOWNLOAD_URL,
+        lambda request: (request.get_api_input(), None, None),
+        lambda response, request: DescribeDownloadUrlResponse(response),
+    ),
 }
 
 def __prepare_request(
@@ -63,34 +144,60 @@ def __prepare_request(
 async def call_sdk_method(
     auth_info: dict,
     method_name: str,
+    use_native_async: bool = None,
     **kwargs,
 ) -> Any:
+    """Call a TLSService method.
+
+    Hot read apis listed in NATIVE_ASYNC_METHODS are sent on the event loop through the shared
+    async http client, every other method falls back to the sdk running in the default thread pool.
+    """
+    if use_native_async is None:
+        use_native_async = TLS_CONFIG.native_async_enabled
+
     try:
         client = get_sdk_client(auth_info)
 
         if not hasattr(client, method_name):
             raise AttributeError(f"TLSService 没有方法: {method_name}")
 
+        if use_native_async and method_name in NATIVE_ASYNC_METHODS:
+            return await _call_sdk_method_native(client, method_name, **kwargs)
+
         method = getattr(client, method_name)
         bound_method = functools.partial(method, **kwargs)
 
         return await asyncio.to_thread(bound_method)
 
     except Exception as e:
-        raise Exception(f"call sdk failed: {method.__name__}, error: {e}")
+        raise Exception(f"call sdk failed: {method_name}, error: {e}")
 
-async def custom_api_call(
-    auth_info: dict,
+async def _call_sdk_method_native(
+    client: TLSService,
+    method_name: str,
+    **kwargs,
+) -> Any:
+    request_kwarg, api, build_api_input, build_response = NATIVE_ASYNC_METHODS[method_name]
+
+    sdk_request = kwargs[request_kwarg]
+    if sdk_request.check_validation() is False:
+        raise TLSException(error_code="InvalidArgument", error_message="Invalid request, please check it")
+
+    params, body, request_headers = build_api_input(sdk_request)
+    response = await _send_request(client, api, params, body, request_headers, timeout=60)
+
+    return build_response(response, sdk_request)
+
+async def _send_request(
+    client: TLSService,
     api: str,
     params: dict = None,
     body: dict = None,
     request_headers: dict = None,
-    is_stream: bool = False,
-):
-    """Customize a standard HTTP request to the Volcengine TLS API
+    timeout: int = 60,
+) -> httpx.Response:
+    """Sign a request and send it through the shared async http client, retrying like TLSService does
     """
-    client: TLSService = get_sdk_client(auth_info)
-
     if request_headers is None:
         request_headers = {HEADER_API_VERSION: API_VERSION_V_0_3_0}
     elif HEADER_API_VERSION not in request_headers:
@@ -102,60 +209,75 @@ async def custom_api_call(
     method = API_INFO[api].method
     url = request.build()
 
-    if is_stream:
-        timeout = 180
-    else:
-        timeout = 60
-
     try_count = 0
     expected_quit_timestamp = int(time.time() * 1000 + 60 * 1500)
 
-    async with httpx.AsyncClient() as session:
-        while True:
-            try_count += 1
-            try:
-                response = await session.request(
-                    method=method,
-                    url=url,
-                    headers=request.headers,
-                    data=request.body,
-                    timeout=timeout,
+    session = ASYNC_HTTP_CLIENT.get()
+    while True:
+        try_count += 1
+        try:
+            response = await session.request(
+                method=method,
+                url=url,
+                headers=request.headers,
+                content=request.body,
+                timeout=timeout,
+            )
+        except Exception as e:
+            TLSService.increase_retry_counter_by_one()
+            sleep_ms = TLSService.calc_backoff_ms(expected_quit_timestamp)
+            if try_count < 5 and sleep_ms > 0:
+                await asyncio.sleep(sleep_ms / 1000)
+            else:
+                raise TLSException(
+                    error_code=e.__class__.__name__,
+                    error_message=e.__str__(),
                 )
-            except Exception as e:
+        else:
+            if response.status_code == 200:
+                TLSService.decrease_retry_counter_by_one()
+                return response
+
+            elif try_count < 5 and response.status_code in [429, 500, 502, 503]:
                 TLSService.increase_retry_counter_by_one()
                 sleep_ms = TLSService.calc_backoff_ms(expected_quit_timestamp)
-                if try_count < 5 and sleep_ms > 0:
+                if sleep_ms > 0:
                     await asyncio.sleep(sleep_ms / 1000)
-                else:
-                    raise TLSException(
-                        error_code=e.__class__.__name__,
-                        error_message=e.__str__(),
-                    )
-            else:
-                if response.status_code == 200:
-                    TLSService.decrease_retry_counter_by_one()
-
-                    if is_stream:
-                        return response
-
-                    if "json" in response.headers[CONTENT_TYPE]:
-                        if response.text != "":
-                            response = json.loads(response.text)
-                        else:
-                            response = {}
-                    else:
-                        response = {DATA: response.content}
-                    return response
-
-                elif try_count < 5 and response.status_code in [429, 500, 502, 503]:
-                    TLSService.increase_retry_counter_by_one()
-                    sleep_ms = TLSService.calc_backoff_ms(expected_quit_timestamp)
-                    if sleep_ms > 0:
-                        await asyncio.sleep(sleep_ms / 1000)
-                    else:
-                        raise TLSException(response)
                 else:
                     raise TLSException(response)
+            else:
+                raise TLSException(response)
+
+async def custom_api_call(
+    auth_info: dict,
+    api: str,
+    params: dict = None,
+    body: dict = None,
+    request_headers: dict = None,
+    is_stream: bool = False,
+):
+    """Customize a standard HTTP request to the Volcengine TLS API
+    """
+    client: TLSService = get_sdk_client(auth_info)
+
+    if is_stream:
+        timeout = 180
+    else:
+        timeout = 60
+
+    response = await _send_request(client, api, params, body, request_headers, timeout=timeout)
+
+    if is_stream:
+        return response
+
+    if "json" in response.headers[CONTENT_TYPE]:
+        if response.text != "":
+            response = json.loads(response.text)
+        else:
+            response = {}
+    else:
+        response = {DATA: response.content}
+    return response
 
 def get_sdk_client(auth_info: dict) -> TLSService:
     if "ak" not in auth_info:
@@ -164,10 +286,4 @@ def get_sdk_client(auth_info: dict) -> TLSService:
     if "sk" not in auth_info:
         raise ValueError("the sk of auth_info is empty")
 
-    return TLSService(
-        region=auth_info.get("region"),
-        endpoint=auth_info.get("endpoint"),
-        access_key_id=auth_info.get("ak"),
-        access_key_secret=auth_info.get("sk"),
-        security_token=auth_info.get("token"),
-    )
+    return CLIENT_POOL.get(auth_info)
@@ -4,7 +4,7 @@ from mcp_server_tls.resources.project import describe_project_resource, describe
 
 from mcp_server_tls.resources.topic import describe_topic_resource, describe_topics_resource, create_topic_resource, delete_topic_resource
 
-from mcp_server_tls.resources.log import search_logs_v2_resource, put_logs_v2_resource, consume_logs_resource, describe_cursor_resource, describe_log_context_resource
+from mcp_server_tls.resources.log import search_logs_v2_resource, put_logs_v2_resource, consume_logs_resource, describe_cursor_resource, describe_log_context_resource, describe_shards_resource
 
 from mcp_server_tls.resources.index import create_index_resource, delete_index_resource, describe_index_resource
 
@@ -23,6 +23,8 @@ from mcp_server_tls.resources.rule import create_rule_resource, delete_rule_reso
 
 from mcp_server_tls.resources.alarm import create_alarm_notify_group_resource, delete_alarm_notify_group_resource, describe_alarm_notify_groups_resource, create_alarm_resource, delete_alarm_resource, describe_alarms_resource
 
+from mcp_server_tls.resources.stats import describe_cache_stats_resource
+
 SUPPORT_RESOURCES = {
     # project
     "describe_project": {
@@ -79,6 +81,10 @@ SUPPORT_RESOURCES = {
         "fn": describe_log_context_resource,
         "uri": "/DescribeLogContext?topic_id={topic_id}&context_flow={context_flow}&package_offset={package_offset}&source={source}"
     },
+    "describe_shards_resource": {
+        "fn": describe_shards_resource,
+        "uri": "/DescribeShards?topic_id={topic_id}"
+    },
     # index
     "create_index_resource": {
         "fn": create_index_resource,
@@ -197,5 +203,10 @@ SUPPORT_RESOURCES = {
     "describe_alarms_resource": {
         "fn": describe_alarms_resource,
         "uri": "/DescribeAlarms"
-    }
+    },
+    # stats
+    "describe_cache_stats": {
+        "fn": describe_cache_stats_resource,
+        "uri": "/CacheStats"
+    },
 }
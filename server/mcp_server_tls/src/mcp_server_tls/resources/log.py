@@ -1,10 +1,15 @@
+import asyncio
+import json
 import logging
+import os
+import time
 
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 from volcengine.tls.const import LZ4
 from volcengine.tls.tls_exception import TLSException
-from volcengine.tls.tls_requests import SearchLogsRequest, PutLogsV2Request, PutLogsV2Logs, ConsumeLogsRequest, DescribeCursorRequest, DescribeLogContextRequest
-from volcengine.tls.tls_responses import SearchLogsResponse, PutLogsResponse, ConsumeLogsResponse, DescribeCursorResponse, DescribeLogContextResponse
+from volcengine.tls.tls_requests import SearchLogsRequest, PutLogsV2Request, PutLogsV2Logs, ConsumeLogsRequest, DescribeCursorRequest, DescribeLogContextRequest, DescribeShardsRequest
+from volcengine.tls.tls_responses import SearchLogsResponse, PutLogsResponse, ConsumeLogsResponse, DescribeCursorResponse, DescribeLogContextResponse, DescribeShardsResponse
+from mcp_server_tls.cache import SEARCH_RESULT_CACHE
 from mcp_server_tls.request import call_sdk_method
 
 logger = logging.getLogger(__name__)
@@ -18,8 +23,20 @@ async def search_logs_v2_resource(
         limit: int,
         context: Optional[str] = None,
         sort: Optional[str] = "DESC",
+        use_cache: bool = True,
 ) -> dict:
     try:
+        use_cache = use_cache and SEARCH_RESULT_CACHE.enabled
+        if use_cache:
+            # only the key is aligned, and never for a context page whose token belongs to the exact window
+            key_start_time, key_end_time = (start_time, end_time) if context else \
+                SEARCH_RESULT_CACHE.align_window(start_time, end_time)
+            cache_key = SEARCH_RESULT_CACHE.make_key(
+                auth_info, topic_id, query, key_start_time, key_end_time, limit, context, sort)
+            cached = SEARCH_RESULT_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
         request: SearchLogsRequest = SearchLogsRequest(
             topic_id=topic_id,
             query=query,
@@ -41,6 +58,9 @@ async def search_logs_v2_resource(
         result =  vars(search_result)
         # Remove useless fields
         result.pop("HitCount", None)
+
+        if use_cache:
+            SEARCH_RESULT_CACHE.put(cache_key, result, end_time)
         return result
 
     except TLSException as e:
@@ -189,3 +209,290 @@ async def describe_log_context_resource(
     except TLSException as e:
         logger.error("describe_log_context_resource error")
         raise e
+
+async def describe_shards_resource(
+        auth_info: dict,
+        topic_id: str,
+        page_number: int = 1,
+        page_size: int = 100,
+) -> dict:
+    """describe_shards resource
+    """
+    try:
+        request: DescribeShardsRequest = DescribeShardsRequest(
+            topic_id=topic_id,
+            page_number=page_number,
+            page_size=page_size,
+        )
+
+        response: DescribeShardsResponse = await call_sdk_method(
+            auth_info=auth_info,
+            method_name="describe_shards",
+            describe_shards_request=request,
+        )
+
+        return {
+            "total": response.get_total(),
+            "shards": [vars(shard) for shard in response.get_shards()],
+        }
+
+    except TLSException as e:
+        logger.error("describe_shards_resource error")
+        raise e
+
+
+class _NdjsonLogWriter:
+    """Append log rows to a local file as newline delimited json"""
+
+    def __init__(self, output_path: str):
+        self._file = open(output_path, "x", encoding="utf-8")
+
+    def write_rows(self, rows: list[dict]):
+        for row in rows:
+            self._file.write(json.dumps(row, ensure_ascii=False))
+            self._file.write("\n")
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetLogWriter:
+    """Append log rows to a local parquet file, one row group per consumed batch"""
+
+    def __init__(self, output_path: str):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("export format parquet requires package pyarrow, please install it or use ndjson")
+
+        self._pa = pa
+        self._schema = pa.schema([
+            ("__shard__", pa.int32()),
+            ("__time__", pa.int64()),
+            ("__source__", pa.string()),
+            ("__path__", pa.string()),
+            ("contents", pa.map_(pa.string(), pa.string())),
+        ])
+        self._file = open(output_path, "xb")
+        try:
+            self._writer = pq.ParquetWriter(self._file, self._schema)
+        except BaseException:
+            self._file.close()
+            raise
+
+    def write_rows(self, rows: list[dict]):
+        columns = {
+            "__shard__": [row.pop("__shard__") for row in rows],
+            "__time__": [row.pop("__time__") for row in rows],
+            "__source__": [row.pop("__source__") for row in rows],
+            "__path__": [row.pop("__path__") for row in rows],
+            "contents": [list(row.items()) for row in rows],
+        }
+        self._writer.write_table(self._pa.table(columns, schema=self._schema))
+
+    def close(self):
+        try:
+            self._writer.close()
+        finally:
+            self._file.close()
+
+
+EXPORT_LOG_WRITERS = {
+    "ndjson": _NdjsonLogWriter,
+    "parquet": _ParquetLogWriter,
+}
+
+
+def resolve_export_path(output_path: str, export_dir: Optional[str]) -> str:
+    """Resolve output_path below export_dir, rejecting anything that escapes it or already exists"""
+    if not export_dir:
+        raise ValueError("export logs is disabled, set environment variables TLS_EXPORT_DIR to enable it")
+    if not output_path:
+        raise ValueError("output path is required")
+    if ".." in output_path.replace("\\", "/").split("/"):
+        raise ValueError("output path must not contain '..'")
+
+    export_dir = os.path.realpath(export_dir)
+    path = os.path.realpath(os.path.join(export_dir, output_path))
+    if os.path.commonpath([export_dir, path]) != export_dir or path == export_dir:
+        raise ValueError("output path should be a file under the export directory {}".format(export_dir))
+    if os.path.lexists(path):
+        raise ValueError("output path {} already exists".format(path))
+    if not os.path.isdir(os.path.dirname(path)):
+        raise ValueError("directory of output path {} does not exist".format(path))
+    return path
+
+
+def _log_group_list_to_rows(shard_id: int, log_group_list) -> list[dict]:
+    rows = []
+    if log_group_list is None:
+        return rows
+
+    for log_group in log_group_list.log_groups:
+        for log in log_group.logs:
+            row = {content.key: content.value for content in log.contents}
+            row["__shard__"] = shard_id
+            row["__time__"] = log.time
+            row["__source__"] = log_group.source
+            row["__path__"] = log_group.filename
+            rows.append(row)
+    return rows
+
+
+async def export_logs_resource(
+        auth_info: dict,
+        topic_id: str,
+        output_path: str,
+        start_time: str,
+        end_time: str,
+        export_format: str = "ndjson",
+        compression: str = LZ4,
+        log_group_count: int = 100,
+        max_concurrency: int = 4,
+        max_buffered_batches: int = 8,
+        max_logs: Optional[int] = None,
+        progress_callback: Optional[Callable[[dict], Awaitable[None]]] = None,
+        export_dir: Optional[str] = None,
+) -> dict:
+    """Export logs of a time range by walking the cursors of every shard.
+
+    Shards are consumed concurrently by at most `max_concurrency` workers. Decompressed batches
+    are handed to a single writer through a queue of `max_buffered_batches`, so a slow disk
+    blocks the consumers instead of buffering the whole export in memory.
+
+    The output file is created below `export_dir` and never overwrites an existing file.
+    """
+    if export_format not in EXPORT_LOG_WRITERS:
+        raise ValueError("export format should be one of {}".format(", ".join(EXPORT_LOG_WRITERS)))
+    output_path = resolve_export_path(output_path, export_dir)
+
+    shards = []
+    page_number = 1
+    while True:
+        page = await describe_shards_resource(auth_info, topic_id, page_number=page_number, page_size=100)
+        shards.extend(page["shards"])
+        if not page["shards"] or len(shards) >= page["total"]:
+            break
+        page_number += 1
+
+    writer = await asyncio.to_thread(EXPORT_LOG_WRITERS[export_format], output_path)
+    batch_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_buffered_batches))
+    shard_queue: asyncio.Queue = asyncio.Queue()
+    for shard in shards:
+        shard_queue.put_nowait(shard["shard_id"])
+
+    stop_event = asyncio.Event()
+    stats = {
+        "topic_id": topic_id,
+        "output_path": output_path,
+        "format": export_format,
+        "shard_count": len(shards),
+        "finished_shards": 0,
+        "log_group_count": 0,
+        "log_count": 0,
+        "truncated": False,
+    }
+
+    async def consume_shard(shard_id: int):
+        cursor = (await describe_cursor_resource(auth_info, topic_id, shard_id, start_time))["cursor"]
+        end_cursor = (await describe_cursor_resource(auth_info, topic_id, shard_id, end_time))["cursor"]
+
+        while cursor != end_cursor and not stop_event.is_set():
+            request = ConsumeLogsRequest(
+                topic_id=topic_id,
+                shard_id=shard_id,
+                cursor=cursor,
+                end_cursor=end_cursor,
+                log_group_count=log_group_count,
+                compression=compression,
+            )
+            response: ConsumeLogsResponse = await call_sdk_method(
+                auth_info=auth_info,
+                method_name="consume_logs",
+                consume_logs_request=request,
+            )
+
+            next_cursor = response.get_x_tls_cursor()
+            if response.get_x_tls_count() > 0:
+                # blocks while the writer is behind, which is the backpressure
+                await batch_queue.put((shard_id, response.get_x_tls_count(), response.get_pb_message()))
+            if next_cursor == cursor:
+                break
+            cursor = next_cursor
+
+        if stop_event.is_set() and cursor != end_cursor:
+            stats["truncated"] = True
+
+    async def shard_has_logs(shard_id: int) -> bool:
+        cursor = (await describe_cursor_resource(auth_info, topic_id, shard_id, start_time))["cursor"]
+        end_cursor = (await describe_cursor_resource(auth_info, topic_id, shard_id, end_time))["cursor"]
+        return cursor != end_cursor
+
+    async def consume_worker():
+        while not stop_event.is_set():
+            try:
+                shard_id = shard_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await consume_shard(shard_id)
+            stats["finished_shards"] += 1
+
+    async def write_worker():
+        while True:
+            item = await batch_queue.get()
+            if item is None:
+                return
+            if stop_event.is_set():
+                # a consumed batch that no longer fits below max_logs
+                stats["truncated"] = True
+                continue
+
+            shard_id, group_count, pb_message = item
+            rows = _log_group_list_to_rows(shard_id, pb_message)
+            if max_logs is not None and stats["log_count"] + len(rows) > max_logs:
+                rows = rows[:max_logs - stats["log_count"]]
+                stats["truncated"] = True
+
+            await asyncio.to_thread(writer.write_rows, rows)
+            stats["log_group_count"] += group_count
+            stats["log_count"] += len(rows)
+            if max_logs is not None and stats["log_count"] >= max_logs:
+                stop_event.set()
+
+            if progress_callback is not None:
+                await progress_callback(dict(stats))
+
+    start = time.monotonic()
+    writer_task = asyncio.create_task(write_worker())
+    consumers_task = asyncio.gather(
+        *[consume_worker() for _ in range(max(1, min(max_concurrency, len(shards))))]
+    )
+    try:
+        done, _ = await asyncio.wait({consumers_task, writer_task}, return_when=asyncio.FIRST_COMPLETED)
+        if writer_task in done:
+            # the writer only returns early when it failed
+            writer_task.result()
+        await consumers_task
+        await batch_queue.put(None)
+        await writer_task
+
+        # max_logs was reached exactly, the export is only truncated if a skipped shard has logs left
+        while stop_event.is_set() and not stats["truncated"] and not shard_queue.empty():
+            if await shard_has_logs(shard_queue.get_nowait()):
+                stats["truncated"] = True
+    except BaseException as e:
+        stop_event.set()
+        consumers_task.cancel()
+        writer_task.cancel()
+        await asyncio.gather(consumers_task, writer_task, return_exceptions=True)
+        if isinstance(e, TLSException):
+            logger.error("export_logs_resource error")
+        raise e
+    finally:
+        await asyncio.to_thread(writer.close)
+
+    stats["elapsed_seconds"] = round(time.monotonic() - start, 3)
+    if os.path.exists(output_path):
+        stats["file_size"] = os.path.getsize(output_path)
+    return stats
@@ -0,0 +1,13 @@
+import logging
+
+from mcp_server_tls.cache import SEARCH_RESULT_CACHE
+from mcp_server_tls.pool import get_pool_stats
+
+logger = logging.getLogger(__name__)
+
+async def describe_cache_stats_resource() -> dict:
+    """describe hit ratios and memory use of the server side caches
+    """
+    stats = get_pool_stats()
+    stats["search_result_cache"] = SEARCH_RESULT_CACHE.stats()
+    return stats
@@ -4,7 +4,7 @@ from mcp_server_tls.tools.project import describe_project_tool, describe_project
 
 from mcp_server_tls.tools.topic import describe_topic_tool, describe_topics_tool, create_topic_tool, delete_topic_tool
 
-from mcp_server_tls.tools.log import search_logs_v2_tool, put_logs_v2_tool, consume_logs_tool, describe_cursor_tool, describe_log_context_tool
+from mcp_server_tls.tools.log import search_logs_v2_tool, put_logs_v2_tool, consume_logs_tool, describe_cursor_tool, describe_log_context_tool, export_logs_tool
 
 from mcp_server_tls.tools.index import create_index_tool, delete_index_tool, describe_index_tool
 
@@ -32,6 +32,7 @@ SUPPORT_TOOLS = {
     # log
     "search_logs_v2_tool": search_logs_v2_tool,
     "put_logs_v2_tool": put_logs_v2_tool,
+    "export_logs_tool": export_logs_tool,
     # "consume_logs_tool": consume_logs_tool,
     # "describe_cursor_tool": describe_cursor_tool,
     # "describe_log_context_tool": describe_log_context_tool,
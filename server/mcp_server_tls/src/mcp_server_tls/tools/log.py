@@ -3,7 +3,7 @@ import logging
 
 from typing import Optional
 from mcp_server_tls.config import TLS_CONFIG
-from mcp_server_tls.resources.log import search_logs_v2_resource, put_logs_v2_resource, consume_logs_resource, describe_cursor_resource, describe_log_context_resource
+from mcp_server_tls.resources.log import search_logs_v2_resource, put_logs_v2_resource, consume_logs_resource, describe_cursor_resource, describe_log_context_resource, export_logs_resource
 from mcp_server_tls.utils import get_sdk_auth_info
 
 logger = logging.getLogger(__name__)
@@ -13,7 +13,8 @@ async def search_logs_v2_tool(
         topic_id: Optional[str] = None,
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
-        limit: Optional[int] = 10
+        limit: Optional[int] = 10,
+        use_cache: bool = True,
 ) -> dict:
     """Search logs using the provided query from the TLS service.
 
@@ -30,6 +31,9 @@ async def search_logs_v2_tool(
         limit: Maximum number of logs to return (default: 100)
         start_time: Start time in milliseconds since epoch (default: 15 minutes ago)
         end_time: End time in milliseconds since epoch (default: current time)
+        use_cache: Whether to serve repeated searches from the server side result cache (default: True).
+            Windows ending in the past are cached until evicted, windows touching now are aligned
+            to a small time bucket and cached for a few seconds. Set to False to always query TLS.
 
     Returns:
         List of log entries matching the search criteria. Each log entry is a dictionary
@@ -71,6 +75,7 @@ async def search_logs_v2_tool(
             start_time=start_time,
             end_time=end_time,
             limit=limit,
+            use_cache=use_cache,
         )
 
     except Exception as e:
@@ -333,3 +338,104 @@ async def describe_log_context_tool(
     except Exception as e:
         logger.error("call tool error: describe_log_context_tool, err is {}".format(str(e)))
         return {"error": str(e)}
+
+async def export_logs_tool(
+        output_path: str,
+        topic_id: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        export_format: str = "ndjson",
+        max_logs: Optional[int] = None,
+        max_concurrency: int = 4,
+        max_buffered_batches: int = 8,
+        log_group_count: int = 100,
+        compression: str = "lz4",
+) -> dict:
+    """Export all logs of a time range from a VolcEngine TLS topic to a local file.
+
+    This tool walks the cursors of every shard of the topic on the server side, consuming shards
+    concurrently and writing the logs to a local NDJSON or Parquet file as they arrive.
+    Progress notifications are sent after every written batch. Use it instead of paging through
+    consume_logs_tool when millions of logs need to be pulled.
+
+    Args:
+        output_path: File path the logs are written to, relative to the export directory of the server (required)
+        topic_id: ID of the log topic (optional, defaults to environment variable)
+        start_time: Start time in seconds or milliseconds since epoch (default: 15 minutes ago)
+        end_time: End time in seconds or milliseconds since epoch (default: current time)
+        export_format: Output format, supports ndjson/parquet, parquet requires pyarrow (default: ndjson)
+        max_logs: Stop after this many logs have been written (optional, default: no limit)
+        max_concurrency: Maximum number of shards consumed at the same time (default: 4)
+        max_buffered_batches: Maximum number of consumed batches held in memory (default: 8)
+        log_group_count: Maximum number of log groups fetched per batch (default: 100)
+        compression: Transfer compression of the batches, supports lz4/zlib (default: lz4)
+
+    The file is created below the export directory configured by TLS_EXPORT_DIR (the working
+    directory in local mode) and an existing file is never overwritten. Without TLS_EXPORT_DIR
+    the tool is disabled in remote mode.
+
+    Returns:
+        Dictionary containing the output path, the number of shards, log groups and logs exported,
+        whether logs were left unexported because of max_logs, the file size and the elapsed time.
+
+    Examples:
+        # Export the last 15 minutes to ndjson
+        export_logs_tool("logs.ndjson")
+
+        # Export one day to parquet with 8 shards in parallel
+        export_logs_tool("logs.parquet", topic_id="topic-123", start_time=1700000000,
+                         end_time=1700086400, export_format="parquet", max_concurrency=8)
+    """
+    try:
+
+        from mcp_server_tls.server import mcp
+
+        ctx = mcp.get_context()
+        auth_info = get_sdk_auth_info(ctx)
+
+        topic_id = topic_id or TLS_CONFIG.topic_id
+        if not topic_id:
+            raise ValueError("topic id is required")
+
+        if not output_path:
+            raise ValueError("output path is required")
+
+        now = int(time.time())
+        end_time = _to_seconds(end_time) if end_time is not None else now
+        start_time = _to_seconds(start_time) if start_time is not None else end_time - 15 * 60
+
+        async def report_progress(stats: dict):
+            try:
+                await ctx.report_progress(
+                    progress=stats["log_count"],
+                    message="exported {} logs, {}/{} shards finished".format(
+                        stats["log_count"], stats["finished_shards"], stats["shard_count"]),
+                )
+            except Exception as e:
+                logger.debug("report export progress failed: {}".format(str(e)))
+
+        return await export_logs_resource(
+            auth_info=auth_info,
+            topic_id=topic_id,
+            output_path=output_path,
+            start_time=str(start_time),
+            end_time=str(end_time),
+            export_format=export_format,
+            compression=compression,
+            log_group_count=log_group_count,
+            max_concurrency=max_concurrency,
+            max_buffered_batches=max_buffered_batches,
+            max_logs=max_logs,
+            progress_callback=report_progress,
+            export_dir=TLS_CONFIG.export_dir,
+        )
+
+    except Exception as e:
+        logger.error("call tool error: export_logs_tool, err is {}".format(str(e)))
+        return {"error": str(e)}
+
+def _to_seconds(timestamp: int) -> int:
+    # accept both seconds and milliseconds timestamps
+    if timestamp > 10 ** 12:
+        return timestamp // 1000
+    return timestamp
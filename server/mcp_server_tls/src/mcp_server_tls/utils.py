@@ -106,6 +106,7 @@ def get_local_sdk_auth_info() -> dict:
         "ak": TLS_CONFIG.ak,
         "sk": TLS_CONFIG.sk,
         "token": TLS_CONFIG.token,
+        "expired_time": None,
     }
 
 def get_remote_sdk_auth_info(remote_context_info: dict) -> dict:
@@ -123,4 +124,5 @@ def get_remote_sdk_auth_info(remote_context_info: dict) -> dict:
         "ak": remote_context_info.get("ak"),
         "sk": remote_context_info.get("sk"),
         "token": remote_context_info.get("token"),
+        "expired_time": remote_context_info.get("expired_time"),
     }
@@ -22,6 +22,11 @@ class TosConfig:
         DEPLOY_MODE:    The deployment mode
         TOS_BUCKETS:    The bucket list to use for the TOS service
         MAX_OBJECT_SIZE: The maximum size of an object in bytes
+        RANGE_PART_SIZE: The size of each ranged GET when reading a window in parallel
+        RANGE_CONCURRENCY: The maximum number of ranged GETs in flight for one window
+        RESOURCE_CACHE_SIZE: The maximum number of cached TOS clients, keyed by credential
+        RESOURCE_CACHE_TTL: The maximum lifetime of a cached TOS client in seconds
+        LIST_BUCKETS_CACHE_TTL: How long list_buckets results are reused in seconds, 0 disables it
     """
     access_key: str
     secret_key: str
@@ -31,6 +36,11 @@ class TosConfig:
     deploy_mode: str
     max_object_size: int
     buckets: List[str]
+    range_part_size: int = 1024 * 1024
+    range_concurrency: int = 4
+    resource_cache_size: int = 256
+    resource_cache_ttl: int = 3600
+    list_buckets_cache_ttl: int = 60
 
 
 def validate_local_required_vars():
@@ -81,6 +91,11 @@ def load_config() -> TosConfig:
         deploy_mode=deploy_mode,
         buckets=os.getenv("TOS_BUCKETS", "").split(","),
         max_object_size=int(os.getenv("MAX_OBJECT_SIZE", "262144")),
+        range_part_size=int(os.getenv("RANGE_PART_SIZE", str(1024 * 1024))),
+        range_concurrency=int(os.getenv("RANGE_CONCURRENCY", "4")),
+        resource_cache_size=int(os.getenv("RESOURCE_CACHE_SIZE", "256")),
+        resource_cache_ttl=int(os.getenv("RESOURCE_CACHE_TTL", "3600")),
+        list_buckets_cache_ttl=int(os.getenv("LIST_BUCKETS_CACHE_TTL", "60")),
     )
     logger.info(f"Loaded configuration successfully")
 
@@ -0,0 +1,92 @@
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Optional, Tuple, Type
+
+from mcp_server_tos.credential import Credential
+from mcp_server_tos.resources.service import TosResource
+
+logger = logging.getLogger(__name__)
+
+# 在 STS 过期前提前淘汰，避免使用即将过期的凭证发起请求
+EXPIRY_SKEW_SECONDS = 60
+
+
+def parse_expired_time(expired_time: Optional[str]) -> Optional[float]:
+    """将 STS ExpiredTime (ISO8601) 解析为 unix 时间戳，无法解析时返回 None"""
+    if not expired_time:
+        return None
+    value = str(expired_time).strip()
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        logger.warning(f"unrecognized ExpiredTime: {expired_time}")
+        return None
+
+
+def credential_key(credential: Credential) -> Tuple[str, str, str]:
+    secret_digest = hashlib.sha256(
+        f"{credential.secret_key}:{credential.security_token}".encode("utf-8")).hexdigest()
+    return credential.access_key, secret_digest, credential.expired_time or ""
+
+
+class ResourceCache:
+    """
+    按凭证缓存 TosResource 实例 (及其内部的 TosClientV2)
+    条目在 ttl 到期或 STS 凭证过期前淘汰，超过 max_size 时按 LRU 淘汰
+    """
+
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_create(self, resource_cls: Type[TosResource], key: tuple, factory: Callable[[], TosResource],
+                      expired_time: Optional[str] = None) -> TosResource:
+        cache_key = (resource_cls.__name__,) + key
+        now = time.time()
+
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            resource, deadline = entry
+            if deadline > now:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return resource
+            del self._entries[cache_key]
+            self.evictions += 1
+
+        self.misses += 1
+        resource = factory()
+
+        deadline = now + self.ttl
+        expired_at = parse_expired_time(expired_time)
+        if expired_at is not None:
+            deadline = min(deadline, expired_at - EXPIRY_SKEW_SECONDS)
+        if self.max_size <= 0 or deadline <= now:
+            return resource
+
+        self._entries[cache_key] = (resource, deadline)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return resource
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -1,5 +1,7 @@
+import asyncio
 import logging
-from typing import List, Optional
+import time
+from typing import AsyncIterator, List, Optional
 
 from mcp_server_tos.resources.service import TosResource
 
@@ -15,28 +17,33 @@ class BucketResource(TosResource):
 
     def __init__(self, config: TosConfig):
         super(BucketResource, self).__init__(config)
+        self.list_buckets_cache_ttl = config.list_buckets_cache_ttl
+        # (过期时间, 桶列表)，实例按凭证缓存，因此该结果也按凭证隔离
+        self._buckets_cache = None
 
     async def list_buckets(self) -> List[dict]:
         """
-        调用 ListBuckets 接口列举桶
+        调用 ListBuckets 接口列举桶，结果在 list_buckets_cache_ttl 秒内复用
         api: https://www.volcengine.com/docs/6349/74850
         """
+        if self._buckets_cache is not None and self._buckets_cache[0] > time.monotonic():
+            return self._buckets_cache[1]
+
+        resp = await self.get(bucket="")
+        if resp.status_code != 200:
+            raise Exception(f"list buckets failed, tos server return: {resp.json()}")
+
+        buckets = resp.json().get("Buckets", [])
         if self.configured_buckets:
-            resp = await self.get(bucket="")
-            configured_bucket_list = [
-                bucket for bucket in resp.json().get("buckets", [])
-                if bucket['Name'] in self.configured_buckets
-            ]
-            return configured_bucket_list
-        else:
-            resp = await self.get(bucket="")
-            if resp.status_code == 200:
-                return resp.json().get("Buckets", [])
-            else:
-                raise Exception(f"list buckets failed, tos server return: {resp.json()}")
+            buckets = [bucket for bucket in buckets if bucket['Name'] in self.configured_buckets]
+
+        if self.list_buckets_cache_ttl > 0:
+            self._buckets_cache = (time.monotonic() + self.list_buckets_cache_ttl, buckets)
+        return buckets
 
     async def list_objects(self, bucket: str, prefix: Optional[str] = None, start_after: Optional[str] = None,
-                           continuation_token: Optional[str] = None) -> str:
+                           continuation_token: Optional[str] = None, delimiter: Optional[str] = None,
+                           max_keys: Optional[int] = None) -> dict:
         """
         调用 ListObjects 接口列举桶
         api: https://www.volcengine.com/docs/6349/357812
@@ -45,6 +52,8 @@ class BucketResource(TosResource):
             prefix: 对象前缀
             start_after: 起始位置
             continuation_token: 分页标记
+            delimiter: 分组字符，指定后同一前缀下的对象折叠到 CommonPrefixes
+            max_keys: 单页最多返回的对象数
         """
 
         query = {"list-type": "2"}
@@ -54,9 +63,160 @@ class BucketResource(TosResource):
             query["start-after"] = start_after
         if continuation_token:
             query["continuation-token"] = continuation_token
+        if delimiter:
+            query["delimiter"] = delimiter
+        if max_keys:
+            query["max-keys"] = str(max_keys)
 
         resp = await self.get(bucket=bucket, params=query)
         if resp.status_code == 200:
             return resp.json()
         else:
             raise Exception(f"list objects failed, tos server return: {resp.json()}")
+
+    async def walk_prefix(self, bucket: str, prefix: Optional[str] = None, delimiter: str = "/",
+                          max_concurrency: int = 8, buffer_size: int = 1000) -> AsyncIterator[dict]:
+        """
+        遍历前缀下的所有对象，按 delimiter 拆分出的子前缀 (CommonPrefixes) 并发列举
+        结果以流的方式逐个产出，最多缓存 buffer_size 个对象，消费方停止迭代时列举随之停止
+        Args:
+            bucket: 桶名
+            prefix: 对象前缀
+            delimiter: 拆分子前缀的分组字符
+            max_concurrency: 同时列举的子前缀数量上限
+            buffer_size: 尚未被消费的对象数量上限
+        """
+        prefix_queue: asyncio.Queue = asyncio.Queue()
+        output_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, buffer_size))
+        prefix_queue.put_nowait(prefix or "")
+        done = object()
+
+        async def list_prefix(current_prefix: str):
+            continuation_token = None
+            while True:
+                page = await self.list_objects(bucket, prefix=current_prefix or None,
+                                               continuation_token=continuation_token, delimiter=delimiter)
+                for common_prefix in page.get("CommonPrefixes") or []:
+                    prefix_queue.put_nowait(common_prefix["Prefix"])
+                for item in page.get("Contents") or []:
+                    await output_queue.put(item)
+                if not page.get("IsTruncated"):
+                    return
+                continuation_token = page.get("NextContinuationToken")
+
+        async def worker():
+            while True:
+                current_prefix = await prefix_queue.get()
+                try:
+                    await list_prefix(current_prefix)
+                finally:
+                    prefix_queue.task_done()
+
+        async def run():
+            workers = [asyncio.create_task(worker()) for _ in range(max(1, max_concurrency))]
+            try:
+                join_task = asyncio.ensure_future(prefix_queue.join())
+                # 任一 worker 异常时立即结束，否则等待所有前缀列举完成
+                await asyncio.wait([join_task, *workers], return_when=asyncio.FIRST_COMPLETED)
+                for task in workers:
+                    if task.done() and task.exception() is not None:
+                        join_task.cancel()
+                        raise task.exception()
+                await join_task
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+            await output_queue.put(done)
+
+        runner = asyncio.create_task(run())
+        try:
+            while True:
+                get_task = asyncio.ensure_future(output_queue.get())
+                await asyncio.wait([get_task, runner], return_when=asyncio.FIRST_COMPLETED)
+                if not get_task.done():
+                    get_task.cancel()
+                    # runner 在产出 done 之前结束，说明列举失败
+                    runner.result()
+                    continue
+                item = get_task.result()
+                if item is done:
+                    return
+                yield item
+        finally:
+            if not runner.done():
+                runner.cancel()
+                await asyncio.gather(runner, return_exceptions=True)
+
+    async def summarize_prefix(self, bucket: str, prefix: Optional[str] = None, delimiter: str = "/",
+                               max_concurrency: int = 8, max_objects: Optional[int] = None,
+                               sample_size: int = 0) -> dict:
+        """
+        汇总前缀下对象的数量、总大小、大小分布以及最新/最旧的对象，不在内存中保留全部对象
+        Args:
+            bucket: 桶名
+            prefix: 对象前缀
+            delimiter: 拆分子前缀的分组字符
+            max_concurrency: 同时列举的子前缀数量上限
+            max_objects: 最多统计的对象数，超出后停止并标记 truncated
+            sample_size: 返回的样例对象数量
+        """
+        histogram = {label: 0 for _, label in SIZE_HISTOGRAM_BUCKETS}
+        summary = {
+            "bucket": bucket,
+            "prefix": prefix or "",
+            "object_count": 0,
+            "total_bytes": 0,
+            "size_histogram": histogram,
+            "largest": None,
+            "newest": None,
+            "oldest": None,
+            "samples": [],
+            "truncated": False,
+        }
+
+        walker = self.walk_prefix(bucket, prefix, delimiter, max_concurrency)
+        try:
+            async for item in walker:
+                size = int(item.get("Size", 0))
+                summary["object_count"] += 1
+                summary["total_bytes"] += size
+                histogram[_size_bucket_label(size)] += 1
+
+                entry = {"Key": item.get("Key"), "Size": size, "LastModified": item.get("LastModified")}
+                if summary["largest"] is None or size > summary["largest"]["Size"]:
+                    summary["largest"] = entry
+                if entry["LastModified"]:
+                    if summary["newest"] is None or entry["LastModified"] > summary["newest"]["LastModified"]:
+                        summary["newest"] = entry
+                    if summary["oldest"] is None or entry["LastModified"] < summary["oldest"]["LastModified"]:
+                        summary["oldest"] = entry
+                if len(summary["samples"]) < sample_size:
+                    summary["samples"].append(entry)
+
+                if max_objects is not None and summary["object_count"] >= max_objects:
+                    summary["truncated"] = True
+                    break
+        finally:
+            await walker.aclose()
+
+        return summary
+
+
+# (上界, 标签)，对象大小小于上界时计入该区间
+SIZE_HISTOGRAM_BUCKETS = [
+    (1024, "<1KiB"),
+    (64 * 1024, "1KiB-64KiB"),
+    (1024 * 1024, "64KiB-1MiB"),
+    (16 * 1024 * 1024, "1MiB-16MiB"),
+    (256 * 1024 * 1024, "16MiB-256MiB"),
+    (1024 * 1024 * 1024, "256MiB-1GiB"),
+    (float("inf"), ">=1GiB"),
+]
+
+
+def _size_bucket_label(size: int) -> str:
+    for upper, label in SIZE_HISTOGRAM_BUCKETS:
+        if size < upper:
+            return label
+    return SIZE_HISTOGRAM_BUCKETS[-1][1]
@@ -1,5 +1,9 @@
+import asyncio
 import base64
+import codecs
+import json
 import logging
+from typing import Optional, Tuple
 
 from mcp_server_tos.config import TosConfig
 from mcp_server_tos.resources.service import TosResource
@@ -15,6 +19,8 @@ class ObjectResource(TosResource):
     def __init__(self, config: TosConfig):
         super(ObjectResource, self).__init__(config)
         self.max_object_size = config.max_object_size
+        self.range_part_size = max(1, config.range_part_size)
+        self.range_concurrency = max(1, config.range_concurrency)
 
     async def get_object(self, bucket_name: str, key: str) -> str:
         """
@@ -30,11 +36,12 @@ class ObjectResource(TosResource):
 
         response = None
         try:
-            response = await self.get(bucket=bucket_name, key=key)
+            response = await self.get(bucket=bucket_name, key=key, stream=True)
             if response.status_code == 200 or response.status_code == 206:
                 if int(response.headers.get('content-length', "0")) > self.max_object_size:
                     raise Exception(
-                        f"Bucket: {bucket_name} object: {key} is too large, more than {self.max_object_size} bytes")
+                        f"Bucket: {bucket_name} object: {key} is too large, more than {self.max_object_size} bytes, "
+                        f"use read_object to read it window by window")
 
                 content = bytearray()
                 async for chunk in response.aiter_bytes(chunk_size):
@@ -45,11 +52,151 @@ class ObjectResource(TosResource):
                 else:
                     return base64.b64encode(content).decode()
             else:
+                await response.aread()
                 raise Exception(f"get object failed, tos server return: {response.json()}")
         finally:
             if response is not None:
                 await response.aclose()
 
+    async def read_object(self, bucket_name: str, key: str, offset: int = 0, length: Optional[int] = None,
+                          continuation_token: Optional[str] = None) -> dict:
+        """
+        以 Range GET 读取对象的一个窗口，窗口大小不超过 max_object_size
+        窗口大于 range_part_size 时拆分为多个 Range 并发获取；文本对象按 UTF-8 增量解码，
+        不会在多字节字符中间截断，返回的 continuation_token 可用于读取下一个窗口
+        Args:
+            bucket_name: 存储桶名称
+            key: 对象名称
+            offset: 起始字节偏移
+            length: 窗口字节数，默认并且最多为 max_object_size
+            continuation_token: 上一个窗口返回的续读标记，指定后忽略 offset
+        Returns:
+            窗口内容及续读信息
+        """
+        expected_etag = None
+        if continuation_token:
+            token = _decode_continuation_token(continuation_token)
+            if token.get("bucket") != bucket_name or token.get("key") != key:
+                raise Exception("continuation token does not belong to this object")
+            offset = token["offset"]
+            expected_etag = token.get("etag")
+
+        if offset < 0:
+            raise Exception("offset must not be negative")
+        window = self.max_object_size if length is None else min(length, self.max_object_size)
+        if window <= 0:
+            raise Exception("length must be positive")
+
+        # 首个分片单独获取，用于得到对象大小和 ETag
+        first_end = offset + min(window, self.range_part_size) - 1
+        data, object_size, etag = await self._get_range(bucket_name, key, offset, first_end)
+        if expected_etag and etag and etag != expected_etag:
+            raise Exception(f"Bucket: {bucket_name} object: {key} has changed since the continuation token was issued")
+
+        window_end = min(offset + window, object_size)
+        content = bytearray(data)
+        if offset + len(content) < window_end:
+            ranges = []
+            start = offset + len(content)
+            while start < window_end:
+                end = min(start + self.range_part_size, window_end) - 1
+                ranges.append((start, end))
+                start = end + 1
+
+            semaphore = asyncio.Semaphore(self.range_concurrency)
+
+            async def fetch(range_start: int, range_end: int) -> bytes:
+                async with semaphore:
+                    part, _, part_etag = await self._get_range(bucket_name, key, range_start, range_end)
+                    if etag and part_etag and part_etag != etag:
+                        raise Exception(f"Bucket: {bucket_name} object: {key} changed while being read")
+                    return part
+
+            for part in await asyncio.gather(*[fetch(start, end) for start, end in ranges]):
+                content.extend(part)
+
+        eof = offset + len(content) >= object_size
+        if is_text_file(key):
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            text = decoder.decode(bytes(content), final=eof)
+            consumed = len(content) - len(decoder.getstate()[0])
+            if consumed == 0 and content:
+                # 窗口小于一个字符，直接按替换字符输出
+                text = bytes(content).decode("utf-8", errors="replace")
+                consumed = len(content)
+            result = {"encoding": "text", "content": text}
+        else:
+            consumed = len(content)
+            result = {"encoding": "base64", "content": base64.b64encode(content).decode()}
+
+        next_offset = offset + consumed
+        result.update({
+            "bucket": bucket_name,
+            "key": key,
+            "offset": offset,
+            "length": consumed,
+            "object_size": object_size,
+            "eof": next_offset >= object_size,
+            "continuation_token": None if next_offset >= object_size else _encode_continuation_token(
+                bucket_name, key, next_offset, etag),
+        })
+        return result
+
+    async def _get_range(self, bucket_name: str, key: str, start: int, end: int) -> Tuple[bytes, int, str]:
+        """
+        获取对象 [start, end] 字节范围的内容
+        Returns:
+            (内容, 对象总大小, ETag)
+        """
+        response = None
+        try:
+            response = await self.get(bucket=bucket_name, key=key, headers={"Range": f"bytes={start}-{end}"},
+                                      stream=True)
+            etag = response.headers.get("etag", "")
+            if response.status_code == 416:
+                # 起始偏移超出对象大小，Content-Range 形如 bytes */{size}
+                return b"", _parse_object_size(response.headers.get("content-range"), start), etag
+            if response.status_code not in (200, 206):
+                await response.aread()
+                raise Exception(f"get object failed, tos server return: {response.json()}")
+
+            limit = end - start + 1
+            content = bytearray()
+            async for chunk in response.aiter_bytes(69 * 1024):
+                content.extend(chunk)
+                if response.status_code == 200 and len(content) >= start + limit:
+                    # 服务端忽略了 Range，只保留请求的范围
+                    break
+
+            if response.status_code == 200:
+                object_size = int(response.headers.get("content-length", len(content)))
+                return bytes(content[start:start + limit]), object_size, etag
+            return bytes(content), _parse_object_size(response.headers.get("content-range"), start + len(content)), etag
+        finally:
+            if response is not None:
+                await response.aclose()
+
+
+def _parse_object_size(content_range: Optional[str], default: int) -> int:
+    """解析 Content-Range: bytes 0-99/12345 中的对象总大小"""
+    if content_range and "/" in content_range:
+        total = content_range.rsplit("/", 1)[1].strip()
+        if total.isdigit():
+            return int(total)
+    return default
+
+
+def _encode_continuation_token(bucket_name: str, key: str, offset: int, etag: str) -> str:
+    payload = json.dumps({"bucket": bucket_name, "key": key, "offset": offset, "etag": etag})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode()
+
+
+def _decode_continuation_token(token: str) -> dict:
+    try:
+        return json.loads(base64.urlsafe_b64decode(token.encode("utf-8")).decode("utf-8"))
+    except Exception:
+        raise Exception("invalid continuation token")
+
 
 def is_text_file(key: str) -> bool:
     """Determine if a file is text-based by its extension"""
@@ -1,6 +1,11 @@
 import asyncio
+import functools
 import logging
 import os
+import random
+import threading
+import weakref
+from collections import defaultdict
 from typing import List, Dict
 from urllib.parse import quote
 
@@ -14,16 +19,151 @@ from tos.http import Request
 UNSIGNED_PAYLOAD = 'UNSIGNED-PAYLOAD'
 TOS_USER_AGENT = 've-tos-python-sdk/v2.8.1 (linux/amd64;python3.12.0) -- TOS/MCP Server/v0.1.0'
 
+# 重试策略: 带抖动的指数退避，并受全局重试预算约束
+MAX_ATTEMPTS = 4
+BACKOFF_BASE_SECONDS = 0.2
+BACKOFF_MAX_SECONDS = 5.0
+# 每个请求为重试预算存入的令牌数，即重试量最多约为请求量的 20%
+RETRY_BUDGET_RATIO = 0.2
+# 预算的最小保底与上限，保证低流量时也能重试
+RETRY_BUDGET_MIN_TOKENS = 10
+RETRY_BUDGET_MAX_TOKENS = 100
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE"}
+
 logger = logging.getLogger(__name__)
 
-_global_client = httpx.AsyncClient(
-    limits=Limits(
-        max_connections=200,
-        max_keepalive_connections=50,
-        keepalive_expiry=30
-    ),
-    timeout=30.0,
-)
+# httpx.AsyncClient 的连接绑定在创建它的事件循环上，因此按事件循环维护连接池
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """获取当前事件循环共享的连接池客户端，所有 TOS 请求都通过它发送"""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=Limits(
+                    max_connections=200,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=30
+                ),
+                timeout=30.0,
+            )
+            _clients[loop] = client
+        return client
+
+
+async def close_http_client():
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+class RetryBudget:
+    """
+    重试预算: 每个请求存入 ratio 个令牌，每次重试消耗一个令牌，
+    避免服务端故障时重试放大流量
+    """
+
+    def __init__(self, ratio: float, min_tokens: int, max_tokens: int):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = float(min_tokens)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+
+_retry_budget = RetryBudget(RETRY_BUDGET_RATIO, RETRY_BUDGET_MIN_TOKENS, RETRY_BUDGET_MAX_TOKENS)
+
+# host -> 指标计数
+_host_metrics: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+
+def _record(host: str, name: str, value: int = 1):
+    _host_metrics[host][name] += value
+
+
+def get_connection_metrics() -> dict:
+    """按 host 统计的请求、重试、错误以及新建连接数，requests - new_connections 即复用的连接次数"""
+    return {
+        "retry_budget_tokens": round(_retry_budget.tokens, 2),
+        "hosts": {host: dict(metrics) for host, metrics in _host_metrics.items()},
+    }
+
+
+def _backoff_seconds(attempt: int) -> float:
+    return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt)))
+
+
+def _is_replayable(data) -> bool:
+    return data is None or isinstance(data, (bytes, bytearray, str))
+
+
+async def _send(method: str, url: str, headers=None, params=None, content=None, stream: bool = False,
+                timeout=None) -> httpx.Response:
+    """
+    通过共享连接池发送请求
+    连接失败对所有方法重试；其余传输错误以及 5xx、429 仅对幂等方法重试
+    """
+    client = get_http_client()
+    host = httpx.URL(url).host
+    retryable = method in IDEMPOTENT_METHODS and _is_replayable(content)
+
+    async def trace(event_name: str, info: dict):
+        if event_name == "connection.connect_tcp.complete":
+            _record(host, "new_connections")
+
+    _retry_budget.deposit()
+    attempt = 0
+    while True:
+        attempt += 1
+        _record(host, "requests")
+        request = client.build_request(method, url, headers=headers, params=params, content=content,
+                                       timeout=timeout, extensions={"trace": trace})
+        try:
+            response = await client.send(request, stream=stream, follow_redirects=False)
+        except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+            _record(host, "errors")
+            if attempt < MAX_ATTEMPTS and _is_replayable(content) and _retry_budget.try_withdraw():
+                _record(host, "retries")
+                await asyncio.sleep(_backoff_seconds(attempt))
+                continue
+            raise e
+        except httpx.TransportError as e:
+            _record(host, "errors")
+            if attempt < MAX_ATTEMPTS and retryable and _retry_budget.try_withdraw():
+                _record(host, "retries")
+                await asyncio.sleep(_backoff_seconds(attempt))
+                continue
+            raise e
+
+        if response.status_code >= 500 or response.status_code == 429:
+            _record(host, "errors")
+            if attempt < MAX_ATTEMPTS and retryable and _retry_budget.try_withdraw():
+                await response.aclose()
+                _record(host, "retries")
+                await asyncio.sleep(_backoff_seconds(attempt))
+                continue
+        return response
 
 
 class TosResource:
@@ -42,13 +182,10 @@ class TosResource:
 
     def _get_configured_buckets(self) -> List[str]:
         """从环境变量加载预配置存储桶"""
-        bucket_list = os.getenv('TOS_BUCKETS')
-        if bucket_list:
-            return [b.strip() for b in bucket_list.split(',')]
-        return []
+        return list(_load_configured_buckets())
 
     async def get(self, bucket: str, key: str = None, headers: Dict[str, str] = None,
-                  params: Dict[str, str] = None):
+                  params: Dict[str, str] = None, stream: bool = False):
         if key is not None:
             _is_valid_object_name(key)
 
@@ -62,96 +199,78 @@ class TosResource:
 
         # 通过变量赋值,防止动态调整 auth endpoint 出现并发问题
         sign_out = self.client.pre_signed_url(HttpMethodType.Http_Method_Get, bucket, key, 3600, headers, params)
-        attempt = 0
-        while attempt < 3:
-            try:
-                response = await _global_client.get(sign_out.signed_url, follow_redirects=False,
-                                                    headers=headers, params=params,
-                                                    timeout=httpx.Timeout(connect=10, read=30, write=10, pool=10))
-                if response.status_code >= 500 or response.status_code == 429:
-                    await response.aclose()
-                    attempt += 1
-                    if attempt < 3:
-                        await asyncio.sleep(2 ** attempt)
-                        continue
-                    else:
-                        raise Exception(f"Failed after 3 retries for {bucket}/{key}")
-                else:
-                    return response
-            except Exception as e:
-                attempt += 1
-                if attempt < 3:
-                    await asyncio.sleep(2 ** attempt)
-                    continue
-                else:
-                    raise Exception(f"Failed after 3 retries for {bucket}/{key}")
-
-
-async def call(self, method: str, bucket: str, key: str = None, data=None, headers: Dict[str, str] = None,
-               params: Dict[str, str] = None):
-    if key is not None:
-        _is_valid_object_name(key)
-
-    headers = self._to_case_insensitive_dict(headers)
-    params = self._sanitize_dict(params)
-
-    if headers.get('x-tos-content-sha256') is None:
-        headers['x-tos-content-sha256'] = UNSIGNED_PAYLOAD
-
-    # 通过变量赋值,防止动态调整 auth endpoint 出现并发问题
-    auth = self.client.auth
-    endpoint = self.client.endpoint
-    url_str = self._make_virtual_host_url(bucket, key)
-    req = Request(method, self._make_virtual_host_url(bucket, key),
-                  _make_virtual_host_uri(key),
-                  _get_virtual_host(bucket, endpoint),
-                  data=data,
-                  params=params,
-                  headers=headers)
-
-    # 若auth 为空即为匿名请求，则不计算签名
-    if auth is not None:
-        auth.sign_request(req)
-    if 'User-Agent' not in req.headers:
-        req.headers['User-Agent'] = self.user_agent
-
-    try_count = 0
-    async with httpx.AsyncClient() as client:
-        while True:
-            try_count += 1
-            try:
-                response = await client.request(method, req.url, follow_redirects=False, headers=req.headers,
-                                                params=req.params, data=req.data, timeout=60)
-            except Exception as e:
-                if try_count <= 3:
-                    await asyncio.sleep(2 * try_count)
-                    continue
-                else:
-                    raise e
-            else:
-                if response.status_code == 200 or response.status_code == 206:
-                    return response
-                if method in ["GET", "HEAD"] and try_count <= 3 and (
-                        response.status_code >= 500 or response.status_code == 429):
-                    await asyncio.sleep(2 * try_count)
-                    continue
-                else:
-                    raise Exception(f'Call tos failed')
-
-
-def _to_case_insensitive_dict(self, headers: dict):
-    self._sanitize_dict(headers)
+        try:
+            # stream 为 True 时不预先读取响应体，调用方通过 aiter_bytes 读取并负责关闭
+            return await _send("GET", sign_out.signed_url, headers=headers, params=params, stream=stream,
+                               timeout=httpx.Timeout(connect=10, read=30, write=10, pool=10))
+        except Exception as e:
+            raise Exception(f"Failed after {MAX_ATTEMPTS} attempts for {bucket}/{key}: {e}")
+
+    async def call(self, method: str, bucket: str, key: str = None, data=None, headers: Dict[str, str] = None,
+                   params: Dict[str, str] = None, stream: bool = False) -> httpx.Response:
+        """以 Header 签名方式调用任意 TOS 接口 (PUT/POST/DELETE/HEAD 等)，与 GET 共享连接池"""
+        if key is not None:
+            _is_valid_object_name(key)
+
+        if self.client is None:
+            raise exceptions.TosClientError("TosClient is not initialized")
+
+        headers = _to_case_insensitive_dict(headers or {})
+        params = _sanitize_dict(params or {})
+
+        if headers.get('x-tos-content-sha256') is None:
+            headers['x-tos-content-sha256'] = UNSIGNED_PAYLOAD
+
+        # 通过变量赋值,防止动态调整 auth endpoint 出现并发问题
+        auth = self.client.auth
+        endpoint = self.client.endpoint
+        req = Request(method, _make_virtual_host_url(_get_host(endpoint), _get_scheme(endpoint), bucket, key),
+                      _make_virtual_host_uri(key),
+                      _get_virtual_host(bucket, endpoint),
+                      data=data,
+                      params=params,
+                      headers=headers)
+
+        # 若auth 为空即为匿名请求，则不计算签名
+        if auth is not None:
+            auth.sign_request(req)
+        if 'User-Agent' not in req.headers:
+            req.headers['User-Agent'] = self.user_agent
+
+        response = await _send(method, req.url, headers=dict(req.headers), params=req.params, content=req.data,
+                               stream=stream, timeout=60)
+        if response.status_code in (200, 204, 206):
+            return response
+
+        if stream:
+            await response.aread()
+            await response.aclose()
+        raise Exception(f"Call tos failed, method: {method}, bucket: {bucket}, key: {key}, "
+                        f"status: {response.status_code}, tos server return: {response.text}")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_configured_buckets() -> tuple:
+    # 环境变量在进程生命周期内不变，只解析一次
+    bucket_list = os.getenv('TOS_BUCKETS')
+    if bucket_list:
+        return tuple(b.strip() for b in bucket_list.split(','))
+    return ()
+
+
+def _to_case_insensitive_dict(headers: dict):
+    _sanitize_dict(headers)
     return CaseInsensitiveDict(headers)
 
 
-def _sanitize_dict(self, d: dict):
+def _sanitize_dict(d: dict):
     if d:
         for k, v in d.items():
             d[k] = v if isinstance(v, str) else v.decode() if isinstance(v, bytes) else str(v)
     return d
 
 
-def _make_virtual_host_url(self, host, scheme, bucket=None, key=None):
+def _make_virtual_host_url(host, scheme, bucket=None, key=None):
     url = host
     if bucket and key:
         url = '{0}.{1}/{2}'.format(bucket, host, quote(key, '/~'))
@@ -160,10 +279,10 @@ def _make_virtual_host_url(self, host, scheme, bucket=None, key=None):
     elif key:
         url = '{0}/{1}'.format(host, quote(key, '/~'))
 
-    return self._format_endpoint(scheme + url)
+    return _format_endpoint(scheme + url)
 
 
-def _format_endpoint(self, endpoint):
+def _format_endpoint(endpoint):
     if not endpoint.startswith('http://') and not endpoint.startswith('https://'):
         return 'https://' + endpoint
     else:
@@ -211,3 +330,9 @@ def _get_host(endpoint):
     if endpoint.startswith('https://'):
         return endpoint[8:]
     return endpoint
+
+
+def _get_scheme(endpoint):
+    if endpoint.startswith('http://'):
+        return 'http://'
+    return 'https://'
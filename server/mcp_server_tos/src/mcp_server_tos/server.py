@@ -2,7 +2,8 @@ import base64
 import json
 import logging
 import os
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Type
 
 from mcp.server.session import ServerSession
 from mcp.server.fastmcp import Context, FastMCP
@@ -10,13 +11,34 @@ from starlette.requests import Request
 
 from mcp_server_tos.config import load_config, TosConfig, TOS_CONFIG, LOCAL_DEPLOY_MODE
 from mcp_server_tos.credential import Credential
+from mcp_server_tos.resource_cache import ResourceCache, credential_key
 from mcp_server_tos.resources.bucket import BucketResource
 from mcp_server_tos.resources.object import ObjectResource
+from mcp_server_tos.resources.service import TosResource, close_http_client, get_connection_metrics
 
 logger = logging.getLogger(__name__)
 
+# sse/streamable-http 下 lifespan 随每个会话进出，只在最后一个会话结束时关闭共享连接池
+_active_sessions = 0
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[dict]:
+    global _active_sessions
+    _active_sessions += 1
+    try:
+        yield {}
+    finally:
+        _active_sessions -= 1
+        if _active_sessions == 0:
+            await close_http_client()
+
+
 # Initialize FastMCP server
-mcp = FastMCP("TOS MCP Server", host=os.getenv("MCP_SERVER_HOST", "127.0.0.1"), port=int(os.getenv("PORT", "8000")))
+mcp = FastMCP("TOS MCP Server", host=os.getenv("MCP_SERVER_HOST", "127.0.0.1"), port=int(os.getenv("PORT", "8000")),
+              lifespan=lifespan)
+
+RESOURCE_CACHE = ResourceCache(max_size=TOS_CONFIG.resource_cache_size, ttl=TOS_CONFIG.resource_cache_ttl)
 
 
 def get_credential_from_request():
@@ -58,11 +80,11 @@ def get_credential_from_request():
         raise
 
 
-def get_tos_config() -> TosConfig:
+def get_tos_config(credential: Optional[Credential] = None) -> TosConfig:
     if TOS_CONFIG.deploy_mode == LOCAL_DEPLOY_MODE:
         return TOS_CONFIG
     else:
-        credential = get_credential_from_request()
+        credential = credential or get_credential_from_request()
         return TosConfig(
             access_key=credential.access_key,
             secret_key=credential.secret_key,
@@ -71,10 +93,27 @@ def get_tos_config() -> TosConfig:
             endpoint=TOS_CONFIG.endpoint,
             deploy_mode=TOS_CONFIG.deploy_mode,
             max_object_size=TOS_CONFIG.max_object_size,
-            buckets=[]
+            buckets=[],
+            range_part_size=TOS_CONFIG.range_part_size,
+            range_concurrency=TOS_CONFIG.range_concurrency,
+            resource_cache_size=TOS_CONFIG.resource_cache_size,
+            resource_cache_ttl=TOS_CONFIG.resource_cache_ttl,
+            list_buckets_cache_ttl=TOS_CONFIG.list_buckets_cache_ttl,
         )
 
 
+def get_tos_resource(resource_cls: Type[TosResource]) -> TosResource:
+    """获取按凭证缓存的 TosResource 实例，远端模式下随 STS ExpiredTime 过期"""
+    if TOS_CONFIG.deploy_mode == LOCAL_DEPLOY_MODE:
+        return RESOURCE_CACHE.get_or_create(resource_cls, (LOCAL_DEPLOY_MODE,),
+                                            lambda: resource_cls(TOS_CONFIG))
+
+    credential = get_credential_from_request()
+    return RESOURCE_CACHE.get_or_create(resource_cls, credential_key(credential),
+                                        lambda: resource_cls(get_tos_config(credential)),
+                                        expired_time=credential.expired_time)
+
+
 @mcp.tool()
 async def list_buckets():
     """
@@ -83,8 +122,7 @@ async def list_buckets():
         A list of buckets.
     """
     try:
-        config = get_tos_config()
-        tos_resource = BucketResource(config)
+        tos_resource = get_tos_resource(BucketResource)
         buckets = await tos_resource.list_buckets()
         return buckets
     except Exception:
@@ -105,14 +143,36 @@ async def list_objects(bucket: str, prefix: Optional[str] = None, start_after: O
         A list of objects.
     """
     try:
-        config = get_tos_config()
-        tos_resource = BucketResource(config)
+        tos_resource = get_tos_resource(BucketResource)
         objects = await tos_resource.list_objects(bucket, prefix, start_after, continuation_token)
         return objects
     except Exception:
         raise
 
 
+@mcp.tool()
+async def summarize_prefix(bucket: str, prefix: Optional[str] = None, delimiter: str = "/",
+                           max_concurrency: int = 8, max_objects: Optional[int] = None, sample_size: int = 10):
+    """
+    Summarizes all objects under a prefix in one call, walking sub prefixes concurrently on the server side.
+    Args:
+        bucket: The name of the bucket.
+        prefix: The prefix to summarize, defaults to the whole bucket.
+        delimiter: The delimiter used to split the prefix into sub prefixes listed in parallel, defaults to "/".
+        max_concurrency: The maximum number of sub prefixes listed at the same time, defaults to 8.
+        max_objects: Stop after this many objects and mark the summary as truncated, defaults to no limit.
+        sample_size: The number of example objects to return, defaults to 10.
+    Returns:
+        The object count, total bytes, size histogram, largest/newest/oldest objects and a few sample objects.
+    """
+    try:
+        tos_resource = get_tos_resource(BucketResource)
+        return await tos_resource.summarize_prefix(bucket, prefix, delimiter, max_concurrency, max_objects,
+                                                   sample_size)
+    except Exception:
+        raise
+
+
 @mcp.tool()
 async def get_object(bucket: str, key: str):
     """
@@ -125,9 +185,42 @@ async def get_object(bucket: str, key: str):
         If the object content is binary format, return the content as base64 encoded string.
     """
     try:
-        config = get_tos_config()
-        tos_resource = ObjectResource(config)
+        tos_resource = get_tos_resource(ObjectResource)
         content = await tos_resource.get_object(bucket, key)
         return content
     except Exception:
         raise
+
+
+@mcp.tool()
+async def read_object(bucket: str, key: str, offset: int = 0, length: Optional[int] = None,
+                      continuation_token: Optional[str] = None):
+    """
+    Reads a window of an object from VolcEngine TOS with ranged GETs, so large logs and CSVs can be paged through.
+    Args:
+        bucket: The name of the bucket.
+        key: The key of the object.
+        offset: The byte offset to start reading from, defaults to 0.
+        length: The number of bytes to read, defaults to and is capped at the max object size.
+        continuation_token: The continuation_token returned by the previous call, overrides offset.
+    Returns:
+        The window content (text for text objects, base64 encoded string otherwise), its offset and length,
+        the object size, whether the end of the object is reached and the continuation_token of the next window.
+    """
+    try:
+        tos_resource = get_tos_resource(ObjectResource)
+        return await tos_resource.read_object(bucket, key, offset, length, continuation_token)
+    except Exception:
+        raise
+
+
+@mcp.resource("tos://stats", mime_type="application/json")
+def get_stats_resource():
+    """
+    Connection pool and resource cache statistics of the server.
+    Returns:
+        Per-host requests, retries, errors and new connections, the retry budget and resource cache hits.
+    """
+    stats = get_connection_metrics()
+    stats["resource_cache"] = RESOURCE_CACHE.stats()
+    return json.dumps(stats, ensure_ascii=False, indent=2)
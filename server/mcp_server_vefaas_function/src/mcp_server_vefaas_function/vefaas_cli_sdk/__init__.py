@@ -9,13 +9,20 @@ from .deploy import (
     DeployResult,
     VeFaaSClient,
     deploy_application,
+    deploy_application_async,
+    run_blocking,
+    AdaptivePollInterval,
     get_console_url,
     get_application_console_url,
     extract_access_url_from_cloud_resource,
     wait_for_function_release,
     wait_for_application_deploy,
     wait_for_dependency_install,
+    wait_for_function_release_async,
+    wait_for_application_deploy_async,
+    wait_for_dependency_install_async,
 )
+from .upload_cache import UploadCache, PackageResult
 from .config import (
     VefaasConfig,
     FunctionConfig,
@@ -35,12 +42,21 @@ __all__ = [
     "DeployResult",
     "VeFaaSClient",
     "deploy_application",
+    "deploy_application_async",
+    "run_blocking",
+    "AdaptivePollInterval",
     "get_console_url",
     "get_application_console_url",
     "extract_access_url_from_cloud_resource",
     "wait_for_function_release",
     "wait_for_application_deploy",
     "wait_for_dependency_install",
+    "wait_for_function_release_async",
+    "wait_for_application_deploy_async",
+    "wait_for_dependency_install_async",
+    # Incremental upload
+    "UploadCache",
+    "PackageResult",
     # Config
     "VefaasConfig",
     "FunctionConfig",
@@ -10,15 +10,20 @@ ported from vefaas-cli.
 Correct flow:
 1. Detect project configuration
 2. Build project (if needed, for Node.js/static sites)
-3. Package output directory
-4. Upload to TOS (GenTempTosObjectUrl)
+3. Package output directory (incremental, see upload_cache)
+4. Upload to TOS (GenTempTosObjectUrl), skipped if the function already runs the package
 5. Create/Update function with Source pointing to TOS location
 6. Wait for dependency installation (Python)
 7. Create and release application (includes function release)
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, List, Callable, Awaitable, Tuple
+import asyncio
+import contextvars
+import functools
+import threading
 import time
 import logging
 import json
@@ -30,6 +35,8 @@ import zipfile
 import pathspec
 
 from .detector import auto_detect, DetectionResult
+from .packaging import ArchiveEntry, write_archive
+from .upload_cache import UploadCache
 from .config import (
     VefaasConfig,
     FunctionConfig,
@@ -335,6 +342,19 @@ class VeFaaSClient:
         Returns:
             Inner source location string for use in CreateFunction/UpdateFunction
         """
+        return self._put_to_tos(zip_bytes, len(zip_bytes))
+
+    def upload_file_to_tos(self, file_path: str) -> str:
+        """
+        Upload a zip file to TOS, streamed from disk, and return inner source location.
+
+        Returns:
+            Inner source location string for use in CreateFunction/UpdateFunction
+        """
+        with open(file_path, "rb") as f:
+            return self._put_to_tos(f, os.fstat(f.fileno()).st_size)
+
+    def _put_to_tos(self, data, size: int) -> str:
         import requests
 
         # Get temporary upload URL
@@ -346,15 +366,16 @@ class VeFaaSClient:
         if not outer_url or not inner_location:
             raise ValueError("Failed to get TOS upload URL")
 
-        # Upload to TOS
-        response = requests.put(outer_url, data=zip_bytes, headers={
+        # Upload to TOS (file objects are streamed in chunks, never read fully into memory)
+        response = requests.put(outer_url, data=data, headers={
             "Content-Type": "application/octet-stream",
+            "Content-Length": str(size),
         })
 
         if response.status_code not in (200, 201):
             raise ValueError(f"Failed to upload to TOS: {response.status_code}")
 
-        logger.info(f"[deploy] Uploaded to TOS: {len(zip_bytes)} bytes")
+        logger.info(f"[deploy] Uploaded to TOS: {size} bytes")
         return inner_location
 
     # ========== Function Operations ==========
@@ -422,6 +443,13 @@ class VeFaaSClient:
         """Get function details"""
         return self.call("GetFunction", {"Id": function_id})
 
+    def get_function_source(self, function_id: str) -> Optional[str]:
+        """Get the function's current code Source (None if unavailable)"""
+        try:
+            return self.get_function(function_id).get("Result", {}).get("Source") or None
+        except Exception:
+            return None
+
     def release_function(self, function_id: str, revision_number: int = 0) -> dict:
         """Release/deploy a function"""
         return self._call_with_check("Release", {
@@ -546,126 +574,266 @@ def extract_access_url_from_cloud_resource(cloud_resource: str) -> Optional[str]
         return None
 
 
-def wait_for_function_release(
-    client: VeFaaSClient,
-    function_id: str,
-    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
-    poll_interval_seconds: int = DEFAULT_POLL_INTERVAL_SECONDS
-) -> dict:
-    """Wait for function release to complete."""
+# ========== Status polling ==========
+
+# Adaptive polling: poll quickly at first and right after a status change, then back off
+# (up to the caller's interval) while the status stays the same.
+POLL_INITIAL_INTERVAL_SECONDS = 1.0
+POLL_BACKOFF_FACTOR = 1.5
+
+# Maximum polling interval of the async waiters
+ASYNC_MAX_POLL_INTERVAL_SECONDS = 5
+
+# Blocking work of async deploys (API calls, builds, packaging) runs on this shared pool
+DEPLOY_MAX_WORKERS = int(os.getenv("VEFAAS_DEPLOY_MAX_WORKERS", "32"))
+
+_deploy_executor: Optional[ThreadPoolExecutor] = None
+_deploy_executor_lock = threading.Lock()
+
+
+def _get_deploy_executor() -> ThreadPoolExecutor:
+    global _deploy_executor
+    with _deploy_executor_lock:
+        if _deploy_executor is None:
+            _deploy_executor = ThreadPoolExecutor(max_workers=DEPLOY_MAX_WORKERS, thread_name_prefix="vefaas-deploy")
+        return _deploy_executor
+
+
+async def run_blocking(fn: Callable, *args, **kwargs):
+    """Run a blocking call on the deploy thread pool, keeping the caller's context variables."""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+    return await loop.run_in_executor(_get_deploy_executor(), call)
+
+
+class AdaptivePollInterval:
+    """Polling interval that starts short, resets on status changes and backs off up to max_interval."""
+
+    def __init__(self, max_interval: float, initial: float = POLL_INITIAL_INTERVAL_SECONDS,
+                 factor: float = POLL_BACKOFF_FACTOR):
+        self.max_interval = max_interval
+        self.initial = min(initial, max_interval)
+        self.factor = factor
+        self._interval = self.initial
+        self._last_status = None
+
+    def next(self, status: Optional[str]) -> float:
+        """Seconds to wait before the next poll, given the status just observed."""
+        if status != self._last_status:
+            self._last_status = status
+            self._interval = self.initial
+        else:
+            self._interval = min(self._interval * self.factor, self.max_interval)
+        return self._interval
+
+
+# A status check polls once and returns (status, result); result is set once finished.
+# It raises ValueError on a terminal failure, any other exception is logged and retried.
+StatusCheck = Callable[[], Tuple[str, Optional[dict]]]
+
+
+def _function_release_check(client: VeFaaSClient, function_id: str) -> StatusCheck:
+    def check():
+        result = client.get_release_status(function_id)
+        status = result.get("Result", {}).get("Status", "")
+
+        if status.lower() == "done":
+            return status, {"success": True, "status": status}
+
+        if status.lower() == "failed":
+            msg = result.get("Result", {}).get("StatusMessage", "")
+            raise ValueError(f"Function release failed: {msg}")
+
+        return status, None
+
+    return check
+
+
+def _application_deploy_error(client: VeFaaSClient, application_id: str, app: dict, status: str) -> ValueError:
+    """Build the error for a failed application deployment, with release details when available."""
+    # Try to get detailed error from GetReleaseStatus
+    error_details = {}
+    function_id = None
+    try:
+        # Try to get function_id from CloudResource first (like get_application_detail)
+        cloud_resource_str = app.get("CloudResource", "")
+        if cloud_resource_str:
+            try:
+                cloud_resource = json.loads(cloud_resource_str)
+                keys = list(cloud_resource.keys())
+                if keys:
+                    first_key = keys[0]
+                    function_id = cloud_resource.get(first_key, {}).get("function_id")
+            except:
+                pass
+
+        # Fallback: try Config
+        if not function_id:
+            config_str = app.get("Config", "")
+            if config_str:
+                try:
+                    config_data = json.loads(config_str)
+                    function_id = config_data.get("function", {}).get("function_id")
+                except:
+                    pass
+
+        if function_id:
+            rel_result = client.get_release_status(function_id)
+            rel = rel_result.get("Result", {})
+            status_msg = rel.get("StatusMessage", "").strip()
+            if status_msg:
+                error_details["error_message"] = status_msg
+            log_url = rel.get("FailedInstanceLogs", "").strip()
+            if log_url:
+                error_details["error_logs_uri"] = log_url
+            error_details["function_id"] = function_id
+    except Exception as ex:
+        logger.debug(f"Failed to get release status error details: {ex}")
+
+    console_url = f"https://console.volcengine.com/vefaas/region:vefaas+{client.region}/application/detail/{application_id}"
+
+    # Build detailed error message
+    error_parts = [f"Application deployment failed ({status})"]
+    if error_details.get("error_message"):
+        error_parts.append(f"Error: {error_details['error_message']}")
+    if error_details.get("error_logs_uri"):
+        error_parts.append(f"Logs: {error_details['error_logs_uri']}")
+    error_parts.append(f"Console: {console_url}")
+
+    return ValueError(". ".join(error_parts))
+
+
+def _application_deploy_check(client: VeFaaSClient, application_id: str) -> StatusCheck:
+    def check():
+        result = client.get_application(application_id)
+        app = result.get("Result", {})
+        status = app.get("Status", "")
+
+        if status.lower() == "deploy_success":
+            access_url = extract_access_url_from_cloud_resource(app.get("CloudResource"))
+            return status, {"success": True, "access_url": access_url}
+
+        if status.lower() in ("deploy_fail", "deleted", "delete_fail"):
+            raise _application_deploy_error(client, application_id, app, status)
+
+        return status, None
+
+    return check
+
+
+def _dependency_install_check(client: VeFaaSClient, function_id: str) -> StatusCheck:
+    poll_count = 0
+
+    def check():
+        nonlocal poll_count
+        poll_count += 1
+        try:
+            result = client.get_dependency_install_status(function_id)
+        except Exception as e:
+            logger.warning(f"[dependency] Error checking status: {e}")
+            # Multiple failures may indicate no dependency install task
+            if poll_count > 5:
+                return "", {"success": True, "status": "skipped"}
+            return "", None
+        status = result.get("Result", {}).get("Status", "")
+
+        # Success status
+        if status.lower() in ("succeeded", "success", "done"):
+            return status, {"success": True, "status": status}
+
+        # Failed status
+        if status.lower() == "failed":
+            raise ValueError("Dependency installation failed")
+
+        # In-progress status (Dequeued = queued, InProgress = installing)
+        if status.lower() in ("dequeued", "inprogress", "in_progress", "pending"):
+            # Normal intermediate status, continue polling
+            return status, None
+        if not status and poll_count > 3:
+            # Empty status may indicate no dependencies to install
+            return status, {"success": True, "status": "no_dependency"}
+        return status, None
+
+    return check
+
+
+def _wait_until_done(check: StatusCheck, timeout_seconds: float, poll_interval_seconds: float,
+                     tag: str, label: str, timeout_message: str) -> dict:
     start_time = time.time()
     last_status = ""
+    interval = AdaptivePollInterval(poll_interval_seconds)
 
     while time.time() - start_time < timeout_seconds:
+        status = None
         try:
-            result = client.get_release_status(function_id)
-            status = result.get("Result", {}).get("Status", "")
-
+            status, done = check()
             if status != last_status:
-                logger.info(f"[release] Function release status: {status}")
+                logger.info(f"[{tag}] {label}: {status}")
                 last_status = status
-
-            if status.lower() == "done":
-                return {"success": True, "status": status}
-
-            if status.lower() == "failed":
-                msg = result.get("Result", {}).get("StatusMessage", "")
-                raise ValueError(f"Function release failed: {msg}")
-
+            if done is not None:
+                return done
         except ValueError:
             raise
         except Exception as e:
-            logger.warning(f"[release] Error checking status: {e}")
+            logger.warning(f"[{tag}] Error checking status: {e}")
 
-        time.sleep(poll_interval_seconds)
+        time.sleep(interval.next(status))
 
-    raise ValueError(f"Function release timed out after {timeout_seconds} seconds")
+    raise ValueError(timeout_message)
 
 
-def wait_for_application_deploy(
-    client: VeFaaSClient,
-    application_id: str,
-    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
-    poll_interval_seconds: int = DEFAULT_POLL_INTERVAL_SECONDS
-) -> dict:
-    """Wait for application deployment to complete."""
+async def _wait_until_done_async(check: StatusCheck, timeout_seconds: float, poll_interval_seconds: float,
+                                 tag: str, label: str, timeout_message: str,
+                                 on_status: Optional[Callable[[str], Awaitable[None]]] = None) -> dict:
     start_time = time.time()
     last_status = ""
+    interval = AdaptivePollInterval(poll_interval_seconds)
 
     while time.time() - start_time < timeout_seconds:
+        status = None
         try:
-            result = client.get_application(application_id)
-            app = result.get("Result", {})
-            status = app.get("Status", "")
-
+            status, done = await run_blocking(check)
             if status != last_status:
-                logger.info(f"[deploy] Application status: {status}")
+                logger.info(f"[{tag}] {label}: {status}")
                 last_status = status
-
-            if status.lower() == "deploy_success":
-                access_url = extract_access_url_from_cloud_resource(app.get("CloudResource"))
-                return {"success": True, "access_url": access_url}
-
-            if status.lower() in ("deploy_fail", "deleted", "delete_fail"):
-                # Try to get detailed error from GetReleaseStatus
-                error_details = {}
-                function_id = None
-                try:
-                    # Try to get function_id from CloudResource first (like get_application_detail)
-                    cloud_resource_str = app.get("CloudResource", "")
-                    if cloud_resource_str:
-                        try:
-                            cloud_resource = json.loads(cloud_resource_str)
-                            keys = list(cloud_resource.keys())
-                            if keys:
-                                first_key = keys[0]
-                                function_id = cloud_resource.get(first_key, {}).get("function_id")
-                        except:
-                            pass
-
-                    # Fallback: try Config
-                    if not function_id:
-                        config_str = app.get("Config", "")
-                        if config_str:
-                            try:
-                                config_data = json.loads(config_str)
-                                function_id = config_data.get("function", {}).get("function_id")
-                            except:
-                                pass
-
-                    if function_id:
-                        rel_result = client.get_release_status(function_id)
-                        rel = rel_result.get("Result", {})
-                        status_msg = rel.get("StatusMessage", "").strip()
-                        if status_msg:
-                            error_details["error_message"] = status_msg
-                        log_url = rel.get("FailedInstanceLogs", "").strip()
-                        if log_url:
-                            error_details["error_logs_uri"] = log_url
-                        error_details["function_id"] = function_id
-                except Exception as ex:
-                    logger.debug(f"Failed to get release status error details: {ex}")
-
-                console_url = f"https://console.volcengine.com/vefaas/region:vefaas+{client.region}/application/detail/{application_id}"
-
-                # Build detailed error message
-                error_parts = [f"Application deployment failed ({status})"]
-                if error_details.get("error_message"):
-                    error_parts.append(f"Error: {error_details['error_message']}")
-                if error_details.get("error_logs_uri"):
-                    error_parts.append(f"Logs: {error_details['error_logs_uri']}")
-                error_parts.append(f"Console: {console_url}")
-
-                raise ValueError(". ".join(error_parts))
-
+                if on_status is not None and status:
+                    await on_status(status)
+            if done is not None:
+                return done
         except ValueError:
             raise
         except Exception as e:
-            logger.warning(f"[deploy] Error checking status: {e}")
+            logger.warning(f"[{tag}] Error checking status: {e}")
+
+        await asyncio.sleep(interval.next(status))
+
+    raise ValueError(timeout_message)
 
-        time.sleep(poll_interval_seconds)
 
-    raise ValueError(f"Deployment timed out after {timeout_seconds} seconds")
+def wait_for_function_release(
+    client: VeFaaSClient,
+    function_id: str,
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+    poll_interval_seconds: int = DEFAULT_POLL_INTERVAL_SECONDS
+) -> dict:
+    """Wait for function release to complete (polls at most every poll_interval_seconds)."""
+    return _wait_until_done(
+        _function_release_check(client, function_id), timeout_seconds, poll_interval_seconds,
+        "release", "Function release status", f"Function release timed out after {timeout_seconds} seconds",
+    )
+
+
+def wait_for_application_deploy(
+    client: VeFaaSClient,
+    application_id: str,
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+    poll_interval_seconds: int = DEFAULT_POLL_INTERVAL_SECONDS
+) -> dict:
+    """Wait for application deployment to complete (polls at most every poll_interval_seconds)."""
+    return _wait_until_done(
+        _application_deploy_check(client, application_id), timeout_seconds, poll_interval_seconds,
+        "deploy", "Application status", f"Deployment timed out after {timeout_seconds} seconds",
+    )
 
 
 def wait_for_dependency_install(
@@ -674,48 +842,56 @@ def wait_for_dependency_install(
     timeout_seconds: int = 300,
     poll_interval_seconds: int = 5
 ) -> dict:
-    """Wait for Python dependency installation to complete."""
-    start_time = time.time()
-    last_status = ""
-    poll_count = 0
-
-    while time.time() - start_time < timeout_seconds:
-        poll_count += 1
-        try:
-            result = client.get_dependency_install_status(function_id)
-            status = result.get("Result", {}).get("Status", "")
-
-            if status != last_status:
-                logger.info(f"[dependency] Installation status: {status}")
-                last_status = status
+    """Wait for Python dependency installation to complete (polls at most every poll_interval_seconds)."""
+    return _wait_until_done(
+        _dependency_install_check(client, function_id), timeout_seconds, poll_interval_seconds,
+        "dependency", "Installation status", f"Dependency installation timed out after {timeout_seconds} seconds",
+    )
 
-            # Success status
-            if status.lower() in ("succeeded", "success", "done"):
-                return {"success": True, "status": status}
 
-            # Failed status
-            if status.lower() == "failed":
-                raise ValueError("Dependency installation failed")
+async def wait_for_function_release_async(
+    client: VeFaaSClient,
+    function_id: str,
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+    poll_interval_seconds: float = ASYNC_MAX_POLL_INTERVAL_SECONDS,
+    on_status: Optional[Callable[[str], Awaitable[None]]] = None,
+) -> dict:
+    """Async wait_for_function_release; on_status is awaited on every status change."""
+    return await _wait_until_done_async(
+        _function_release_check(client, function_id), timeout_seconds, poll_interval_seconds,
+        "release", "Function release status", f"Function release timed out after {timeout_seconds} seconds",
+        on_status,
+    )
 
-            # In-progress status (Dequeued = queued, InProgress = installing)
-            if status.lower() in ("dequeued", "inprogress", "in_progress", "pending"):
-                # Normal intermediate status, continue polling
-                pass
-            elif not status and poll_count > 3:
-                # Empty status may indicate no dependencies to install
-                return {"success": True, "status": "no_dependency"}
 
-        except ValueError:
-            raise
-        except Exception as e:
-            logger.warning(f"[dependency] Error checking status: {e}")
-            # Multiple failures may indicate no dependency install task
-            if poll_count > 5:
-                return {"success": True, "status": "skipped"}
+async def wait_for_application_deploy_async(
+    client: VeFaaSClient,
+    application_id: str,
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+    poll_interval_seconds: float = ASYNC_MAX_POLL_INTERVAL_SECONDS,
+    on_status: Optional[Callable[[str], Awaitable[None]]] = None,
+) -> dict:
+    """Async wait_for_application_deploy; on_status is awaited on every status change."""
+    return await _wait_until_done_async(
+        _application_deploy_check(client, application_id), timeout_seconds, poll_interval_seconds,
+        "deploy", "Application status", f"Deployment timed out after {timeout_seconds} seconds",
+        on_status,
+    )
 
-        time.sleep(poll_interval_seconds)
 
-    raise ValueError(f"Dependency installation timed out after {timeout_seconds} seconds")
+async def wait_for_dependency_install_async(
+    client: VeFaaSClient,
+    function_id: str,
+    timeout_seconds: int = 300,
+    poll_interval_seconds: float = ASYNC_MAX_POLL_INTERVAL_SECONDS,
+    on_status: Optional[Callable[[str], Awaitable[None]]] = None,
+) -> dict:
+    """Async wait_for_dependency_install; on_status is awaited on every status change."""
+    return await _wait_until_done_async(
+        _dependency_install_check(client, function_id), timeout_seconds, poll_interval_seconds,
+        "dependency", "Installation status", f"Dependency installation timed out after {timeout_seconds} seconds",
+        on_status,
+    )
 
 
 def _run_build_command(project_path: str, build_command: str):
@@ -733,6 +909,71 @@ def _run_build_command(project_path: str, build_command: str):
     logger.info("[build] Build completed successfully")
 
 
+def _package_file_mode(filename: str, st_mode: int) -> int:
+    """Permissions stored for a packaged file: scripts always get execute permission (755)."""
+    original_mode = st_mode & 0o777
+    script_extensions = ('.sh', '.bash', '.py', '.pl', '.rb')
+    if filename.lower().endswith(script_extensions):
+        # Ensure execute permission: original | 0o755
+        return original_mode | 0o755
+    return original_mode
+
+
+def make_zip_info(arcname: str, mode: int) -> zipfile.ZipInfo:
+    """Create the ZipInfo for a packaged file, preserving permissions (especially executable)."""
+    info = zipfile.ZipInfo(arcname)
+    # Unix permissions stored in high 16 bits of external_attr
+    # Format: (permissions << 16) | (file_type << 28)
+    # 0o100000 = regular file
+    info.external_attr = (mode << 16) | (0o100000 << 16)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    return info
+
+
+def iter_package_files(
+    directory: str,
+    base_dir: Optional[str] = None,
+    include_gitignore: bool = True,
+    additional_patterns: Optional[List[str]] = None,
+):
+    """
+    Walk directory and yield the files to package, in a stable (sorted) order.
+
+    Yields:
+        (arcname, file_path, os.stat_result, mode) tuples
+    """
+    if base_dir is None:
+        base_dir = directory
+
+    # Load ignore patterns based on scenario
+    gitignore_patterns = read_gitignore_patterns(base_dir) if include_gitignore else []
+    vefaasignore_patterns = read_vefaasignore_patterns(base_dir)
+    spec = create_ignore_filter(gitignore_patterns, vefaasignore_patterns, additional_patterns)
+
+    for root, dirs, files in os.walk(directory):
+        rel_root = os.path.relpath(root, directory)
+        if rel_root == ".":
+            rel_root = ""
+
+        # Filter directories in-place to prevent descending into ignored dirs
+        dirs[:] = sorted(
+            d for d in dirs
+            if not spec.match_file(f"{rel_root}/{d}" if rel_root else d)
+            and not spec.match_file(f"{rel_root}/{d}/" if rel_root else f"{d}/")
+        )
+
+        for file in sorted(files):
+            arcname = f"{rel_root}/{file}" if rel_root else file
+
+            # Skip files matching ignore patterns
+            if spec.match_file(arcname):
+                continue
+
+            file_path = os.path.join(root, file)
+            file_stat = os.stat(file_path)
+            yield arcname, file_path, file_stat, _package_file_mode(file, file_stat.st_mode)
+
+
 def package_directory(directory: str, base_dir: Optional[str] = None, include_gitignore: bool = True) -> bytes:
     """
     Package directory into a zip file using pathspec for gitignore-style filtering.
@@ -745,97 +986,181 @@ def package_directory(directory: str, base_dir: Optional[str] = None, include_gi
             - False: Built output or function code upload (only .vefaasignore)
 
     Returns:
-        Zip file bytes
+        Zip file bytes (use UploadCache.package() to package to disk instead)
     """
-    if base_dir is None:
-        base_dir = directory
+    buffer = io.BytesIO()
+    write_archive(
+        (
+            ArchiveEntry(make_zip_info(arcname, mode), path=file_path)
+            for arcname, file_path, _, mode in iter_package_files(directory, base_dir, include_gitignore)
+        ),
+        buffer,
+    )
+    return buffer.getvalue()
 
-    # Load ignore patterns based on scenario
-    gitignore_patterns = read_gitignore_patterns(base_dir) if include_gitignore else []
-    vefaasignore_patterns = read_vefaasignore_patterns(base_dir)
-    spec = create_ignore_filter(gitignore_patterns, vefaasignore_patterns)
 
-    buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for root, dirs, files in os.walk(directory):
-            rel_root = os.path.relpath(root, directory)
-            if rel_root == ".":
-                rel_root = ""
+# Progress steps reported by deploy_application_async
+DEPLOY_STEPS = 7
 
-            # Filter directories in-place to prevent descending into ignored dirs
-            dirs[:] = [
-                d for d in dirs
-                if not spec.match_file(f"{rel_root}/{d}" if rel_root else d)
-                and not spec.match_file(f"{rel_root}/{d}/" if rel_root else f"{d}/")
-            ]
 
-            for file in files:
-                arcname = f"{rel_root}/{file}" if rel_root else file
+class _DeployProgress:
+    """
+    Progress notifications for a deploy: one per step, plus status updates within a step.
 
-                # Skip files matching ignore patterns
-                if spec.match_file(arcname):
-                    continue
+    Values increase strictly (as MCP requires): step N starts at N-1, and each status update
+    moves halfway towards N.
+    """
 
-                file_path = os.path.join(root, file)
+    def __init__(self, callback: Optional[Callable[[float, float, str], Awaitable[None]]], total: int = DEPLOY_STEPS):
+        self.callback = callback
+        self.total = total
+        self.value = 0.0
+        self.step_end = 0
+        self._sent = False
 
-                # Use ZipInfo to preserve file permissions (especially executable)
-                info = zipfile.ZipInfo(arcname)
+    async def step(self, number: int, message: str) -> None:
+        self.step_end = number
+        await self._send(float(number - 1), message)
 
-                # Get original file permissions
-                file_stat = os.stat(file_path)
-                original_mode = file_stat.st_mode & 0o777
+    async def update(self, message: str) -> None:
+        await self._send(self.value + (self.step_end - self.value) / 2, message)
 
-                # Grant execute permission (755) for script files
-                script_extensions = ('.sh', '.bash', '.py', '.pl', '.rb')
-                if file.lower().endswith(script_extensions):
-                    # Ensure execute permission: original | 0o755
-                    final_mode = original_mode | 0o755
-                else:
-                    final_mode = original_mode
+    async def done(self, message: str) -> None:
+        await self._send(float(self.total), message)
 
-                # Unix permissions stored in high 16 bits of external_attr
-                # Format: (permissions << 16) | (file_type << 28)
-                # 0o100000 = regular file
-                info.external_attr = (final_mode << 16) | (0o100000 << 16)
+    async def _send(self, value: float, message: str) -> None:
+        if self.callback is None or (self._sent and value <= self.value):
+            return
+        self.value = value
+        self._sent = True
+        try:
+            await self.callback(value, self.total, message)
+        except Exception as e:
+            logger.debug(f"[deploy] Failed to report progress: {e}")
 
-                # Read file content and write to zip
-                with open(file_path, 'rb') as f:
-                    zf.writestr(info, f.read())
 
-    buffer.seek(0)
-    zip_bytes = buffer.read()
-    return zip_bytes
+def _check_name_available(client: VeFaaSClient, name: str) -> None:
+    """Raise NAME_CONFLICT if an application with this name already exists."""
+    existing_app_id = client.find_application_by_name(name)
+    if existing_app_id:
+        raise ValueError(
+            f"NAME_CONFLICT: Application name '{name}' already exists (existing_application_id: {existing_app_id}). "
+            f"**YOU MUST ASK THE USER** to choose one of the following options:\n"
+            f"  1. Update existing application: Call deploy_application with application_id='{existing_app_id}'\n"
+            f"  2. Deploy as new application: Call deploy_application with a different name\n"
+            f"DO NOT automatically choose an option. Present both choices to the user and wait for their decision."
+        )
 
 
-def deploy_application(config: DeployConfig, client: VeFaaSClient) -> DeployResult:
+def _get_application_function_id(client: VeFaaSClient, application_id: str) -> str:
+    """Get the function_id of an existing application from its details."""
+    try:
+        app_detail = client.get_application(application_id)
+        app_data = app_detail.get("Result", {})
+        target_function_id = None
+
+        # Try to get function_id from CloudResource first (like vefaas-cli)
+        cloud_resource_str = app_data.get("CloudResource", "")
+        if cloud_resource_str:
+            try:
+                cloud_resource = json.loads(cloud_resource_str)
+                # CloudResource format: {"framework": {"function_id": "xxx", ...}}
+                keys = list(cloud_resource.keys())
+                if keys:
+                    first_key = keys[0]
+                    target_function_id = cloud_resource.get(first_key, {}).get("function_id")
+            except json.JSONDecodeError:
+                pass
+
+        # Fallback: try to get from Config
+        if not target_function_id:
+            config_str = app_data.get("Config", "")
+            if config_str:
+                try:
+                    config_data = json.loads(config_str)
+                    target_function_id = config_data.get("function", {}).get("function_id")
+                except json.JSONDecodeError:
+                    pass
+
+        if not target_function_id:
+            raise ValueError(
+                f"Could not find function_id in application {application_id}. "
+                "This application may not have a function associated with it, or it was created without a function. "
+                "Please use 'name' parameter to create a new application instead."
+            )
+        return target_function_id
+    except json.JSONDecodeError:
+        raise ValueError(f"Could not parse application data for {application_id}")
+
+
+def _prepare_static_site(config: DeployConfig, output_path: str, built: bool, log: Callable[[str], None]) -> None:
+    """Static sites need a DefaultCaddyFile in the output directory."""
+    out_dir = os.path.join(config.project_path, output_path) if output_path and output_path != "./" and output_path != "." else config.project_path
+    target_caddy = os.path.join(out_dir, DEFAULT_CADDYFILE_NAME)
+    if built:
+        root_caddy = os.path.join(config.project_path, DEFAULT_CADDYFILE_NAME)
+        if os.path.exists(root_caddy):
+            # Copy existing Caddyfile from project root to output
+            import shutil
+            os.makedirs(out_dir, exist_ok=True)
+            shutil.copy2(root_caddy, target_caddy)
+            log(f"  → Existing {DEFAULT_CADDYFILE_NAME} copied to output")
+        else:
+            # Generate new Caddyfile
+            ensure_caddyfile_in_output(config.project_path, output_path)
+            log(f"  → {DEFAULT_CADDYFILE_NAME} generated for static site")
+    elif not os.path.exists(target_caddy):
+        ensure_caddyfile_in_output(config.project_path, output_path)
+        log(f"  → {DEFAULT_CADDYFILE_NAME} generated for static site")
+
+
+async def deploy_application_async(
+    config: DeployConfig,
+    client: VeFaaSClient,
+    progress: Optional[Callable[[float, float, str], Awaitable[None]]] = None,
+) -> DeployResult:
     """
-    Deploy an application to veFaaS.
+    Deploy an application to veFaaS as an asyncio pipeline.
 
     Correct flow (from vefaas-cli):
     1. Detect project configuration
     2. Build project (if build_command exists and not skip_build)
-    3. Package output directory
-    4. Upload to TOS
+    3. Package output directory (reusing the previous package where unchanged)
+    4. Upload to TOS (skipped if the function already runs this package)
     5. Create/Update function with Source pointing to TOS
     6. Wait for dependency installation (Python)
-    7. Release function
-    8. Create application (if needed)
-    9. Release application
+    7. Create application (if needed) and release it
+
+    Blocking work (API calls, build, packaging) runs on a shared thread pool so many deploys
+    can run on one event loop. Independent stages run concurrently: steps 1-3 overlap with
+    resolving the target function and API gateway, and a new application is created while
+    dependencies install. Status polling backs off adaptively.
 
     Args:
         config: Deployment configuration
         client: VeFaaSClient instance
+        progress: Optional async callback(progress, total, message), e.g. Context.report_progress
 
     Returns:
         DeployResult with IDs and URLs
     """
     result = DeployResult()
+    reporter = _DeployProgress(progress)
 
     def log(msg: str):
         """Add message to result logs"""
         result.logs.append(msg)
         logger.info(f"[deploy] {msg}")
 
+    async def step(number: int, message: str):
+        log(f"[{number}/{DEPLOY_STEPS}] {message}")
+        await reporter.step(number, message)
+
+    def on_status(label: str):
+        async def report(status: str):
+            await reporter.update(f"{label}: {status}")
+        return report
+
     try:
         # Validate
         if not os.path.isabs(config.project_path):
@@ -845,7 +1170,7 @@ def deploy_application(config: DeployConfig, client: VeFaaSClient) -> DeployResu
 
         # Read existing config if application_id not provided
         # Only use config's application_id if regions match (cross-region deployment needs new app)
-        existing_config = read_config(config.project_path)
+        existing_config = await run_blocking(read_config, config.project_path)
         if existing_config:
             config_region = existing_config.function.region or "cn-beijing"
             if config_region == client.region:
@@ -862,20 +1187,12 @@ def deploy_application(config: DeployConfig, client: VeFaaSClient) -> DeployResu
 
         # 0. Early check for duplicate application name
         if config.name and not config.application_id:
-            existing_app_id = client.find_application_by_name(config.name)
-            if existing_app_id:
-                raise ValueError(
-                    f"NAME_CONFLICT: Application name '{config.name}' already exists (existing_application_id: {existing_app_id}). "
-                    f"**YOU MUST ASK THE USER** to choose one of the following options:\n"
-                    f"  1. Update existing application: Call deploy_application with application_id='{existing_app_id}'\n"
-                    f"  2. Deploy as new application: Call deploy_application with a different name\n"
-                    f"DO NOT automatically choose an option. Present both choices to the user and wait for their decision."
-                )
+            await run_blocking(_check_name_available, client, config.name)
 
         # 0.5 Early check: if updating existing app and deployment is in progress, return early
         if config.application_id:
             try:
-                app_status = client.get_application(config.application_id).get("Result", {})
+                app_status = (await run_blocking(client.get_application, config.application_id)).get("Result", {})
                 current_status = app_status.get("Status", "").lower()
                 if current_status in ("deploying", "releasing", "deploy_pendding"):
                     result.application_id = config.application_id
@@ -899,142 +1216,131 @@ def deploy_application(config: DeployConfig, client: VeFaaSClient) -> DeployResu
             except Exception as e:
                 log(f"[warning] Could not check application status: {e}")
 
-        # 1. Detect project
-        log("[1/7] Detecting project configuration...")
-        detection = auto_detect(config.project_path)
-        log(f"  → Detected: framework={detection.framework}, runtime={detection.runtime}")
+        async def prepare_package():
+            """Steps 1-3: detect, build and package"""
+            # 1. Detect project
+            await step(1, "Detecting project configuration...")
+            detection = await run_blocking(auto_detect, config.project_path)
+            log(f"  → Detected: framework={detection.framework}, runtime={detection.runtime}")
+
+            # Apply user overrides
+            build_command = config.build_command or detection.build_command
+            output_path = config.output_path or detection.output_path or "."
+            start_command = config.start_command or detection.start_command
+            port = config.port or detection.port
+            is_python = "python" in detection.runtime.lower()
+
+            # Validate start_command is required
+            if not start_command:
+                raise ValueError(
+                    "start_command is required but not provided. "
+                    "Please provide start_command parameter, e.g.:\n"
+                    "  - Python FastAPI: 'python -m uvicorn main:app --host 0.0.0.0 --port 8080'\n"
+                    "  - Python Flask: 'python -m flask run --host 0.0.0.0 --port 8080'\n"
+                    "  - Node.js: 'node server.js'\n"
+                    "  - Static site: 'npx serve . -l 8080' (serves current dir after build)\n"
+                    "Or call detect_project first to auto-detect the configuration."
+                )
 
-        # Apply user overrides
-        build_command = config.build_command or detection.build_command
-        output_path = config.output_path or detection.output_path or "."
-        start_command = config.start_command or detection.start_command
-        port = config.port or detection.port
-        is_python = "python" in detection.runtime.lower()
+            # Validate build_command is required for non-Python runtimes (unless skip_build)
+            if not is_python and not build_command and not config.skip_build:
+                raise ValueError(
+                    "build_command is required for non-Python runtimes but not provided. "
+                )
 
-        # Validate start_command is required
-        if not start_command:
-            raise ValueError(
-                "start_command is required but not provided. "
-                "Please provide start_command parameter, e.g.:\n"
-                "  - Python FastAPI: 'python -m uvicorn main:app --host 0.0.0.0 --port 8080'\n"
-                "  - Python Flask: 'python -m flask run --host 0.0.0.0 --port 8080'\n"
-                "  - Node.js: 'node server.js'\n"
-                "  - Static site: 'npx serve . -l 8080' (serves current dir after build)\n"
-                "Or call detect_project first to auto-detect the configuration."
-            )
+            # Validate port is required and remind about alignment with start_command
+            if not port:
+                raise ValueError(
+                    "port is required but not provided. "
+                    "Please provide port parameter.\n"
+                    "IMPORTANT: The port must match the actual listening port in your start_command.\n"
+                )
 
-        # Validate build_command is required for non-Python runtimes (unless skip_build)
-        if not is_python and not build_command and not config.skip_build:
-            raise ValueError(
-                "build_command is required for non-Python runtimes but not provided. "
-            )
+            # 2. Build project (if needed)
+            if not config.skip_build and build_command and not is_python:
+                await step(2, f"Building project: {build_command}")
+                await run_blocking(_run_build_command, config.project_path, build_command)
+                log("  → Build completed")
 
-        # Validate port is required and remind about alignment with start_command
-        if not port:
-            raise ValueError(
-                "port is required but not provided. "
-                "Please provide port parameter.\n"
-                "IMPORTANT: The port must match the actual listening port in your start_command.\n"
-            )
+                # For static sites, generate DefaultCaddyFile in output directory
+                if detection.is_static:
+                    await run_blocking(_prepare_static_site, config, output_path, True, log)
+            else:
+                await step(2, "Build skipped")
+                # Even if build is skipped, static sites still need Caddyfile
+                if detection.is_static:
+                    await run_blocking(_prepare_static_site, config, output_path, False, log)
+
+            # 3. Package output directory
+            # Python: include .gitignore (source code deployment)
+            # Non-Python: only .vefaasignore (built output doesn't need gitignore)
+            await step(3, "Packaging code...")
+            package_path = os.path.join(config.project_path, output_path) if output_path != "." else config.project_path
+            if not os.path.exists(package_path):
+                package_path = config.project_path  # Fallback to project root
+
+            upload_cache = UploadCache(package_path, base_dir=config.project_path, include_gitignore=is_python)
+            package = await run_blocking(upload_cache.package)
+            if package.unchanged:
+                log(f"  → No changes since last deploy, reusing package: {package.size / 1024:.1f} KB")
+            else:
+                log(
+                    f"  → Packaged: {package.size / 1024:.1f} KB "
+                    f"({package.reused_entries} unchanged files reused, {package.compressed_entries} compressed)"
+                )
+            return detection, build_command, output_path, start_command, port, is_python, upload_cache, package
+
+        async def resolve_targets():
+            """Runs alongside steps 1-3: existing function of the application, gateway for a new one"""
+            function_id = None
+            gateway_name = None
+            if config.application_id:
+                log(f"[target] Getting function from application: {config.application_id}")
+                function_id = await run_blocking(_get_application_function_id, client, config.application_id)
+                log(f"  → Found function: {function_id}")
+            elif config.name:
+                gateway_name = config.gateway_name or await run_blocking(client.get_usable_gateway)
+                if not gateway_name:
+                    raise ValueError(
+                        "No available API gateway found. "
+                        "Please visit https://console.volcengine.com/veapig to create a running gateway, then retry."
+                    )
+            return function_id, gateway_name
 
-        # 2. Build project (if needed)
-        if not config.skip_build and build_command and not is_python:
-            log(f"[2/7] Building project: {build_command}")
-            _run_build_command(config.project_path, build_command)
-            log("  → Build completed")
-
-            # For static sites, generate DefaultCaddyFile in output directory
-            if detection.is_static:
-                root_caddy = os.path.join(config.project_path, DEFAULT_CADDYFILE_NAME)
-                out_dir = os.path.join(config.project_path, output_path) if output_path and output_path != "./" and output_path != "." else config.project_path
-                target_caddy = os.path.join(out_dir, DEFAULT_CADDYFILE_NAME)
-
-                if os.path.exists(root_caddy):
-                    # Copy existing Caddyfile from project root to output
-                    import shutil
-                    os.makedirs(out_dir, exist_ok=True)
-                    shutil.copy2(root_caddy, target_caddy)
-                    log(f"  → Existing {DEFAULT_CADDYFILE_NAME} copied to output")
-                else:
-                    # Generate new Caddyfile
-                    ensure_caddyfile_in_output(config.project_path, output_path)
-                    log(f"  → {DEFAULT_CADDYFILE_NAME} generated for static site")
-        else:
-            log("[2/7] Build skipped")
-            # Even if build is skipped, static sites still need Caddyfile
-            if detection.is_static:
-                out_dir = os.path.join(config.project_path, output_path) if output_path and output_path != "./" and output_path != "." else config.project_path
-                target_caddy = os.path.join(out_dir, DEFAULT_CADDYFILE_NAME)
-                if not os.path.exists(target_caddy):
-                    ensure_caddyfile_in_output(config.project_path, output_path)
-                    log(f"  → {DEFAULT_CADDYFILE_NAME} generated for static site")
-
-        # 3. Package output directory
-        # Python: include .gitignore (source code deployment)
-        # Non-Python: only .vefaasignore (built output doesn't need gitignore)
-        log("[3/7] Packaging code...")
-        package_path = os.path.join(config.project_path, output_path) if output_path != "." else config.project_path
-        if not os.path.exists(package_path):
-            package_path = config.project_path  # Fallback to project root
-
-        zip_bytes = package_directory(package_path, base_dir=config.project_path, include_gitignore=is_python)
-        log(f"  → Packaged: {len(zip_bytes) / 1024:.1f} KB")
-
-        # 4. Upload to TOS
-        log("[4/7] Uploading to cloud storage...")
-        source_location = client.upload_to_tos(zip_bytes)
-        log("  → Upload completed")
+        stages = [asyncio.ensure_future(prepare_package()), asyncio.ensure_future(resolve_targets())]
+        try:
+            prepared, (target_function_id, gateway_name) = await asyncio.gather(*stages)
+        finally:
+            for stage in stages:
+                stage.cancel()
+        (detection, build_command, output_path, start_command, port,
+         is_python, upload_cache, package) = prepared
 
-        # 5. Create or Update function
-        target_function_id = None
         target_application_id = config.application_id
         function_name = None
+        upload_target = f"{client.region}/{target_function_id}"
+
+        # 4. Upload to TOS (skipped if the function already runs this exact package)
+        await step(4, "Uploading to cloud storage...")
+        source_location = None
+        uploaded_source = None
+        if target_function_id:
+            uploaded_source = upload_cache.uploaded_source(upload_target, package.digest)
+        try:
+            if uploaded_source and await run_blocking(client.get_function_source, target_function_id) == uploaded_source:
+                log("  → Upload skipped: function already uses this package")
+            else:
+                source_location = await run_blocking(client.upload_file_to_tos, package.path)
+                log("  → Upload completed")
+        finally:
+            package.discard()
 
-        # If application_id is provided, get the function_id from app details
-        if config.application_id:
-            log(f"[5/7] Getting function from application: {config.application_id}")
-            try:
-                app_detail = client.get_application(config.application_id)
-                app_data = app_detail.get("Result", {})
-
-                # Try to get function_id from CloudResource first (like vefaas-cli)
-                cloud_resource_str = app_data.get("CloudResource", "")
-                if cloud_resource_str:
-                    try:
-                        cloud_resource = json.loads(cloud_resource_str)
-                        # CloudResource format: {"framework": {"function_id": "xxx", ...}}
-                        keys = list(cloud_resource.keys())
-                        if keys:
-                            first_key = keys[0]
-                            target_function_id = cloud_resource.get(first_key, {}).get("function_id")
-                    except json.JSONDecodeError:
-                        pass
-
-                # Fallback: try to get from Config
-                if not target_function_id:
-                    config_str = app_data.get("Config", "")
-                    if config_str:
-                        try:
-                            config_data = json.loads(config_str)
-                            target_function_id = config_data.get("function", {}).get("function_id")
-                        except json.JSONDecodeError:
-                            pass
-
-                if not target_function_id:
-                    raise ValueError(
-                        f"Could not find function_id in application {config.application_id}. "
-                        "This application may not have a function associated with it, or it was created without a function. "
-                        "Please use 'name' parameter to create a new application instead."
-                    )
-
-                log(f"  → Found function: {target_function_id}")
-            except json.JSONDecodeError:
-                raise ValueError(f"Could not parse application data for {config.application_id}")
-
+        # 5. Create or Update function
         if config.application_id:
             # Update existing function
-            log(f"[5/7] Updating function: {target_function_id}")
-            client.update_function(
+            await step(5, f"Updating function: {target_function_id}")
+            await run_blocking(
+                client.update_function,
                 function_id=target_function_id,
                 source=source_location,
                 command=start_command,
@@ -1042,9 +1348,12 @@ def deploy_application(config: DeployConfig, client: VeFaaSClient) -> DeployResu
                 runtime=detection.runtime,
             )
             log("  → Function updated")
+            if source_location:
+                await run_blocking(upload_cache.record_upload, upload_target, package.digest, source_location)
         elif config.name:
-            log(f"[5/7] Creating function: {config.name}")
-            create_resp = client.create_function(
+            await step(5, f"Creating function: {config.name}")
+            create_resp = await run_blocking(
+                client.create_function,
                 name=config.name,
                 runtime=detection.runtime,
                 command=start_command,
@@ -1057,6 +1366,10 @@ def deploy_application(config: DeployConfig, client: VeFaaSClient) -> DeployResu
             target_function_id = func_result.get("Id")
             function_name = func_result.get("Name")
             log(f"  → Function created: {target_function_id}")
+            if target_function_id:
+                await run_blocking(
+                    upload_cache.record_upload, f"{client.region}/{target_function_id}", package.digest, source_location
+                )
 
         if not target_function_id:
             raise ValueError("Unable to determine target function ID")
@@ -1064,77 +1377,73 @@ def deploy_application(config: DeployConfig, client: VeFaaSClient) -> DeployResu
         result.function_id = target_function_id
         result.function_name = function_name
 
-        # 6. Wait for dependency installation (Python)
-        if is_python:
-            log("[6/7] Installing dependencies...")
-            try:
-                # Trigger dependency install task
-                client.create_dependency_install_task(target_function_id)
-                log("  → Dependency installation task created")
-
-                # Wait for installation to complete
-                wait_for_dependency_install(client, target_function_id)
-                log("  → Dependencies installed")
-            except Exception as e:
-                log(f"  → Dependency check: {e}")
-        else:
-            log("[6/7] Dependency installation skipped")
-
-        # 7. Create application and deploy
-        access_url = None
-
+        # A new application does not depend on the installed dependencies: create it meanwhile
+        create_app_task = None
         if config.name and not config.application_id:
-            # New application
-            log("[7/7] Creating and deploying application...")
-            gateway_name = config.gateway_name or client.get_usable_gateway()
-            if not gateway_name:
-                raise ValueError(
-                    "No available API gateway found. "
-                    "Please visit https://console.volcengine.com/veapig to create a running gateway, then retry."
-                )
-
             app_name = f"{config.name}".lower()
-            create_app_resp = client.create_application(app_name, target_function_id, gateway_name)
-            target_application_id = create_app_resp.get("Result", {}).get("Id")
-            log(f"  → Application created: {target_application_id}")
+            create_app_task = asyncio.ensure_future(
+                run_blocking(client.create_application, app_name, target_function_id, gateway_name)
+            )
 
-            # Release application
-            if target_application_id:
+        try:
+            # 6. Wait for dependency installation (Python)
+            if is_python:
+                await step(6, "Installing dependencies...")
+                try:
+                    # Trigger dependency install task
+                    await run_blocking(client.create_dependency_install_task, target_function_id)
+                    log("  → Dependency installation task created")
+
+                    # Wait for installation to complete
+                    await wait_for_dependency_install_async(
+                        client, target_function_id, on_status=on_status("Dependency installation")
+                    )
+                    log("  → Dependencies installed")
+                except Exception as e:
+                    log(f"  → Dependency check: {e}")
+            else:
+                await step(6, "Dependency installation skipped")
+
+            # 7. Create application and deploy
+            access_url = None
+
+            if create_app_task is not None:
+                # New application
+                await step(7, "Creating and deploying application...")
+                create_app_resp = await create_app_task
+                target_application_id = create_app_resp.get("Result", {}).get("Id")
+                log(f"  → Application created: {target_application_id}")
+            elif config.application_id:
+                # Update existing application - re-release it
+                await step(7, "Re-deploying existing application...")
+            else:
+                await step(7, "Application deployment skipped")
+        finally:
+            if create_app_task is not None and not create_app_task.done():
+                create_app_task.cancel()
+
+        # Release application
+        if target_application_id:
+            if create_app_task is not None:
                 log("  → Releasing application...")
-                client.release_application(target_application_id)
-                log("  → Waiting for deployment...")
-                deploy_status = wait_for_application_deploy(client, target_application_id, timeout_seconds=DEPLOY_TIMEOUT_SECONDS)
-                access_url = deploy_status.get("access_url")
-
-                # If access_url not from deploy status, fetch from app details
-                if not access_url:
-                    try:
-                        app_detail = client.get_application(target_application_id)
-                        cloud_resource = app_detail.get("Result", {}).get("CloudResource", "")
-                        access_url = extract_access_url_from_cloud_resource(cloud_resource)
-                    except:
-                        pass
-
-                log("  → Deployment completed!")
-        elif config.application_id:
-            # Update existing application - re-release it
-            log("[7/7] Re-deploying existing application...")
-            client.release_application(target_application_id)
+            await run_blocking(client.release_application, target_application_id)
             log("  → Waiting for deployment...")
-            deploy_status = wait_for_application_deploy(client, target_application_id, timeout_seconds=DEPLOY_TIMEOUT_SECONDS)
+            deploy_status = await wait_for_application_deploy_async(
+                client, target_application_id, timeout_seconds=DEPLOY_TIMEOUT_SECONDS,
+                on_status=on_status("Application status"),
+            )
             access_url = deploy_status.get("access_url")
 
+            # If access_url not from deploy status, fetch from app details
             if not access_url:
                 try:
-                    app_detail = client.get_application(target_application_id)
+                    app_detail = await run_blocking(client.get_application, target_application_id)
                     cloud_resource = app_detail.get("Result", {}).get("CloudResource", "")
                     access_url = extract_access_url_from_cloud_resource(cloud_resource)
                 except:
                     pass
 
             log("  → Deployment completed!")
-        else:
-            log("[7/7] Application deployment skipped")
 
         result.application_id = target_application_id
         result.function_id = target_function_id
@@ -1161,15 +1470,33 @@ def deploy_application(config: DeployConfig, client: VeFaaSClient) -> DeployResu
                     type="apig",
                     system_url=access_url,
                 )
-            write_config(config.project_path, save_config)
+            await run_blocking(write_config, config.project_path, save_config)
             log("[config] Saved .vefaas/config.json and vefaas.yaml")
         except Exception as e:
             log(f"[config] Warning: Failed to save config: {e}")
 
         log("Deployed successfully!")
+        await reporter.done("Deployed successfully!")
     except Exception as e:
         result.error = str(e)
         result.success = False
         log(f"Deployment failed: {e}")
 
     return result
+
+
+def deploy_application(config: DeployConfig, client: VeFaaSClient) -> DeployResult:
+    """
+    Deploy an application to veFaaS.
+
+    Blocking wrapper around deploy_application_async (same flow and result); from async
+    code, await deploy_application_async instead.
+
+    Args:
+        config: Deployment configuration
+        client: VeFaaSClient instance
+
+    Returns:
+        DeployResult with IDs and URLs
+    """
+    return asyncio.run(deploy_application_async(config, client))
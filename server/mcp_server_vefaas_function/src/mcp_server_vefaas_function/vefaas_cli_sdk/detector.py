@@ -11,13 +11,21 @@ Supported frameworks:
 - Node.js: Next.js, Nuxt, Vite, VitePress, Rspress, Astro, Express, SvelteKit, Remix, CRA, Angular, Gatsby
 - Python: FastAPI, Flask, Streamlit, Django
 - Static: HTML sites, Hugo, MkDocs, Zola, Hexo
+
+All detectors share one project index: the project root is listed once and every file is
+stat'ed and read at most once. The paths they inspect, with their sizes and mtimes, key a
+cache of detection results, so detecting an unchanged project again costs a few stat calls.
 """
 
 import os
 import json
 import re
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+import stat
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Optional, Dict, Any, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -36,10 +44,23 @@ class DetectionResult:
     is_static: bool = False        # Is static site
 
 
+# Detection results cached per project root (least recently used evicted)
+DETECTION_CACHE_MAX_ENTRIES = 64
+
+# Results are not cached while an inspected file was modified this recently, since coarse
+# filesystem timestamps could hide a further edit within the same tick.
+RACY_WINDOW_NS = 2_000_000_000
+
+_detection_cache: "OrderedDict[str, Tuple[Dict[str, Optional[tuple]], DetectionResult]]" = OrderedDict()
+_detection_cache_lock = threading.Lock()
+
+
 def auto_detect(target_path: str) -> DetectionResult:
     """
     Auto-detect project runtime, framework and related commands based on file system.
 
+    Results are cached and reused as long as none of the files detection looked at changed.
+
     Args:
         target_path: Project root directory path
 
@@ -47,11 +68,44 @@ def auto_detect(target_path: str) -> DetectionResult:
         DetectionResult: Detection result
     """
     root = os.path.abspath(target_path)
-    logger.debug(f"[detect] Starting framework detection for: {root}")
+
+    with _detection_cache_lock:
+        cached = _detection_cache.get(root)
+    if cached is not None:
+        fingerprint, result = cached
+        if _fingerprint_matches(root, fingerprint):
+            with _detection_cache_lock:
+                if root in _detection_cache:
+                    _detection_cache.move_to_end(root)
+            logger.debug(f"[detect] Project unchanged, using cached detection for: {root}")
+            return replace(result)
+
+    index = _ProjectIndex(root)
+    result = _detect(index)
+
+    fingerprint = index.fingerprint()
+    if _is_settled(fingerprint):
+        with _detection_cache_lock:
+            _detection_cache[root] = (fingerprint, replace(result))
+            _detection_cache.move_to_end(root)
+            while len(_detection_cache) > DETECTION_CACHE_MAX_ENTRIES:
+                _detection_cache.popitem(last=False)
+    return result
+
+
+def clear_detection_cache() -> None:
+    """Forget all cached detection results"""
+    with _detection_cache_lock:
+        _detection_cache.clear()
+
+
+def _detect(index: "_ProjectIndex") -> DetectionResult:
+    """Run the detectors against a project index"""
+    logger.debug(f"[detect] Starting framework detection for: {index.root}")
 
     # Detect build and run scripts
-    build_script = _find_script(root, ["build.sh"])
-    run_script = _find_script(root, ["run.sh"])
+    build_script = _find_script(index, ["build.sh"])
+    run_script = _find_script(index, ["run.sh"])
     has_build = build_script is not None
     has_run = run_script is not None
     logger.debug(f"[detect] Found scripts: build={build_script or 'none'}, run={run_script or 'none'}")
@@ -66,7 +120,7 @@ def auto_detect(target_path: str) -> DetectionResult:
 
     for detector in detectors:
         try:
-            result = detector(root)
+            result = detector(index)
             if result:
                 # Override with custom scripts if present
                 if has_build and build_script:
@@ -86,66 +140,140 @@ def auto_detect(target_path: str) -> DetectionResult:
     return fallback
 
 
-def _find_script(root: str, names: List[str]) -> Optional[str]:
+def _find_script(index: "_ProjectIndex", names: List[str]) -> Optional[str]:
     """Find script file"""
     for name in names:
-        script_path = os.path.join(root, name)
-        if os.path.exists(script_path):
+        if index.exists(name):
             return f"./{name}"
     return None
 
 
-def _exists(path: str) -> bool:
-    """Check if path exists"""
-    return os.path.exists(path)
-
+# ==================== Project Index ====================
 
-def _read_text(path: str) -> Optional[str]:
-    """Read text file"""
+def _path_signature(root: str, rel_path: str) -> Optional[tuple]:
+    """
+    What detection depends on for a path: size and mtime of a file, the mtime of the root
+    directory (its listing), only the existence of other directories. None if missing.
+    """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return f.read()
-    except:
+        st = os.stat(os.path.join(root, rel_path.replace("/", os.sep)) if rel_path else root)
+    except OSError:
         return None
+    if stat.S_ISDIR(st.st_mode):
+        return ("dir", st.st_mtime_ns) if not rel_path else ("dir",)
+    return ("file", st.st_size, st.st_mtime_ns)
 
 
-def _read_json(path: str) -> Dict[str, Any]:
-    """Read JSON file"""
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except:
-        return {}
+def _fingerprint_matches(root: str, fingerprint: Dict[str, Optional[tuple]]) -> bool:
+    return all(_path_signature(root, rel_path) == signature for rel_path, signature in fingerprint.items())
+
+
+def _is_settled(fingerprint: Dict[str, Optional[tuple]]) -> bool:
+    """True if no inspected path was modified within RACY_WINDOW_NS of now"""
+    recent = time.time_ns() - RACY_WINDOW_NS
+    return all(signature is None or signature[-1] == "dir" or signature[-1] < recent
+               for signature in fingerprint.values())
+
+
+class _ProjectIndex:
+    """
+    Single-pass view of a project directory shared by all detectors.
+
+    The root directory is listed once (files missing from it need no stat call), other
+    paths are stat'ed once, and file contents are read once. Every path looked up is
+    recorded with its signature for the detection cache.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._root_entries: Optional[Dict[str, bool]] = None   # name -> is_file
+        self._signatures: Dict[str, Optional[tuple]] = {}
+        self._texts: Dict[str, Optional[str]] = {}
+
+    def _list_root(self) -> Dict[str, bool]:
+        if self._root_entries is None:
+            entries = {}
+            try:
+                with os.scandir(self.root) as it:
+                    for entry in it:
+                        try:
+                            entries[entry.name] = entry.is_file()
+                        except OSError:
+                            entries[entry.name] = False
+            except OSError:
+                pass
+            self._root_entries = entries
+            self._signatures[""] = _path_signature(self.root, "")
+        return self._root_entries
+
+    def path(self, rel_path: str) -> str:
+        return os.path.join(self.root, rel_path.replace("/", os.sep))
+
+    def exists(self, rel_path: str) -> bool:
+        """Check if path (relative to the root, "/"-separated) exists"""
+        if rel_path.split("/", 1)[0] not in self._list_root():
+            # Creating it would change the root listing, which is already recorded
+            return False
+        if rel_path not in self._signatures:
+            self._signatures[rel_path] = _path_signature(self.root, rel_path)
+        return self._signatures[rel_path] is not None
+
+    def files(self) -> List[str]:
+        """Names of the regular files directly in the root"""
+        return [name for name, is_file in self._list_root().items() if is_file]
+
+    def read_text(self, rel_path: str) -> Optional[str]:
+        """Read text file"""
+        if rel_path not in self._texts:
+            content = None
+            if self.exists(rel_path):
+                try:
+                    with open(self.path(rel_path), "r", encoding="utf-8") as f:
+                        content = f.read()
+                except:
+                    pass
+            self._texts[rel_path] = content
+        return self._texts[rel_path]
+
+    def read_json(self, rel_path: str) -> Dict[str, Any]:
+        """Read JSON file"""
+        try:
+            return json.loads(self.read_text(rel_path))
+        except:
+            return {}
+
+    def fingerprint(self) -> Dict[str, Optional[tuple]]:
+        """Signatures of every path inspected so far"""
+        return dict(self._signatures)
 
 
 # ==================== Node.js Detection ====================
 
-def _detect_node(root: str) -> Optional[DetectionResult]:
+def _detect_node(index: _ProjectIndex) -> Optional[DetectionResult]:
     """Detect Node.js project"""
-    pkg_path = os.path.join(root, "package.json")
-    has_pkg = _exists(pkg_path)
+    has_pkg = index.exists("package.json")
 
     is_node = (
         has_pkg or
-        _exists(os.path.join(root, "package-lock.json")) or
-        _exists(os.path.join(root, "pnpm-lock.yaml")) or
-        _exists(os.path.join(root, "yarn.lock"))
+        index.exists("package-lock.json") or
+        index.exists("pnpm-lock.yaml") or
+        index.exists("yarn.lock")
     )
 
     if not is_node:
         return None
 
-    pkg = _read_json(pkg_path) if has_pkg else {}
+    pkg = index.read_json("package.json") if has_pkg else {}
     scripts = pkg.get("scripts", {})
-    pm = _get_node_package_manager(root, pkg)
+    pm = _get_node_package_manager(index, pkg)
     framework = _detect_node_framework(pkg)
 
     build_cmd = _resolve_node_build_command(pm, scripts, framework)
-    output_path = _resolve_node_output_path(framework, scripts, root)
-    start_cmd = _resolve_node_start_command(pm, scripts, framework, root, pkg)
-    install_cmd = _resolve_node_install_command(pm, root)
-    port = _detect_node_port(root, scripts, framework, pkg)
-    is_static = _should_use_static_hosting(framework, root, pkg, scripts)
+    output_path = _resolve_node_output_path(framework, scripts, index)
+    start_cmd = _resolve_node_start_command(pm, scripts, framework, index, pkg)
+    install_cmd = _resolve_node_install_command(pm, index)
+    port = _detect_node_port(index, scripts, framework, pkg)
+    is_static = _should_use_static_hosting(framework, index, pkg, scripts)
 
     return DetectionResult(
         install_command=install_cmd,
@@ -159,11 +287,11 @@ def _detect_node(root: str) -> Optional[DetectionResult]:
     )
 
 
-def _get_node_package_manager(root: str, pkg: Dict) -> str:
+def _get_node_package_manager(index: _ProjectIndex, pkg: Dict) -> str:
     """Get Node.js package manager"""
-    if _exists(os.path.join(root, "pnpm-lock.yaml")):
+    if index.exists("pnpm-lock.yaml"):
         return "pnpm"
-    if _exists(os.path.join(root, "yarn.lock")):
+    if index.exists("yarn.lock"):
         return "yarn"
     pm_field = pkg.get("packageManager", "").lower()
     if pm_field.startswith("pnpm"):
@@ -240,7 +368,7 @@ def _resolve_node_build_command(pm: str, scripts: Dict, framework: str) -> str:
     return framework_builds.get(framework, "")
 
 
-def _resolve_node_output_path(framework: str, scripts: Dict, root: str) -> str:
+def _resolve_node_output_path(framework: str, scripts: Dict, index: _ProjectIndex) -> str:
     """Resolve Node.js output path"""
     output_paths = {
         "next": "./",
@@ -258,22 +386,22 @@ def _resolve_node_output_path(framework: str, scripts: Dict, root: str) -> str:
     return output_paths.get(framework, "./")
 
 
-def _resolve_node_install_command(pm: str, root: str) -> str:
+def _resolve_node_install_command(pm: str, index: _ProjectIndex) -> str:
     """Resolve Node.js install command"""
     if pm == "pnpm":
         return "pnpm install"
     if pm == "yarn":
         return "yarn install"
     # npm: prefer ci
-    if _exists(os.path.join(root, "package-lock.json")):
+    if index.exists("package-lock.json"):
         return "npm ci"
     return "npm install"
 
 
-def _resolve_node_start_command(pm: str, scripts: Dict, framework: str, root: str, pkg: Dict) -> str:
+def _resolve_node_start_command(pm: str, scripts: Dict, framework: str, index: _ProjectIndex, pkg: Dict) -> str:
     """Resolve Node.js start command"""
     # Static sites use Caddy
-    if _should_use_static_hosting(framework, root, pkg, scripts):
+    if _should_use_static_hosting(framework, index, pkg, scripts):
         return "caddy run --config DefaultCaddyFile --adapter caddyfile"
 
     if scripts.get("start"):
@@ -288,9 +416,9 @@ def _resolve_node_start_command(pm: str, scripts: Dict, framework: str, root: st
     return framework_starts.get(framework, "")
 
 
-def _detect_node_port(root: str, scripts: Dict, framework: str, pkg: Dict) -> int:
+def _detect_node_port(index: _ProjectIndex, scripts: Dict, framework: str, pkg: Dict) -> int:
     """Detect Node.js port"""
-    if _should_use_static_hosting(framework, root, pkg, scripts):
+    if _should_use_static_hosting(framework, index, pkg, scripts):
         return 8000
 
     # Detect port from scripts
@@ -317,7 +445,7 @@ def _detect_node_port(root: str, scripts: Dict, framework: str, pkg: Dict) -> in
     return framework_ports.get(framework, 3000)
 
 
-def _should_use_static_hosting(framework: str, root: str, pkg: Dict, scripts: Dict) -> bool:
+def _should_use_static_hosting(framework: str, index: _ProjectIndex, pkg: Dict, scripts: Dict) -> bool:
     """Determine if static hosting should be used (based on vefaas-cli shouldUseStaticHosting)"""
     deps = {**pkg.get("dependencies", {}), **pkg.get("devDependencies", {})}
 
@@ -329,7 +457,7 @@ def _should_use_static_hosting(framework: str, root: str, pkg: Dict, scripts: Di
         if any(adapter in deps for adapter in ssr_adapters):
             return False
         # Check if astro.config has output: 'server'
-        if _is_astro_ssr(root):
+        if _is_astro_ssr(index):
             return False
         return True
 
@@ -338,7 +466,7 @@ def _should_use_static_hosting(framework: str, root: str, pkg: Dict, scripts: Di
         build_script = scripts.get("build", "")
         if "next export" in build_script:
             return True
-        if _exists(os.path.join(root, "out")):
+        if index.exists("out"):
             return True
         return False
 
@@ -359,14 +487,14 @@ def _should_use_static_hosting(framework: str, root: str, pkg: Dict, scripts: Di
 
     if framework == "vite":
         # Vite: if SSR signals present, not static; otherwise default to static (SPA/MPA)
-        if _is_vite_ssr(root, pkg, scripts):
+        if _is_vite_ssr(index, pkg, scripts):
             return False
         return True  # Default static
 
     return False
 
 
-def _is_vite_ssr(root: str, pkg: Dict, scripts: Dict) -> bool:
+def _is_vite_ssr(index: _ProjectIndex, pkg: Dict, scripts: Dict) -> bool:
     """Detect if Vite is in SSR mode (based on vefaas-cli isViteSSR)"""
     # Check if scripts have ssr related commands
     for key, val in scripts.items():
@@ -383,7 +511,7 @@ def _is_vite_ssr(root: str, pkg: Dict, scripts: Dict) -> bool:
     # Check vite.config for ssr config
     vite_config_files = ["vite.config.js", "vite.config.ts", "vite.config.mjs", "vite.config.cjs"]
     for config_file in vite_config_files:
-        content = _read_text(os.path.join(root, config_file))
+        content = index.read_text(config_file)
         if content:
             if re.search(r"ssr\s*:\s*\{", content) or re.search(r"ssr\s*:\s*true", content):
                 return True
@@ -391,11 +519,11 @@ def _is_vite_ssr(root: str, pkg: Dict, scripts: Dict) -> bool:
     return False
 
 
-def _is_astro_ssr(root: str) -> bool:
+def _is_astro_ssr(index: _ProjectIndex) -> bool:
     """Detect if Astro is in SSR mode"""
     config_files = ["astro.config.js", "astro.config.ts", "astro.config.mjs", "astro.config.cjs", "astro.config.cts"]
     for config_file in config_files:
-        content = _read_text(os.path.join(root, config_file))
+        content = index.read_text(config_file)
         if content:
             if re.search(r"output\s*:\s*['\"]server['\"]", content):
                 return True
@@ -406,22 +534,21 @@ def _is_astro_ssr(root: str) -> bool:
 
 # ==================== Python Detection ====================
 
-def _detect_python(root: str) -> Optional[DetectionResult]:
+def _detect_python(index: _ProjectIndex) -> Optional[DetectionResult]:
     """Detect Python project"""
     has_py = (
-        _exists(os.path.join(root, "requirements.txt")) or
-        _exists(os.path.join(root, "pyproject.toml")) or
-        _exists(os.path.join(root, "Pipfile")) or
-        any(f.endswith(".py")
-            for f in os.listdir(root) if os.path.isfile(os.path.join(root, f)))
+        index.exists("requirements.txt") or
+        index.exists("pyproject.toml") or
+        index.exists("Pipfile") or
+        any(f.endswith(".py") for f in index.files())
     )
 
     if not has_py:
         return None
 
     # Read dependency info
-    req_content = _read_text(os.path.join(root, "requirements.txt")) or ""
-    pyproj_content = _read_text(os.path.join(root, "pyproject.toml")) or ""
+    req_content = index.read_text("requirements.txt") or ""
+    pyproj_content = index.read_text("pyproject.toml") or ""
     deps_blob = f"{req_content}\n{pyproj_content}".lower()
 
     is_fastapi = "fastapi" in deps_blob or "uvicorn" in deps_blob
@@ -430,13 +557,13 @@ def _detect_python(root: str) -> Optional[DetectionResult]:
     is_streamlit = "streamlit" in deps_blob
 
     # Detect package manager
-    pm = _detect_python_package_manager(root)
+    pm = _detect_python_package_manager(index)
     run_prefix = _get_python_run_prefix(pm)
-    port = _detect_python_port(root) or 8000
+    port = _detect_python_port(index) or 8000
 
     # Detect entrypoint file
-    main_file = _find_python_entrypoint(root)
-    default_entry = os.path.basename(main_file) if main_file else "main.py"
+    main_file = _find_python_entrypoint(index)
+    default_entry = main_file or "main.py"
 
     # Generate start command
     has_uvicorn = "uvicorn" in deps_blob
@@ -446,7 +573,7 @@ def _detect_python(root: str) -> Optional[DetectionResult]:
         start_cmd = f"{run_prefix} streamlit run {default_entry} --server.port ${{PORT:-{port}}} --server.address 0.0.0.0".strip()
     elif is_fastapi:
         if has_uvicorn:
-            wsgi = _determine_python_wsgi(root, main_file, "fastapi")
+            wsgi = _determine_python_wsgi(index, main_file, "fastapi")
             if wsgi:
                 start_cmd = f"{run_prefix} uvicorn {wsgi} --host 0.0.0.0 --port ${{PORT:-{port}}}".strip()
             else:
@@ -454,7 +581,7 @@ def _detect_python(root: str) -> Optional[DetectionResult]:
         else:
             start_cmd = f"{run_prefix} python {default_entry}".strip()
     elif is_flask:
-        wsgi = _determine_python_wsgi(root, main_file, "flask")
+        wsgi = _determine_python_wsgi(index, main_file, "flask")
         if wsgi and has_gunicorn:
             start_cmd = f"{run_prefix} gunicorn {wsgi} --bind :{port}".strip()
         else:
@@ -469,11 +596,11 @@ def _detect_python(root: str) -> Optional[DetectionResult]:
         start_cmd = f"{run_prefix} python {default_entry}".strip()
 
     # Python version detection
-    py_version = _detect_python_version(root)
+    py_version = _detect_python_version(index)
     runtime = f"native-python{_ensure_supported_py_version(py_version)}/v1"
 
     # Install command
-    install_cmd = _resolve_python_install_command(root)
+    install_cmd = _resolve_python_install_command(index)
 
     return DetectionResult(
         install_command=install_cmd,
@@ -488,16 +615,16 @@ def _detect_python(root: str) -> Optional[DetectionResult]:
     )
 
 
-def _detect_python_package_manager(root: str) -> str:
+def _detect_python_package_manager(index: _ProjectIndex) -> str:
     """Detect Python package manager"""
-    if _exists(os.path.join(root, "uv.lock")):
+    if index.exists("uv.lock"):
         return "uv"
-    pyproj = _read_text(os.path.join(root, "pyproject.toml")) or ""
+    pyproj = index.read_text("pyproject.toml") or ""
     if "[tool.poetry]" in pyproj:
         return "poetry"
     if "[tool.pdm]" in pyproj:
         return "pdm"
-    if _exists(os.path.join(root, "Pipfile")):
+    if index.exists("Pipfile"):
         return "pipenv"
     return "pip"
 
@@ -513,33 +640,31 @@ def _get_python_run_prefix(pm: str) -> str:
     return prefixes.get(pm, "")
 
 
-def _find_python_entrypoint(root: str) -> Optional[str]:
-    """Find Python entrypoint file"""
+def _find_python_entrypoint(index: _ProjectIndex) -> Optional[str]:
+    """Find Python entrypoint file (relative to the root)"""
     common_names = ["main.py", "app.py", "run.py",
                     "server.py", "wsgi.py", "asgi.py", "manage.py"]
 
     for name in common_names:
-        path = os.path.join(root, name)
-        if _exists(path):
-            content = _read_text(path) or ""
+        if index.exists(name):
+            content = index.read_text(name) or ""
             if "FastAPI(" in content or "Flask(" in content:
-                return path
+                return name
 
     # Fallback to first found common entry
     for name in common_names:
-        path = os.path.join(root, name)
-        if _exists(path):
-            return path
+        if index.exists(name):
+            return name
 
     return None
 
 
-def _determine_python_wsgi(root: str, entry_file: Optional[str], framework: str) -> Optional[str]:
+def _determine_python_wsgi(index: _ProjectIndex, entry_file: Optional[str], framework: str) -> Optional[str]:
     """Determine Python WSGI path"""
     if not entry_file:
         return None
 
-    content = _read_text(entry_file)
+    content = index.read_text(entry_file)
     if not content:
         return None
 
@@ -549,18 +674,17 @@ def _determine_python_wsgi(root: str, entry_file: Optional[str], framework: str)
         return None
 
     var_name = match.group(1)
-    rel = os.path.relpath(entry_file, root)
-    module = rel.replace(".py", "").replace(os.sep, ".")
+    module = entry_file.replace(".py", "").replace("/", ".")
 
     return f"{module}:{var_name}"
 
 
-def _detect_python_port(root: str) -> Optional[int]:
+def _detect_python_port(index: _ProjectIndex) -> Optional[int]:
     """Detect Python port"""
     # Detect from entry files
     entry_files = ["main.py", "app.py", "run.py", "server.py"]
     for name in entry_files:
-        content = _read_text(os.path.join(root, name))
+        content = index.read_text(name)
         if content:
             match = re.search(
                 r"port[\"']?\s*[=:]\s*(\d{4,5})", content, re.IGNORECASE)
@@ -569,16 +693,16 @@ def _detect_python_port(root: str) -> Optional[int]:
     return None
 
 
-def _detect_python_version(root: str) -> str:
+def _detect_python_version(index: _ProjectIndex) -> str:
     """Detect Python version"""
     # Detect from pyproject.toml
-    pyproj = _read_text(os.path.join(root, "pyproject.toml")) or ""
+    pyproj = index.read_text("pyproject.toml") or ""
     match = re.search(r'python\s*[>=<~^]*\s*["\']?(\d+\.\d+)', pyproj)
     if match:
         return match.group(1)
 
     # Detect from .python-version
-    pv = _read_text(os.path.join(root, ".python-version"))
+    pv = index.read_text(".python-version")
     if pv:
         match = re.search(r"(\d+\.\d+)", pv.strip())
         if match:
@@ -599,44 +723,43 @@ def _ensure_supported_py_version(version: str) -> str:
     return "3.12"
 
 
-def _resolve_python_install_command(root: str) -> str:
+def _resolve_python_install_command(index: _ProjectIndex) -> str:
     """Resolve Python install command"""
-    if _exists(os.path.join(root, "uv.lock")):
-        if _exists(os.path.join(root, "requirements.txt")):
+    if index.exists("uv.lock"):
+        if index.exists("requirements.txt"):
             return "uv pip install -r requirements.txt"
         return "uv sync"
 
-    pyproj = _read_text(os.path.join(root, "pyproject.toml")) or ""
+    pyproj = index.read_text("pyproject.toml") or ""
     if "[tool.poetry]" in pyproj:
         return "poetry install"
     if "[tool.pdm]" in pyproj:
         return "pdm install"
-    if _exists(os.path.join(root, "Pipfile")):
+    if index.exists("Pipfile"):
         return "pipenv install"
-    if _exists(os.path.join(root, "requirements.txt")):
+    if index.exists("requirements.txt"):
         return "pip install -r requirements.txt"
     return "pip install ."
 
 
 # ==================== Static Site Detection ====================
 
-def _detect_static(root: str) -> Optional[DetectionResult]:
+def _detect_static(index: _ProjectIndex) -> Optional[DetectionResult]:
     """Detect static site"""
-    root_index = os.path.join(root, "index.html")
-    has_root_index = _exists(root_index)
+    has_root_index = index.exists("index.html")
 
     # Hugo detection
     hugo_files = ["hugo.toml", "hugo.json", "hugo.yaml"]
-    has_hugo = any(_exists(os.path.join(root, f)) for f in hugo_files)
+    has_hugo = any(index.exists(f) for f in hugo_files)
 
     # MkDocs detection
-    has_mkdocs = _exists(os.path.join(root, "mkdocs.yml"))
+    has_mkdocs = index.exists("mkdocs.yml")
 
     # Build output directory detection
-    dist_index = os.path.join(root, "dist", "index.html")
-    build_index = os.path.join(root, "build", "index.html")
-    public_index = os.path.join(root, "public", "index.html")
-    has_built_static = any(_exists(p)
+    dist_index = "dist/index.html"
+    build_index = "build/index.html"
+    public_index = "public/index.html"
+    has_built_static = any(index.exists(p)
                            for p in [dist_index, build_index, public_index])
 
     matched = has_root_index or has_hugo or has_mkdocs or has_built_static
@@ -644,11 +767,11 @@ def _detect_static(root: str) -> Optional[DetectionResult]:
         return None
 
     # Determine output directory
-    if _exists(dist_index):
+    if index.exists(dist_index):
         output_path = "dist"
-    elif _exists(build_index):
+    elif index.exists(build_index):
         output_path = "build"
-    elif _exists(public_index):
+    elif index.exists(public_index):
         output_path = "public"
     else:
         output_path = "./"
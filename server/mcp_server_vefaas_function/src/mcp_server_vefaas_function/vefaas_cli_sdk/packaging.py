@@ -0,0 +1,204 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Packaging Engine
+
+Builds zip archives without holding files or the archive in memory:
+- Entries are read and deflated in chunks on a thread pool (zlib releases the GIL), each
+  into its own spooled temp file that spills to disk when large
+- Compressed entries are appended to the archive in input order, so the output is
+  deterministic and byte-identical to zipfile's DEFLATED output
+- Entries can also be copied still compressed from a previous archive
+
+The archive is written to a seekable binary file, typically a temp file on disk that is
+then streamed to the upload URL.
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Iterable, Optional
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Compressed entries up to this size stay in memory, larger ones spill to a temp file
+SPOOL_MAX_MEMORY = 1024 * 1024
+
+# How many entries each worker may compress ahead of the archive writer
+PENDING_ENTRIES_PER_WORKER = 2
+
+
+def default_max_workers() -> int:
+    """Compression threads: VEFAAS_PACKAGE_MAX_WORKERS, or one per core (max 32)"""
+    configured = int(os.getenv("VEFAAS_PACKAGE_MAX_WORKERS", "0") or 0)
+    return configured if configured > 0 else min(32, os.cpu_count() or 1)
+
+
+@dataclass
+class ArchiveEntry:
+    """One archive entry; content comes from exactly one of path, data or reuse_from"""
+    info: zipfile.ZipInfo
+    path: Optional[str] = None                      # File to compress
+    data: Optional[bytes] = None                    # In-memory content to compress
+    reuse_from: Optional[zipfile.ZipInfo] = None    # Entry of the reuse archive, copied as-is
+
+
+@dataclass
+class _CompressedEntry:
+    stream: BinaryIO
+    crc: int
+    file_size: int
+    compress_size: int
+    sha256: str
+
+
+def _iter_chunks(entry: ArchiveEntry):
+    if entry.data is not None:
+        yield entry.data
+        return
+    with open(entry.path, 'rb') as f:
+        while True:
+            chunk = f.read(READ_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _compress(entry: ArchiveEntry) -> _CompressedEntry:
+    # Same settings as zipfile's ZIP_DEFLATED compressor (raw deflate, default level)
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    stream = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+    digest = hashlib.sha256()
+    crc = 0
+    file_size = 0
+    try:
+        for chunk in _iter_chunks(entry):
+            crc = zlib.crc32(chunk, crc)
+            digest.update(chunk)
+            file_size += len(chunk)
+            stream.write(compressor.compress(chunk))
+        stream.write(compressor.flush())
+        compress_size = stream.tell()
+        stream.seek(0)
+    except BaseException:
+        stream.close()
+        raise
+    return _CompressedEntry(stream, crc, file_size, compress_size, digest.hexdigest())
+
+
+def _seek_to_compressed_data(archive: BinaryIO, info: zipfile.ZipInfo) -> None:
+    """Position archive at the raw (still compressed) data of entry info."""
+    archive.seek(info.header_offset)
+    header = struct.unpack(zipfile.structFileHeader, archive.read(zipfile.sizeFileHeader))
+    if header[0] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local file header for {info.filename}")
+    # header[10]: file name length, header[11]: extra field length
+    archive.seek(header[10] + header[11], os.SEEK_CUR)
+
+
+def _append_entry(zf: zipfile.ZipFile, info: zipfile.ZipInfo, stream: BinaryIO,
+                  compress_type: int, crc: int, compress_size: int, file_size: int) -> None:
+    """
+    Append an already compressed entry to zf, copying compress_size bytes from stream.
+
+    Mirrors what ZipFile.writestr does after compression: write the local header and data,
+    then register the entry for the central directory.
+    """
+    info.compress_type = compress_type
+    info.CRC = crc
+    info.compress_size = compress_size
+    info.file_size = file_size
+    info.flag_bits = 0x00  # Sizes are in the local header, no data descriptor follows
+    if not info.external_attr:
+        info.external_attr = 0o600 << 16  # permissions: ?rw-------
+    # Same ZIP64 decision as ZipFile for entries whose sizes are known up front
+    zip64 = info.file_size * 1.05 > zipfile.ZIP64_LIMIT
+    with zf._lock:
+        zf._writecheck(info)
+        zf._didModify = True
+        info.header_offset = zf.fp.tell()
+        zf.fp.write(info.FileHeader(zip64))
+        remaining = compress_size
+        while remaining:
+            chunk = stream.read(min(READ_CHUNK_SIZE, remaining))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+            zf.fp.write(chunk)
+            remaining -= len(chunk)
+        zf.start_dir = zf.fp.tell()
+        zf.filelist.append(info)
+        zf.NameToInfo[info.filename] = info
+
+
+def write_archive(
+    entries: Iterable[ArchiveEntry],
+    fileobj: BinaryIO,
+    reuse_archive: Optional[BinaryIO] = None,
+    max_workers: Optional[int] = None,
+) -> Dict[str, str]:
+    """
+    Write entries as a zip archive to fileobj, compressing them in parallel.
+
+    Args:
+        entries: Entries in archive order (consumed lazily)
+        fileobj: Seekable binary file to write the archive to
+        reuse_archive: Previous archive that reuse_from entries are copied from
+        max_workers: Compression threads (defaults to default_max_workers())
+
+    Returns:
+        sha256 of the uncompressed content of each compressed entry, by arcname
+    """
+    max_workers = max_workers or default_max_workers()
+    digests = {}
+    pending = deque()
+
+    def write_next(zf: zipfile.ZipFile) -> None:
+        entry, future = pending.popleft()
+        if future is None:
+            source = entry.reuse_from
+            _seek_to_compressed_data(reuse_archive, source)
+            _append_entry(zf, entry.info, reuse_archive, source.compress_type,
+                          source.CRC, source.compress_size, source.file_size)
+            return
+        compressed = future.result()
+        with compressed.stream:
+            _append_entry(zf, entry.info, compressed.stream, zipfile.ZIP_DEFLATED,
+                          compressed.crc, compressed.compress_size, compressed.file_size)
+        digests[entry.info.filename] = compressed.sha256
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vefaas-package") as executor:
+        try:
+            with zipfile.ZipFile(fileobj, 'w', zipfile.ZIP_DEFLATED) as zf:
+                for entry in entries:
+                    if entry.reuse_from is not None:
+                        pending.append((entry, None))
+                    else:
+                        pending.append((entry, executor.submit(_compress, entry)))
+                    if len(pending) >= max_workers * PENDING_ENTRIES_PER_WORKER:
+                        write_next(zf)
+                while pending:
+                    write_next(zf)
+        finally:
+            # Drop work queued behind a failure and release spooled data already produced
+            for _, future in pending:
+                if future is not None and not future.cancel() and future.exception() is None:
+                    future.result().stream.close()
+    return digests
+
+
+def hash_file(path: str) -> str:
+    """sha256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(READ_CHUNK_SIZE)
+            if not chunk:
+                return digest.hexdigest()
+            digest.update(chunk)
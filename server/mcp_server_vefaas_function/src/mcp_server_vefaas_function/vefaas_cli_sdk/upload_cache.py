@@ -0,0 +1,353 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Incremental Upload Module
+
+Keeps a local manifest of the last package built from a directory so repeated deploys
+of the same project do not re-package and re-upload unchanged code.
+
+Stored under `.vefaas/upload-cache/<variant>/`:
+- manifest.json: per-file size, mtime, mode and sha256, the sha256 of the archive built
+  from them, and the archive digest last uploaded to each function
+- package.zip: the archive itself, whose compressed entries are copied as-is into the
+  next archive for files whose content did not change (see packaging.write_archive)
+
+Flow:
+1. Stat every file; if nothing changed since the last package, reuse package.zip as-is
+2. Otherwise rebuild, compressing only new/changed files
+3. Callers skip the upload when the archive digest was already uploaded to the function
+   and the function still points at the source recorded for that upload
+
+Concurrent deploys of the same project in one process are serialized per cache dir while
+packaging and recording uploads, and each caller gets its own hard link of the archive, so
+a later package() replacing package.zip cannot change an archive that is being uploaded.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from dataclasses import dataclass
+from typing import Optional, Dict, Any
+
+from .config import VEFAAS_CONFIG_DIR
+from .packaging import ArchiveEntry, write_archive, hash_file
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CACHE_DIR = "upload-cache"
+MANIFEST_FILE = "manifest.json"
+ARCHIVE_FILE = "package.zip"
+MANIFEST_VERSION = 1
+
+# Files modified this close to (or after) the previous scan are re-hashed even if size and
+# mtime match, since coarse filesystem timestamps can hide an edit made during the scan.
+RACY_WINDOW_NS = 2_000_000_000
+# Archive links left behind by a crashed deploy are removed after this long
+STALE_PIN_SECONDS = 24 * 3600
+
+_cache_dir_locks: Dict[str, threading.Lock] = {}
+_cache_dir_locks_guard = threading.Lock()
+
+
+def _cache_dir_lock(cache_dir: str) -> threading.Lock:
+    with _cache_dir_locks_guard:
+        return _cache_dir_locks.setdefault(cache_dir, threading.Lock())
+
+
+@dataclass
+class PackageResult:
+    """Incremental packaging result; the archive stays on disk at path"""
+    path: str
+    size: int
+    digest: str                     # sha256 of the archive
+    unchanged: bool = False         # No file changed since the previous package
+    reused_entries: int = 0         # Entries copied compressed from the previous package
+    compressed_entries: int = 0     # Entries compressed from scratch
+    temporary: bool = False         # path is a private link or temp file, call discard()
+
+    def read_bytes(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def discard(self) -> None:
+        """Remove the archive if it is not kept in the upload cache"""
+        if self.temporary:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class UploadCache:
+    """
+    Incremental packager for one directory, backed by a manifest in the project's .vefaas dir.
+
+    Usage:
+        cache = UploadCache(package_path, base_dir=project_path, include_gitignore=True)
+        package = cache.package()
+        if cache.uploaded_source(target, package.digest) != current_source:
+            source = upload(package.path)
+            cache.record_upload(target, package.digest, source)
+    """
+
+    def __init__(self, directory: str, base_dir: Optional[str] = None, include_gitignore: bool = True):
+        self.directory = os.path.abspath(directory)
+        self.base_dir = os.path.abspath(base_dir or directory)
+        self.include_gitignore = include_gitignore
+
+        # Each (directory, filter) combination packages a different file set, keep them apart
+        variant = json.dumps([os.path.relpath(self.directory, self.base_dir), include_gitignore])
+        self.cache_dir = os.path.join(
+            self.base_dir, VEFAAS_CONFIG_DIR, UPLOAD_CACHE_DIR,
+            hashlib.sha256(variant.encode("utf-8")).hexdigest()[:12],
+        )
+        self._lock = _cache_dir_lock(self.cache_dir)
+        self.manifest = self._load_manifest()
+
+    # ========== Manifest ==========
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        try:
+            with open(os.path.join(self.cache_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest
+
+    def _save_manifest(self) -> None:
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            data = json.dumps(self.manifest, ensure_ascii=False, sort_keys=True).encode("utf-8")
+            _write_atomic(os.path.join(self.cache_dir, MANIFEST_FILE), data)
+        except OSError as e:
+            logger.warning(f"[package] Failed to save upload manifest: {e}")
+
+    def _archive_path(self) -> str:
+        return os.path.join(self.cache_dir, ARCHIVE_FILE)
+
+    def _previous_archive(self) -> Optional[str]:
+        """Path of the previous archive, only if it still matches the digest recorded in the manifest."""
+        digest = self.manifest.get("archive_digest")
+        if not digest:
+            return None
+        try:
+            if hash_file(self._archive_path()) != digest:
+                logger.debug("[package] Cached archive does not match manifest, ignoring it")
+                return None
+        except OSError:
+            return None
+        return self._archive_path()
+
+    def _new_archive_file(self):
+        """Temp file for the new archive, next to the cached one so it can be renamed into place."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            return tempfile.mkstemp(prefix="package-", suffix=".zip.tmp", dir=self.cache_dir)
+        except OSError as e:
+            logger.warning(f"[package] Upload cache not writable, packaging to a temp file: {e}")
+            return tempfile.mkstemp(prefix="vefaas-package-", suffix=".zip")
+
+    def _save_package(self, files: Dict[str, Dict[str, Any]], result: PackageResult, scanned_at_ns: int) -> None:
+        self.manifest = {
+            "version": MANIFEST_VERSION,
+            "scanned_at_ns": scanned_at_ns,
+            "archive_digest": None,
+            "archive_size": result.size,
+            "files": files,
+            "uploads": self.manifest.get("uploads", {}),
+        }
+        try:
+            os.replace(result.path, self._archive_path())
+            result.path = self._archive_path()
+            self.manifest["archive_digest"] = result.digest
+        except OSError as e:
+            logger.warning(f"[package] Failed to cache archive: {e}")
+            result.temporary = True
+        self._save_manifest()
+
+    # ========== Packaging ==========
+
+    def _exclude_patterns(self):
+        """Never package the cache itself, even if .vefaasignore no longer lists .vefaas/."""
+        cache_root = os.path.join(self.base_dir, VEFAAS_CONFIG_DIR, UPLOAD_CACHE_DIR)
+        rel = os.path.relpath(cache_root, self.directory)
+        if rel.startswith(".."):
+            return None
+        return ["/" + rel.replace(os.sep, "/") + "/"]
+
+    def _pin(self, result: PackageResult) -> None:
+        """Point result at a private link of the cached archive, which a later package() may replace."""
+        self._remove_stale_pins()
+        try:
+            fd, pinned = tempfile.mkstemp(prefix="package-", suffix=".zip.pinned", dir=self.cache_dir)
+            os.close(fd)
+            try:
+                os.remove(pinned)
+                os.link(result.path, pinned)
+            except OSError:
+                # No hard links on this filesystem
+                shutil.copyfile(result.path, pinned)
+        except OSError as e:
+            logger.warning(f"[package] Failed to pin cached archive, uploading it in place: {e}")
+            return
+        result.path = pinned
+        result.temporary = True
+
+    def _remove_stale_pins(self) -> None:
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        expired_before = time.time() - STALE_PIN_SECONDS
+        for name in names:
+            if name.endswith(".zip.pinned"):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    if os.path.getmtime(path) < expired_before:
+                        os.remove(path)
+                except OSError:
+                    pass
+
+    def package(self) -> PackageResult:
+        """
+        Package the directory, reusing the previous archive or its compressed entries where possible.
+
+        Produces the same archive as deploy.package_directory for the same files. The result
+        is always a file of its own; call discard() once it has been uploaded.
+        """
+        with self._lock:
+            # Another deploy of the project may have repackaged since this cache was opened
+            self.manifest = self._load_manifest() or self.manifest
+            result = self._package()
+            if not result.temporary:
+                self._pin(result)
+            return result
+
+    def _package(self) -> PackageResult:
+        from .deploy import iter_package_files, make_zip_info
+
+        scanned_at_ns = time.time_ns()
+        previous_files = self.manifest.get("files") or {}
+        trusted_before_ns = self.manifest.get("scanned_at_ns", 0) - RACY_WINDOW_NS
+
+        # Stat pass: decide which files can be trusted without reading them
+        scanned = []
+        all_trusted = bool(previous_files)
+        for arcname, file_path, file_stat, mode in iter_package_files(
+            self.directory, self.base_dir, self.include_gitignore, self._exclude_patterns()
+        ):
+            record = {"size": file_stat.st_size, "mtime_ns": file_stat.st_mtime_ns, "mode": mode}
+            previous = previous_files.get(arcname)
+            trusted = (
+                previous is not None
+                and file_stat.st_mtime_ns < trusted_before_ns
+                and all(previous.get(key) == value for key, value in record.items())
+            )
+            if trusted:
+                record["sha256"] = previous["sha256"]
+            all_trusted = all_trusted and trusted
+            scanned.append((arcname, file_path, mode, record))
+
+        previous_path = self._previous_archive()
+        if all_trusted and len(scanned) == len(previous_files) and previous_path is not None:
+            logger.info("[package] No changes since last package, reusing cached archive")
+            return PackageResult(
+                path=previous_path,
+                size=os.path.getsize(previous_path),
+                digest=self.manifest["archive_digest"],
+                unchanged=True,
+                reused_entries=len(scanned),
+            )
+
+        previous_archive = open(previous_path, "rb") if previous_path else None
+        try:
+            previous_entries = {}
+            if previous_archive is not None:
+                with zipfile.ZipFile(previous_archive) as previous_zip:
+                    previous_entries = {info.filename: info for info in previous_zip.infolist()}
+
+            result = PackageResult(path="", size=0, digest="")
+
+            def entries():
+                for arcname, file_path, mode, record in scanned:
+                    source = previous_entries.get(arcname)
+                    previous_sha256 = (previous_files.get(arcname) or {}).get("sha256")
+                    if source is not None and previous_sha256 and "sha256" not in record:
+                        # Possibly touched only: hash it to find out before compressing it again
+                        record["sha256"] = hash_file(file_path)
+                    if source is not None and previous_sha256 and previous_sha256 == record.get("sha256"):
+                        result.reused_entries += 1
+                        yield ArchiveEntry(make_zip_info(arcname, mode), reuse_from=source)
+                    else:
+                        result.compressed_entries += 1
+                        yield ArchiveEntry(make_zip_info(arcname, mode), path=file_path)
+
+            fd, result.path = self._new_archive_file()
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    digests = write_archive(entries(), f, reuse_archive=previous_archive)
+                result.size = os.path.getsize(result.path)
+                result.digest = hash_file(result.path)
+            except BaseException:
+                os.remove(result.path)
+                raise
+        finally:
+            if previous_archive is not None:
+                previous_archive.close()
+
+        files = {}
+        for arcname, _, _, record in scanned:
+            if arcname in digests:
+                record["sha256"] = digests[arcname]
+            files[arcname] = record
+        self._save_package(files, result, scanned_at_ns)
+        logger.info(
+            f"[package] Packaged {len(files)} files: {result.reused_entries} reused, "
+            f"{result.compressed_entries} compressed"
+        )
+        return result
+
+    # ========== Upload records ==========
+
+    def uploaded_source(self, target: str, digest: str) -> Optional[str]:
+        """Source recorded when the archive with this digest was last uploaded to target, if any."""
+        upload = (self.manifest.get("uploads") or {}).get(target)
+        if upload and upload.get("digest") == digest:
+            return upload.get("source")
+        return None
+
+    def record_upload(self, target: str, digest: str, source: Optional[str]) -> None:
+        """Record a successful upload; without a source the upload can never be skipped."""
+        with self._lock:
+            # Keep what concurrent deploys recorded since this cache was opened
+            self.manifest = self._load_manifest() or self.manifest
+            uploads = self.manifest.setdefault("uploads", {})
+            if not source:
+                uploads.pop(target, None)
+            else:
+                uploads[target] = {"digest": digest, "source": source, "uploaded_at": int(time.time())}
+            self._save_manifest()
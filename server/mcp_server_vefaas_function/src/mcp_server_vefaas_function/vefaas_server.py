@@ -1,4 +1,5 @@
 import pathspec
+import asyncio
 import io
 from pdb import run
 from socket import timeout
@@ -24,12 +25,18 @@ from io import BytesIO
 from typing import Tuple
 import requests
 import shutil
+import tempfile
 
-from .vefaas_cli_sdk.deploy import package_directory
+from .vefaas_cli_sdk.deploy import AdaptivePollInterval, package_directory
+from .vefaas_cli_sdk.packaging import ArchiveEntry, write_archive
+from .vefaas_cli_sdk.upload_cache import UploadCache
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Archives built from file_dict stay in memory up to this size, larger ones spill to disk
+ZIP_SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+
 mcp = FastMCP("veFaaS MCP Server",
               host=os.getenv("MCP_SERVER_HOST", "0.0.0.0"),
               port=int(os.getenv("MCP_SERVER_PORT", "8000")),
@@ -114,7 +121,7 @@ def is_name_conflict_error(exception: ApiException) -> bool:
 - Auto-creates default `.vefaasignore` if not exists
 
 **Workflow**:
-1. If project_path provided, zip and upload code (respecting .vefaasignore)
+1. If project_path provided, zip and upload code (respecting .vefaasignore); the upload is skipped if the code is unchanged since the last upload
 2. If command/envs provided, update function config
 3. Return upload/update result
 
@@ -144,31 +151,26 @@ def update_function(function_id: str, region: Optional[str] = None,
         except ValueError as e:
             raise ValueError(f"Authorization failed: {str(e)}")
 
-        # Zip code using .vefaasignore
-        data, size, error = zip_and_encode_folder(project_path)
-        if error:
-            raise ValueError(f"Error zipping folder: {error}")
-        if not data or size == 0:
-            raise ValueError("Zipped folder is empty, nothing to upload")
-
-        # Upload code
-        upload_code_zip_for_function(
+        # Zip code using .vefaasignore and upload it (skipped if unchanged since the last upload)
+        upload_info = upload_folder_for_function(
             api_instance=api_instance,
             function_id=function_id,
-            code_zip_size=size,
-            zip_bytes=data,
+            folder_path=project_path,
             ak=ak,
             sk=sk,
             token=token,
             region=region,
         )
-        result["code_uploaded"] = True
+        size = upload_info["size"]
+        result["code_uploaded"] = upload_info["uploaded"]
+        if not upload_info["uploaded"]:
+            result["upload_skipped_reason"] = upload_info["skip_reason"]
         # Use KB for small files, MB for larger files
         if size < 1024 * 1024:
             result["upload_size"] = f"{round(size / 1024, 1)} KB"
         else:
             result["upload_size"] = f"{round(size / 1024 / 1024, 2)} MB"
-        logger.info(f"Code uploaded successfully, size: {result['upload_size']}")
+        logger.info(f"Code package ready, size: {result['upload_size']}, uploaded: {result['code_uploaded']}")
 
     # Update function config (command, envs)
     update_request = volcenginesdkvefaas.UpdateFunctionRequest(id=function_id)
@@ -253,7 +255,13 @@ def update_function(function_id: str, region: Optional[str] = None,
 - platform_url: Console link
 - error_message: Error details (if failed)
 """)
-def release_function(function_id: str, region: Optional[str] = None, skip_dependency: bool = False) -> str:
+async def release_function(function_id: str, region: Optional[str] = None, skip_dependency: bool = False) -> str:
+    from .vefaas_cli_sdk import (
+        VeFaaSClient,
+        run_blocking,
+        wait_for_dependency_install_async,
+    )
+
     region = validate_and_set_region(region)
     api_instance = init_client(region, mcp.get_context())
 
@@ -267,7 +275,7 @@ def release_function(function_id: str, region: Optional[str] = None, skip_depend
     # Early check: if release is already in progress, return immediately with guidance
     try:
         req = volcenginesdkvefaas.GetReleaseStatusRequest(function_id=function_id)
-        current_status = api_instance.get_release_status(req)
+        current_status = await run_blocking(api_instance.get_release_status, req)
         if current_status.status == "inprogress":
             return json.dumps({
                 "function_id": function_id,
@@ -287,16 +295,15 @@ def release_function(function_id: str, region: Optional[str] = None, skip_depend
     else:
         logger.info("Triggering dependency installation...")
         # Use SDK client for dependency operations
-        from .vefaas_cli_sdk import VeFaaSClient, wait_for_dependency_install
         client = VeFaaSClient(ak, sk, token, region)
 
         try:
-            client.create_dependency_install_task(function_id)
+            await run_blocking(client.create_dependency_install_task, function_id)
             logger.info("Dependency install task created, waiting for completion...")
             result["dependency_triggered"] = True
 
             # Step 2: Wait for dependency installation using SDK logic
-            dep_result = wait_for_dependency_install(client, function_id, timeout_seconds=300)
+            dep_result = await wait_for_dependency_install_async(client, function_id, timeout_seconds=300)
             result["dependency_status"] = dep_result.get("status", "succeeded")
             logger.info(f"Dependency installation completed: {result['dependency_status']}")
 
@@ -317,14 +324,14 @@ def release_function(function_id: str, region: Optional[str] = None, skip_depend
         req = volcenginesdkvefaas.ReleaseRequest(
             function_id=function_id, revision_number=0
         )
-        api_instance.release(req)
+        await run_blocking(api_instance.release, req)
         logger.info("Release request submitted, polling status...")
     except ApiException as e:
         raise ValueError(f"Failed to submit release: {str(e)}")
 
     # Step 4: Poll release status
     timeout = 120
-    interval = 5
+    interval = AdaptivePollInterval(5)
     start_time = time.time()
     release_status = None
     status_message = ""
@@ -332,12 +339,12 @@ def release_function(function_id: str, region: Optional[str] = None, skip_depend
     while time.time() - start_time < timeout:
         try:
             req = volcenginesdkvefaas.GetReleaseStatusRequest(function_id=function_id)
-            response = api_instance.get_release_status(req)
+            response = await run_blocking(api_instance.get_release_status, req)
             release_status = response.status
             status_message = response.status_message or ""
 
             if release_status == "inprogress":
-                time.sleep(interval)
+                await asyncio.sleep(interval.next(release_status))
             else:
                 break
         except Exception as e:
@@ -354,7 +361,7 @@ def release_function(function_id: str, region: Optional[str] = None, skip_depend
     # Get revision info from final status
     try:
         req = volcenginesdkvefaas.GetReleaseStatusRequest(function_id=function_id)
-        final_status = api_instance.get_release_status(req)
+        final_status = await run_blocking(api_instance.get_release_status, req)
         if getattr(final_status, 'stable_revision_number', None) is not None:
             result["stable_revision_number"] = final_status.stable_revision_number
         if getattr(final_status, 'new_revision_number', None) is not None:
@@ -364,7 +371,7 @@ def release_function(function_id: str, region: Optional[str] = None, skip_depend
 
     # Get access link
     try:
-        access_link = get_function_access_link(function_id, region)
+        access_link = await run_blocking(get_function_access_link, function_id, region)
         if access_link:
             result["access_link"] = access_link
     except Exception:
@@ -399,11 +406,11 @@ def poll_function_release_status(function_id: str, region: Optional[str] = None)
     )
     start_time = time.time()
     timeout: int = 120
-    interval: int = 5
+    interval = AdaptivePollInterval(5)
     while time.time() - start_time < timeout:
         response = api_instance.get_release_status(req)
         if response.status == "inprogress":
-            time.sleep(interval)
+            time.sleep(interval.next(response.status))
         else:
             break
 
@@ -616,28 +623,35 @@ def upload_code(function_id: str, region: Optional[str] = None, local_folder_pat
         raise ValueError(f"Authorization failed: {str(e)}")
 
     if local_folder_path:
-        data, size, error = zip_and_encode_folder(local_folder_path)
-        if error:
-            raise ValueError(f"Error zipping folder: {error}")
-        if not data or size == 0:
-            raise ValueError("Zipped folder is empty, nothing to upload")
+        upload_info = upload_folder_for_function(
+            api_instance=api_instance,
+            function_id=function_id,
+            folder_path=local_folder_path,
+            ak=ak,
+            sk=sk,
+            token=token,
+            region=region,
+        )
+        response_body = upload_info["callback"]
+        code_uploaded = upload_info["uploaded"]
+        skip_reason = upload_info.get("skip_reason")
     elif file_dict:
-        data = build_zip_bytes_for_file_dict(file_dict)
-        size = len(data)
-        if not data:
-            raise ValueError("No files provided in file_dict, upload aborted.")
+        zip_file, size = build_zip_file_for_file_dict(file_dict)
+        with zip_file:
+            response_body = upload_code_zip_for_function(
+                api_instance=api_instance,
+                function_id=function_id,
+                code_zip_size=size,
+                zip_bytes=zip_file,
+                ak=ak,
+                sk=sk,
+                token=token,
+                region=region,
+            )
+        code_uploaded = True
+        skip_reason = None
     else:
         raise ValueError("Either local_folder_path or file_dict must be provided.")
-    response_body = upload_code_zip_for_function(
-        api_instance=api_instance,
-        function_id=function_id,
-        code_zip_size=size,
-        zip_bytes=data,
-        ak=ak,
-        sk=sk,
-        token=token,
-        region=region,
-    )
 
     dep_info = handle_dependency(
         api_instance=api_instance,
@@ -651,9 +665,12 @@ def upload_code(function_id: str, region: Optional[str] = None, local_folder_pat
     )
 
     result = {
+        "code_uploaded": code_uploaded,
         "code_upload_callback": response_body,
         "dependency": dep_info,
     }
+    if not code_uploaded:
+        result["upload_skipped_reason"] = skip_reason
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -742,7 +759,7 @@ def poll_dependency_install_task_status(
     now = datetime.datetime.utcnow()
 
     timeout_seconds = 120
-    poll_interval_seconds = 5
+    poll_interval = AdaptivePollInterval(5)
     start_time = time.time()
     while time.time() - start_time < timeout_seconds:
         try:
@@ -756,7 +773,7 @@ def poll_dependency_install_task_status(
             status = None
 
         if status == "InProgress" or status == None:
-            time.sleep(poll_interval_seconds)
+            time.sleep(poll_interval.next(status))
             continue
         else:
             break
@@ -788,8 +805,10 @@ def upload_code_zip_for_function(api_instance: VEFAASApi(object), function_id: s
     response = api_instance.get_code_upload_address(req)
     upload_url = response.upload_address
 
+    # zip_bytes may be an open file, which requests streams instead of reading it into memory
     headers = {
         "Content-Type": "application/zip",
+        "Content-Length": str(code_zip_size),
     }
 
     response = requests.put(url=upload_url, data=zip_bytes, headers=headers)  # noqa: security
@@ -816,16 +835,87 @@ def upload_code_zip_for_function(api_instance: VEFAASApi(object), function_id: s
         raise ValueError(error_message)
 
 
-def build_zip_bytes_for_file_dict(file_dict):
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+def get_function_code_fingerprint(api_instance: VEFAASApi, function_id: str) -> Optional[str]:
+    """Identify the code a function currently runs (None if it cannot be determined)."""
+    try:
+        response = api_instance.get_function(volcenginesdkvefaas.GetFunctionRequest(id=function_id))
+    except Exception as e:
+        logger.debug("Failed to get function code fingerprint: %s", str(e))
+        return None
+    if not response.source:
+        return None
+    return json.dumps([response.source_type, response.source, response.code_size])
+
+
+def upload_folder_for_function(api_instance: VEFAASApi, function_id: str, folder_path: str,
+                               ak: str, sk: str, token: str, region: str) -> dict:
+    """
+    Package folder incrementally (.vefaasignore only) and upload it to the function.
+
+    The upload is skipped when this exact package was the last one uploaded to the function
+    and the function's code has not been replaced since.
+    """
+    upload_cache = UploadCache(folder_path, include_gitignore=False)
+    try:
+        package = upload_cache.package()
+    except Exception as e:
+        raise ValueError(f"Error zipping folder: {e}")
+    try:
+        if package.reused_entries + package.compressed_entries == 0:
+            raise ValueError("Zipped folder is empty, nothing to upload")
+
+        upload_target = f"{region}/{function_id}"
+        uploaded_fingerprint = upload_cache.uploaded_source(upload_target, package.digest)
+        if uploaded_fingerprint and get_function_code_fingerprint(api_instance, function_id) == uploaded_fingerprint:
+            logger.info("Code unchanged since last upload to %s, skipping upload", function_id)
+            return {"uploaded": False, "size": package.size, "callback": None,
+                    "skip_reason": "Code unchanged since the last upload to this function"}
+
+        # Stream the archive from disk
+        with open(package.path, "rb") as zip_file:
+            response_body = upload_code_zip_for_function(
+                api_instance=api_instance,
+                function_id=function_id,
+                code_zip_size=package.size,
+                zip_bytes=zip_file,
+                ak=ak,
+                sk=sk,
+                token=token,
+                region=region,
+            )
+    finally:
+        package.discard()
+    upload_cache.record_upload(upload_target, package.digest, get_function_code_fingerprint(api_instance, function_id))
+    return {"uploaded": True, "size": package.size, "callback": response_body}
+
+
+def build_zip_file_for_file_dict(file_dict) -> Tuple[tempfile.SpooledTemporaryFile, int]:
+    """Zip file_dict into a spooled temp file (spills to disk when large); returns (file, size)."""
+    if not file_dict:
+        raise ValueError("No files provided in file_dict, upload aborted.")
+
+    def entries():
+        date_time = datetime.datetime.now().timetuple()[:6]
         for filename, content in file_dict.items():
-            info = zipfile.ZipInfo(filename)
-            info.date_time = datetime.datetime.now().timetuple()[:6]
+            info = zipfile.ZipInfo(filename, date_time=date_time)
             info.external_attr = 0o755 << 16
-            zip_file.writestr(info, content)
-    zip_bytes = zip_buffer.getvalue()
-    return zip_bytes
+            yield ArchiveEntry(info, data=content.encode("utf-8") if isinstance(content, str) else content)
+
+    zip_file = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_MEMORY)
+    try:
+        write_archive(entries(), zip_file)
+        size = zip_file.tell()
+        zip_file.seek(0)
+    except BaseException:
+        zip_file.close()
+        raise
+    return zip_file, size
+
+
+def build_zip_bytes_for_file_dict(file_dict):
+    zip_file, _ = build_zip_file_for_file_dict(file_dict)
+    with zip_file:
+        return zip_file.read()
 
 # Get function revision information from veFaaS.
 # Use this to retrieve revision information for a veFaaS function. This function returns the revision details
@@ -1177,7 +1267,7 @@ Returns:
 - If deployment fails, fix the code and call `deploy_application` again.
 - Do NOT use `create_function`, `update_function`, `upload_code`, or `release_function` as workarounds.
 """)
-def deploy_application(
+async def deploy_application(
     project_path: str,
     name: Optional[str] = None,
     application_id: Optional[str] = None,
@@ -1191,7 +1281,7 @@ def deploy_application(
     from .vefaas_cli_sdk import (
         DeployConfig,
         VeFaaSClient,
-        deploy_application as sdk_deploy_application,
+        deploy_application_async as sdk_deploy_application,
     )
 
     region = validate_and_set_region(region)
@@ -1217,8 +1307,14 @@ def deploy_application(
         skip_build=skip_build,
     )
 
-    # Call SDK deploy_application (only needs client!)
-    result = sdk_deploy_application(config, client)
+    ctx = mcp.get_context()
+
+    async def report_progress(progress: float, total: float, message: str):
+        # Progress notifications are only sent when the client passed a progress token
+        await ctx.report_progress(progress, total, message)
+
+    # Call SDK deploy pipeline (only needs client!); other requests keep being served meanwhile
+    result = await sdk_deploy_application(config, client, progress=report_progress)
 
     if not result.success:
         # Build a clean, readable error message
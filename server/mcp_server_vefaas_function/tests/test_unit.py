@@ -1,18 +1,29 @@
+import asyncio
+import json
 import os
 import shutil
 import tempfile
+import threading
+import time
 import unittest
 import zipfile
 from io import BytesIO
+from unittest.mock import patch
 
-from mcp_server_vefaas_function.vefaas_server import zip_and_encode_folder
+from mcp_server_vefaas_function.vefaas_server import zip_and_encode_folder, build_zip_bytes_for_file_dict
 from mcp_server_vefaas_function.vefaas_cli_sdk.deploy import (
     package_directory,
     read_gitignore_patterns,
     read_vefaasignore_patterns,
     create_ignore_filter,
     DEFAULT_VEFAASIGNORE,
+    AdaptivePollInterval,
+    DeployConfig,
+    deploy_application,
+    deploy_application_async,
 )
+from mcp_server_vefaas_function.vefaas_cli_sdk.packaging import ArchiveEntry, write_archive
+from mcp_server_vefaas_function.vefaas_cli_sdk.upload_cache import UploadCache
 
 
 class TestPackageDirectory(unittest.TestCase):
@@ -127,6 +138,394 @@ class TestPackageDirectory(unittest.TestCase):
         self.assertFalse(spec.match_file("main.py"))
 
 
+class TestPackagingEngine(unittest.TestCase):
+    """Test the parallel, disk-spooled archive writer - no network credentials required"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.contents = {
+            "empty.txt": b"",
+            "small.py": b"print('hello')\n",
+            # Larger than the read chunk and the in-memory spool, so it is streamed and spilled to disk
+            "large.bin": os.urandom(512 * 1024) + b"a" * (2 * 1024 * 1024),
+        }
+        for index in range(20):
+            self.contents[f"pkg/module_{index}.py"] = f"VALUE = {index}\n".encode() * (index * 50)
+        for name, content in self.contents.items():
+            path = os.path.join(self.temp_dir, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(content)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _entries(self):
+        for name in self.contents:
+            info = zipfile.ZipInfo(name)
+            yield ArchiveEntry(info, path=os.path.join(self.temp_dir, name))
+
+    def test_matches_zipfile_output(self):
+        """Test that parallel compression produces the same bytes as ZipFile.writestr"""
+        expected = BytesIO()
+        with zipfile.ZipFile(expected, "w") as zipf:
+            for name, content in self.contents.items():
+                info = zipfile.ZipInfo(name)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                zipf.writestr(info, content)
+
+        output = BytesIO()
+        digests = write_archive(self._entries(), output, max_workers=4)
+
+        self.assertEqual(output.getvalue(), expected.getvalue())
+        self.assertEqual(len(digests), len(self.contents))
+
+    def test_reused_entries_are_copied_compressed(self):
+        """Test that entries copied from a previous archive extract to the same content"""
+        previous = BytesIO()
+        write_archive(self._entries(), previous, max_workers=2)
+        with zipfile.ZipFile(previous) as zipf:
+            previous_entries = {info.filename: info for info in zipf.infolist()}
+
+        output = BytesIO()
+        entries = [ArchiveEntry(zipfile.ZipInfo("large.bin"), reuse_from=previous_entries["large.bin"]),
+                   ArchiveEntry(zipfile.ZipInfo("new.txt"), data=b"new")]
+        digests = write_archive(entries, output, reuse_archive=previous, max_workers=2)
+
+        self.assertEqual(list(digests), ["new.txt"])
+        with zipfile.ZipFile(output) as zipf:
+            self.assertIsNone(zipf.testzip())
+            self.assertEqual(zipf.read("large.bin"), self.contents["large.bin"])
+            self.assertEqual(zipf.read("new.txt"), b"new")
+
+    def test_missing_file_fails(self):
+        """Test that a compression error is raised to the caller"""
+        entries = [ArchiveEntry(zipfile.ZipInfo("missing.txt"), path=os.path.join(self.temp_dir, "missing.txt"))]
+        with self.assertRaises(FileNotFoundError):
+            write_archive(entries, BytesIO())
+
+    def test_build_zip_bytes_for_file_dict(self):
+        """Test zipping an in-memory file dict"""
+        zip_bytes = build_zip_bytes_for_file_dict({"main.py": "print('hi')", "data.bin": b"\x00\x01"})
+
+        with zipfile.ZipFile(BytesIO(zip_bytes)) as zipf:
+            self.assertEqual(zipf.read("main.py"), b"print('hi')")
+            self.assertEqual(zipf.read("data.bin"), b"\x00\x01")
+            self.assertEqual(zipf.getinfo("main.py").external_attr >> 16, 0o755)
+
+
+class TestUploadCache(unittest.TestCase):
+    """Test incremental packaging and upload records - no network credentials required"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.temp_dir, "pkg"))
+        self.files = {
+            "main.py": "print('hello')",
+            "pkg/util.py": "VALUE = 1\n" * 100,
+            "README.md": "docs",
+            ".vefaasignore": DEFAULT_VEFAASIGNORE,
+        }
+        for name, content in self.files.items():
+            self._write(name, content)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name, content, age_seconds=60):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "w") as f:
+            f.write(content)
+        # Files modified right before a scan are always re-hashed, so age them
+        past = time.time() - age_seconds
+        os.utime(path, (past, past))
+
+    def _read_zip(self, zip_bytes):
+        with zipfile.ZipFile(BytesIO(zip_bytes)) as zipf:
+            return {name: zipf.read(name).decode() for name in zipf.namelist()}
+
+    def test_first_package_matches_package_directory(self):
+        """Test that the incremental package has the same bytes as package_directory"""
+        result = UploadCache(self.temp_dir).package()
+
+        self.assertFalse(result.unchanged)
+        self.assertEqual(result.compressed_entries, 4)
+        self.assertEqual(result.read_bytes(), package_directory(self.temp_dir))
+        self.assertTrue(os.path.exists(os.path.join(UploadCache(self.temp_dir).cache_dir, "manifest.json")))
+
+    def test_unchanged_directory_reuses_archive(self):
+        """Test that an unchanged directory is not packaged again"""
+        first = UploadCache(self.temp_dir).package()
+        second = UploadCache(self.temp_dir).package()
+
+        self.assertTrue(second.unchanged)
+        self.assertEqual(second.compressed_entries, 0)
+        self.assertEqual(second.digest, first.digest)
+        self.assertEqual(second.read_bytes(), first.read_bytes())
+
+    def test_changed_file_reuses_other_entries(self):
+        """Test that only the changed file is compressed again"""
+        UploadCache(self.temp_dir).package()
+        self._write("main.py", "print('changed')", age_seconds=0)
+
+        result = UploadCache(self.temp_dir).package()
+
+        self.assertFalse(result.unchanged)
+        self.assertEqual(result.compressed_entries, 1)
+        self.assertEqual(result.reused_entries, 3)
+        self.assertEqual(result.read_bytes(), package_directory(self.temp_dir))
+        self.assertEqual(self._read_zip(result.read_bytes())["main.py"], "print('changed')")
+
+    def test_touched_file_with_same_content_keeps_digest(self):
+        """Test that rewriting a file with identical content produces the same archive"""
+        first = UploadCache(self.temp_dir).package()
+        self._write("pkg/util.py", self.files["pkg/util.py"], age_seconds=0)
+
+        result = UploadCache(self.temp_dir).package()
+
+        self.assertEqual(result.compressed_entries, 0)
+        self.assertEqual(result.digest, first.digest)
+
+    def test_added_and_removed_files(self):
+        """Test that added and removed files are reflected in the package"""
+        UploadCache(self.temp_dir).package()
+        os.remove(os.path.join(self.temp_dir, "README.md"))
+        self._write("new.txt", "new")
+
+        contents = self._read_zip(UploadCache(self.temp_dir).package().read_bytes())
+
+        self.assertNotIn("README.md", contents)
+        self.assertEqual(contents["new.txt"], "new")
+
+    def test_cache_is_never_packaged(self):
+        """Test that the cache directory is excluded even without the default .vefaasignore"""
+        with open(os.path.join(self.temp_dir, ".vefaasignore"), "w") as f:
+            f.write("*.log\n")
+        UploadCache(self.temp_dir).package()
+        self._write("main.py", "print('changed')", age_seconds=0)
+
+        names = self._read_zip(UploadCache(self.temp_dir).package().read_bytes())
+
+        self.assertFalse([name for name in names if "upload-cache" in name])
+
+    def test_upload_records_are_per_digest_and_persisted(self):
+        """Test that an upload is only reported for the digest that was uploaded"""
+        cache = UploadCache(self.temp_dir)
+        result = cache.package()
+        cache.record_upload("cn-beijing/fn-1", result.digest, "tos://bucket/code.zip")
+
+        reloaded = UploadCache(self.temp_dir)
+        self.assertEqual(reloaded.uploaded_source("cn-beijing/fn-1", result.digest), "tos://bucket/code.zip")
+        self.assertIsNone(reloaded.uploaded_source("cn-beijing/fn-1", "other-digest"))
+        self.assertIsNone(reloaded.uploaded_source("cn-beijing/fn-2", result.digest))
+
+        reloaded.record_upload("cn-beijing/fn-1", result.digest, None)
+        self.assertIsNone(UploadCache(self.temp_dir).uploaded_source("cn-beijing/fn-1", result.digest))
+
+    def test_package_is_not_replaced_by_a_later_package(self):
+        """Test that repackaging while a package is being uploaded leaves that package intact"""
+        first = UploadCache(self.temp_dir).package()
+        first_bytes = first.read_bytes()
+        self._write("main.py", "print('changed')", age_seconds=0)
+
+        second = UploadCache(self.temp_dir).package()
+
+        self.assertNotEqual(second.digest, first.digest)
+        self.assertEqual(first.read_bytes(), first_bytes)
+        for result in (first, second):
+            result.discard()
+            self.assertFalse(os.path.exists(result.path))
+        self.assertEqual(UploadCache(self.temp_dir).package().digest, second.digest)
+
+    def test_concurrent_upload_records_are_kept(self):
+        """Test that deploys recording uploads at the same time do not drop each other's records"""
+        digest = UploadCache(self.temp_dir).package().digest
+        caches = [UploadCache(self.temp_dir) for _ in range(8)]
+
+        threads = [
+            threading.Thread(target=cache.record_upload, args=(f"cn-beijing/fn-{i}", digest, f"tos://b/{i}.zip"))
+            for i, cache in enumerate(caches)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        reloaded = UploadCache(self.temp_dir)
+        for i in range(8):
+            self.assertEqual(reloaded.uploaded_source(f"cn-beijing/fn-{i}", digest), f"tos://b/{i}.zip")
+
+
+class _FakeDeployClient:
+    """Records calls and answers with finished statuses - no network"""
+
+    def __init__(self, gateway="gw-1", release_delay=0.0, function_id=None, function_source=None):
+        self.region = "cn-beijing"
+        self.gateway = gateway
+        self.release_delay = release_delay
+        self.function_id = function_id
+        self.function_source = function_source
+        self.calls = []
+        self.updates = []
+        self.deploy_polls = 0
+
+    def find_application_by_name(self, name):
+        self.calls.append("find_application_by_name")
+        return None
+
+    def get_usable_gateway(self):
+        self.calls.append("get_usable_gateway")
+        return self.gateway
+
+    def upload_file_to_tos(self, path):
+        self.calls.append("upload_file_to_tos")
+        return "tos://bucket/code.zip"
+
+    def create_function(self, **kwargs):
+        self.calls.append("create_function")
+        return {"Result": {"Id": "fn-1", "Name": kwargs["name"]}}
+
+    def update_function(self, **kwargs):
+        self.calls.append("update_function")
+        self.updates.append(kwargs)
+        return {"Result": {"Id": kwargs["function_id"]}}
+
+    def get_function_source(self, function_id):
+        self.calls.append("get_function_source")
+        return self.function_source
+
+    def create_dependency_install_task(self, function_id):
+        self.calls.append("create_dependency_install_task")
+
+    def get_dependency_install_status(self, function_id):
+        return {"Result": {"Status": "Succeeded"}}
+
+    def create_application(self, name, function_id, gateway_name):
+        self.calls.append("create_application")
+        return {"Result": {"Id": "app-1"}}
+
+    def release_application(self, application_id):
+        self.calls.append("release_application")
+        self.deploy_polls = 0
+
+    def get_application(self, application_id):
+        # Deploying on the first poll after a release, finished otherwise
+        self.deploy_polls += 1
+        released = "release_application" in self.calls
+        status = "deploying" if released and self.deploy_polls == 1 else "deploy_success"
+        cloud_resource = json.dumps({"framework": {"function_id": self.function_id}}) if self.function_id else ""
+        return {"Result": {"Status": status, "CloudResource": cloud_resource}}
+
+
+class TestAsyncDeploy(unittest.TestCase):
+    """Async deploy pipeline against a fake client"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.temp_dir, "requirements.txt"), "w") as f:
+            f.write("fastapi\nuvicorn\n")
+        with open(os.path.join(self.temp_dir, "app.py"), "w") as f:
+            f.write("from fastapi import FastAPI\napp = FastAPI()\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _deploy(self, client):
+        config = DeployConfig(project_path=self.temp_dir, name="demo-app")
+        progress = []
+
+        async def report(value, total, message):
+            progress.append((value, total, message))
+
+        result = asyncio.run(deploy_application_async(config, client, progress=report))
+        return result, progress
+
+    def test_adaptive_poll_interval(self):
+        interval = AdaptivePollInterval(5, initial=1, factor=2)
+        self.assertEqual([interval.next("a") for _ in range(5)], [1, 2, 4, 5, 5])
+        # A status change polls quickly again
+        self.assertEqual(interval.next("b"), 1)
+
+    def test_deploys_new_application(self):
+        client = _FakeDeployClient()
+        result, progress = self._deploy(client)
+
+        self.assertTrue(result.success, result.error)
+        self.assertEqual((result.function_id, result.application_id), ("fn-1", "app-1"))
+        self.assertLess(client.calls.index("create_function"), client.calls.index("create_application"))
+        self.assertLess(client.calls.index("create_application"), client.calls.index("release_application"))
+        self.assertIn("[7/7] Creating and deploying application...", result.logs)
+
+        # Progress notifications strictly increase and end at the total
+        values = [value for value, _, _ in progress]
+        self.assertEqual(values, sorted(set(values)))
+        self.assertEqual(progress[-1][:2], (7, 7))
+        self.assertTrue(any(message.startswith("Application status") for _, _, message in progress))
+
+    def test_missing_gateway_fails_before_creating_function(self):
+        client = _FakeDeployClient(gateway=None)
+        result, _ = self._deploy(client)
+
+        self.assertFalse(result.success)
+        self.assertIn("No available API gateway", result.error)
+        self.assertNotIn("create_function", client.calls)
+
+    def test_update_skips_upload_of_unchanged_package(self):
+        cache = UploadCache(self.temp_dir, include_gitignore=True)
+        package = cache.package()
+        package.discard()
+        cache.record_upload("cn-beijing/fn-1", package.digest, "tos://bucket/previous.zip")
+        client = _FakeDeployClient(function_id="fn-1", function_source="tos://bucket/previous.zip")
+
+        config = DeployConfig(project_path=self.temp_dir, application_id="app-1")
+        result = asyncio.run(deploy_application_async(config, client))
+
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(result.function_id, "fn-1")
+        self.assertNotIn("upload_file_to_tos", client.calls)
+        self.assertIn("  → Upload skipped: function already uses this package", result.logs)
+        self.assertEqual(client.updates[0]["source"], None)
+        self.assertIn("release_application", client.calls)
+
+    def test_update_uploads_when_function_code_was_replaced(self):
+        cache = UploadCache(self.temp_dir, include_gitignore=True)
+        package = cache.package()
+        package.discard()
+        cache.record_upload("cn-beijing/fn-1", package.digest, "tos://bucket/previous.zip")
+        client = _FakeDeployClient(function_id="fn-1", function_source="tos://bucket/other.zip")
+
+        config = DeployConfig(project_path=self.temp_dir, application_id="app-1")
+        result = asyncio.run(deploy_application_async(config, client))
+
+        self.assertTrue(result.success, result.error)
+        self.assertIn("upload_file_to_tos", client.calls)
+        self.assertEqual(client.updates[0]["source"], "tos://bucket/code.zip")
+
+    def test_concurrent_deploys(self):
+        async def deploy_all():
+            dirs = [tempfile.mkdtemp() for _ in range(3)]
+            try:
+                for d in dirs:
+                    shutil.copytree(self.temp_dir, d, dirs_exist_ok=True)
+                clients = [_FakeDeployClient() for _ in dirs]
+                results = await asyncio.gather(*(
+                    deploy_application_async(DeployConfig(project_path=d, name=f"app-{i}"), c)
+                    for i, (d, c) in enumerate(zip(dirs, clients))
+                ))
+            finally:
+                for d in dirs:
+                    shutil.rmtree(d)
+            return results
+
+        results = asyncio.run(deploy_all())
+        self.assertTrue(all(result.success for result in results))
+
+    def test_sync_wrapper(self):
+        config = DeployConfig(project_path=self.temp_dir, name="demo-app")
+        result = deploy_application(config, _FakeDeployClient())
+        self.assertTrue(result.success, result.error)
+
+
 class TestCaddyfileGeneration(unittest.TestCase):
     """Test cases for Caddyfile generation functionality"""
 
@@ -207,6 +606,9 @@ class TestDetector(unittest.TestCase):
     """Test cases for project detector"""
 
     def setUp(self):
+        from mcp_server_vefaas_function.vefaas_cli_sdk.detector import clear_detection_cache
+
+        clear_detection_cache()
         self.temp_dir = tempfile.mkdtemp()
 
     def tearDown(self):
@@ -266,6 +668,57 @@ class TestDetector(unittest.TestCase):
         self.assertEqual(result.runtime, "native-python3.12/v1")
         self.assertFalse(result.is_static)
 
+    def _write_aged(self, name, content):
+        """Write a file and age it (and the project dir) past the detection cache's racy window"""
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "w") as f:
+            f.write(content)
+        old = time.time() - 10
+        os.utime(path, (old, old))
+        os.utime(self.temp_dir, (old, old))
+
+    def test_detection_is_cached_until_inspected_files_change(self):
+        """Test that unchanged projects reuse the cached result and edits invalidate it"""
+        from mcp_server_vefaas_function.vefaas_cli_sdk import detector
+
+        self._write_aged("requirements.txt", "fastapi\nuvicorn\n")
+        self._write_aged("app.py", "from fastapi import FastAPI\napp = FastAPI()\n")
+
+        with patch.object(detector, "_detect", wraps=detector._detect) as detect:
+            first = detector.auto_detect(self.temp_dir)
+            second = detector.auto_detect(self.temp_dir)
+            self.assertEqual(detect.call_count, 1)
+            self.assertEqual(first, second)
+            self.assertIsNot(first, second)
+
+            # Editing an inspected file re-runs detection
+            self._write_aged("requirements.txt", "flask\ngunicorn\n")
+            self.assertEqual(detector.auto_detect(self.temp_dir).framework, "flask")
+            self.assertEqual(detect.call_count, 2)
+
+            # So does adding a file to the project root
+            with open(os.path.join(self.temp_dir, "package.json"), "w") as f:
+                f.write('{"dependencies": {"express": "^4.0.0"}}')
+            self.assertEqual(detector.auto_detect(self.temp_dir).framework, "express")
+            self.assertEqual(detect.call_count, 3)
+
+            # Files changed within the racy window are not cached
+            detector.auto_detect(self.temp_dir)
+            self.assertEqual(detect.call_count, 4)
+
+    def test_built_output_is_detected(self):
+        """Test that nested paths like dist/index.html are found through the shared index"""
+        from mcp_server_vefaas_function.vefaas_cli_sdk.detector import auto_detect
+
+        os.makedirs(os.path.join(self.temp_dir, "dist"))
+        with open(os.path.join(self.temp_dir, "dist", "index.html"), "w") as f:
+            f.write("<html></html>")
+
+        result = auto_detect(self.temp_dir)
+
+        self.assertTrue(result.is_static)
+        self.assertEqual(result.output_path, "dist")
+
 
 class TestConfig(unittest.TestCase):
     """Test cases for configuration reading/writing"""